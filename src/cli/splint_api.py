@@ -6,17 +6,30 @@ It also doesn't have support for environment variables at this time.
 """
 
 import re
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Query
 from starlette.responses import FileResponse
 
 import splint.splint_checker
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Serve requests, then tear down the env values when the server stops."""
+    yield
+    close_splint()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Globally define checker module
 __splint_checker: splint.splint_checker.SplintChecker | None = None
 
+# The rules as prepared when the checker was set and their attribute index. Requests select
+# rules from the index rather than preparing and scanning every rule on every request.
+__splint_index: splint.splint_index.SplintFunctionIndex | None = None
+
 
 def set_splint_checker(chk: splint.splint_checker.SplintChecker) -> None:
     """At this time we only handle one module at a time."""
@@ -28,8 +41,23 @@ def set_splint_checker(chk: splint.splint_checker.SplintChecker) -> None:
 
 def prepare_splint():
     """Recalculate the initial conditions for splint"""
+    global __splint_index
+
     __splint_checker.pre_collect()
     __splint_checker.prepare()
+    __splint_index = __splint_checker.index
+
+
+def close_splint():
+    """Tear down the session and module scoped env values (database connections...)."""
+    if __splint_checker is None:
+        return
+    try:
+        __splint_checker.close()
+    finally:
+        modules = __splint_checker.modules + [m for pkg in __splint_checker.packages for m in pkg.modules]
+        for module in modules:
+            module.close()
 
 
 def checker_ok():
@@ -64,10 +92,9 @@ async def get_result_header():
 
 
 def prep_rules():
-    """Reload all the rules to makesure we are in a good state. """
+    """Restore the full set of prepared rules, a previous request may have run a subset."""
     checker_ok()
-    __splint_checker.pre_collect()
-    __splint_checker.prepare()
+    __splint_checker.collected = __splint_index.functions
 
 
 def run_matched(matched_funcs, var) -> dict:
@@ -88,7 +115,7 @@ def run_matched(matched_funcs, var) -> dict:
 @app.get("/splint/all")
 async def check_all() -> dict:
     """Run the whole splint ruleset (careful with timeouts)"""
-    checker_ok()
+    prep_rules()
 
     __splint_checker.run_all()
     return __splint_checker.as_dict()
@@ -110,7 +137,7 @@ async def check_rule_id_regular_expression(rule_id: str):
     print(response.json())
     """
     prep_rules()
-    matched_funcs = [func for func in __splint_checker.collected if re.match(rule_id, func.ruid)]
+    matched_funcs = [func for func in __splint_index.functions if re.match(rule_id, func.ruid)]
     return run_matched(matched_funcs, f"{rule_id=}")
 
 
@@ -131,7 +158,7 @@ async def check_rule_ids(rule_ids: str) -> dict:
     """
     prep_rules()
     rule_ids = [rule_id.strip() for rule_id in rule_ids.replace(",", " ").split()]
-    matched_funcs = [func for func in __splint_checker.collected if func.ruid in rule_ids]
+    matched_funcs = __splint_index.select(ruids=rule_ids)
     return run_matched(matched_funcs, f"{rule_ids=}")
 
 
@@ -158,7 +185,7 @@ async def check_tags(tags: str) -> dict:
     """
     prep_rules()
     tags = [tag.strip() for tag in tags.replace(",", " ").split()]
-    matched_funcs = [func for func in __splint_checker.collected if func.tag in tags]
+    matched_funcs = __splint_index.select(tags=tags)
     return run_matched(matched_funcs, f"{tags=}")
 
 
@@ -193,9 +220,8 @@ async def check_level_range(
         print(response.json())
     """
 
-    low, high = low or -1000000, high or 1000000
     prep_rules()
-    matched_funcs = [func for func in __splint_checker.collected if low <= func.level <= high]
+    matched_funcs = __splint_index.level_range(low, high)
     return run_matched(matched_funcs, f"{low=} {high=}")
 
 
@@ -214,7 +240,7 @@ async def check_phase(phases: str) -> dict:
     """
     prep_rules()
     phases = [phase.strip() for phase in phases.replace(" ", "").split(",")]
-    matched_funcs = [func for func in __splint_checker.collected if func.phase in phases]
+    matched_funcs = __splint_index.select(phases=phases)
     return run_matched(matched_funcs, f"{phases=}")
 
 
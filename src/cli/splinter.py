@@ -46,11 +46,49 @@ def pretty_print_json(json_obj):
     return pretty_json
 
 
+def echo_results(results):
+    """Echo each result as it goes by, the streaming version of dump_results."""
+    for result in results:
+        typer.echo(result)
+        yield result
+
+
+def stream_checks(ch, json_file: str, flat: bool, score: bool, verbose: bool):
+    """
+    Run the checks writing each result to json_file as it is produced.
+
+    Results aren't kept in memory (so a crashed run still leaves its output and huge runs
+    don't run out of memory), the overview, hierarchy and score are built as results arrive.
+    """
+    grouper = splint.SplintResultGrouper(['pkg_name', 'module_name', 'func_name'])
+    results = grouper.tee(ch.yield_all())
+    if flat and verbose:
+        results = echo_results(results)
+    with splint.make_sink(json_file) as sink:
+        sink.write_all(results)
+
+    if grouper.root.counts['total'] == 0:
+        typer.echo('There were no results.')
+        return
+
+    if not flat:
+        # Counts and scores for each package, module and function.
+        typer.echo(pretty_print_json(grouper.summary()))
+        return
+
+    if not verbose:
+        typer.echo(grouper.root.overview())
+
+    if score:
+        typer.echo(f'Score: {grouper.root.score:.1f}')
+
+
 @app.command()
 def run_checks(
         module: str = typer.Option(None, '-m', '--mod', help='The module to run rules against.'),
         pkg: str = typer.Option(None, '--pkg', help='The package to run rules against.'),
-        json_file: str = typer.Option(None, '-j', '--json', help='The JSON file to write results to.'),
+        json_file: str = typer.Option(None, '-j', '--json',
+                                      help='The JSON lines file to write results to (.gz to compress, .parquet for Parquet).'),
         flat: bool = typer.Option(False, '-f', '--flat', help='Should the output be flat or a hierarchy.'),
         score: bool = typer.Option(False, '-s', '--score', help='Print the score of the rules.'),
         api: bool = typer.Option(False, '-a', '--api', help='Start FastAPI.'),
@@ -82,6 +120,9 @@ def run_checks(
                 splint_api.set_splint_checker(ch)
                 uvicorn.run(splint_api.app, host='localhost', port=port)
                 return
+            elif json_file:
+                stream_checks(ch, json_file, flat, score, verbose)
+                return
             else:
                 results = ch.run_all()
         else:
@@ -108,11 +149,6 @@ def run_checks(
             test_score = splint.ScoreByResult()
             typer.echo(f'Score: {test_score(results):.1f}')
 
-        if json_file:
-            d = splint.splint_result.results_as_dict(results)
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(d, f, indent=2)
-
     except splint.SplintException as e:
         typer.echo(f'SplintException: {e}')
 
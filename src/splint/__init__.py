@@ -1,14 +1,20 @@
 """
 Public API for the Splint project.
 """
+import importlib
 
 from .rule_files import rule_large_files  # noqa: F401
 from .rule_files import rule_max_files  # noqa: F401
 from .rule_files import rule_path_exists  # noqa: F401
 from .rule_files import rule_stale_files  # noqa: F401
 from .splint_attribute import attributes  # noqa: F401
+from .splint_attribute import env  # noqa: F401
 from .splint_attribute import get_attribute  # noqa: F401
 # from .splint_attribute import _convert_to_minutes # noqa:F401
+from .splint_cache import SplintCache  # noqa: F401
+from .splint_cache import SplintFileCache  # noqa: F401
+from .splint_cache import SplintMemoryCache  # noqa: F401
+from .splint_cache import SplintSqliteCache  # noqa: F401
 from .splint_checker import SplintChecker  # noqa: F401
 from .splint_checker import SplintDebugProgress  # noqa; F401
 from .splint_checker import SplintNoProgress  # noqa; F401
@@ -21,6 +27,7 @@ from .splint_checker import keep_levels  # noqa: F401
 from .splint_checker import keep_phases  # noqa: F401
 from .splint_checker import keep_ruids  # noqa: F401
 from .splint_checker import keep_tags  # noqa: F401
+from .splint_env import SplintEnvStore  # noqa: F401
 from .splint_exception import SplintException  # noqa: F401
 from .splint_format import SplintBasicHTMLRenderer
 from .splint_format import SplintBasicMarkdown
@@ -30,20 +37,31 @@ from .splint_format import SplintMarkup
 from .splint_format import SplintRenderText
 from .splint_format import SM
 
+from .splint_fingerprint import fingerprint  # noqa: F401
+from .splint_fingerprint import register_fingerprint  # noqa: F401
+from .splint_fingerprint import unregister_fingerprint  # noqa: F401
+
 # from .splint_exception import SplintTypeError  # noqa: F401
 # from .splint_exception import SplintValueError  # noqa: F401
 from .splint_function import SplintFunction  # noqa: F401
+from .splint_group import SplintGroupNode  # noqa: F401
+from .splint_group import SplintResultGrouper  # noqa: F401
 from .splint_immutable import SplintEnvDict  # noqa: F401
 from .splint_immutable import SplintEnvList  # noqa: F401
 from .splint_immutable import SplintEnvSet  # noqa: F401
 from .splint_jsonrc import SplintJsonRC  # noqa: F401
 from .splint_module import SplintModule  # noqa: F401
 from .splint_package import SplintPackage  # noqa: F401
+from .splint_progress import SplintBatchedProgress  # noqa: F401
+from .splint_progress import SplintProgressEvent  # noqa: F401
 from .splint_rc import SplintRC  # noqa: F401
 from .splint_rc_factory import splint_rc_factory  # noqa:F401
 from .splint_result import SR  # noqa: F401
+from .splint_result import SplintCompactResult  # noqa: F401
+from .splint_result import SplintFunctionInfo  # noqa: F401
 from .splint_result import SplintResult  # noqa: F401
 from .splint_result import SplintYield  # noqa: F401
+from .splint_result import group_by  # noqa: F401
 from .splint_result import overview  # noqa: F401
 from .splint_ruid import empty_ruids  # noqa: F401
 from .splint_ruid import module_ruids  # noqa: F401
@@ -56,56 +74,67 @@ from .splint_score import ScoreByFunctionBinary  # noqa: F401
 from .splint_score import ScoreByFunctionMean  # noqa: F401
 from .splint_score import ScoreByResult  # noqa: F401
 from .splint_score import ScoreStrategy  # noqa: F401
+from .splint_sink import SplintGzipJsonlSink  # noqa: F401
+from .splint_sink import SplintJsonlSink  # noqa: F401
+from .splint_sink import SplintParquetSink  # noqa: F401
+from .splint_sink import SplintResultSink  # noqa: F401
+from .splint_sink import make_sink  # noqa: F401
 from .splint_tomlrc import SplintTomlRC  # noqa: F401
 from .splint_util import any_to_int_list  # noqa: F401
 from .splint_util import any_to_str_list  # noqa: F401
 from .splint_util import str_to_bool  # noqa: F401
 
-# webapi using requests
-try:
-    import requests
-    from .rule_webapi import rule_url_200  # noqa: F401
-    from .rule_webapi import rule_web_api  # noqa: F401
-except ImportError:
-    pass
-
-# ping rules
-try:
-    import ping3
-    from .rule_ping import rule_ping_check  # noqa: F401
-except ImportError:
-    pass
+# Optional rule integrations are loaded on first use.  Importing them pulls in requests,
+# ping3, pandas, openpyxl, camelot (and OpenCV) and SQLAlchemy which can take seconds, and
+# most runs only need one or two of them.  Names whose optional dependencies aren't installed
+# raise AttributeError, just as if they weren't defined.
+_LAZY_IMPORTS = {
+    # webapi using requests
+    "rule_url_200": ".rule_webapi",
+    "rule_web_api": ".rule_webapi",
+    "rule_web_apis": ".rule_webapi",
+    "SplintHttpClient": ".rule_webapi",
+    "close_default_http_client": ".rule_webapi",
+    # ping rules
+    "rule_ping_check": ".rule_ping",
+    # dataframe rules
+    "rule_validate_df_schema": ".rule_dataframe",
+    "rule_validate_df_values_by_col": ".rule_dataframe",
+    "SplintEnvDataFrame": ".splint_immutable_df",
+    # xlsx rules
+    "rule_xlsx_a1_pass_fail": ".rule_xlsx",
+    "rule_xlsx_df_pass_fail": ".rule_xlsx",
+    # pdf rules
+    "extract_tables_from_pdf": ".rule_pdf",
+    "rule_from_pdf_rule_ids": ".rule_pdf",
+    "pdf_rule_index": ".rule_pdf",
+    "SplintPdfRuleIndex": ".rule_pdf",
+    "SplintPdfTableCache": ".rule_pdf",
+    "SplintPdfTables": ".rule_pdf",
+    # columnar results using numpy
+    "SplintResultTable": ".splint_result_table",
+    "score_table": ".splint_vector_score",
+    "score_table_by": ".splint_vector_score",
+    # sql alchemy support
+    "rule_sql_table_col_name_schema": ".rule_sqlachemy",
+    "rule_sql_table_schema": ".rule_sqlachemy",
+    "rule_sql_schema": ".rule_sqlachemy",
+    "SplintReflectionCache": ".rule_sqlachemy",
+}
 
-# dataframe rules
-try:
-    import pandas as pd  # noqa: F401
-    from .rule_dataframe import rule_validate_df_schema  # noqa: F401
-    from .rule_dataframe import rule_validate_df_values_by_col  # noqa: F401
-    from .splint_immutable import SplintEnvDataFrame  # noqa: F401
-except ImportError:
-    pass
 
-# xlsx rules
-try:
-    import openpyxl
-    from .rule_xlsx import rule_xlsx_a1_pass_fail
-    from .rule_xlsx import rule_xlsx_df_pass_fail
-except ImportError:
-    pass
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    except ImportError as error:
+        raise AttributeError(f"{__name__}.{name} requires an optional dependency: {error}") from error
+    value = getattr(module, name)
+    # Cache it so __getattr__ isn't called again
+    globals()[name] = value
+    return value
 
-# pdf rules
-try:
-    import camelot  # type: ignore
-    import pandas as pd  # pylint: disable=ungrouped-imports
-    from .rule_pdf import extract_tables_from_pdf  # noqa: F401
-    from .rule_pdf import rule_from_pdf_rule_ids  # noqa: F401
-except ImportError:
-    pass
 
-# sql alchemy support
-try:
-    import sqlalchemy
-    from .rule_sqlachemy import rule_sql_table_col_name_schema
-    from .rule_sqlachemy import rule_sql_table_schema
-except ImportError:
-    pass
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
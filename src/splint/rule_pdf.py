@@ -5,10 +5,36 @@ The main feature is to extract tables with the following headings.
 
 RuleId  Description Status
 
+Parsing a PDF with camelot is slow, and a package usually has one check per rule id against
+the same report, so the tables extracted from a file are kept in PDF_TABLE_CACHE.  Entries are
+keyed by the file's path, modification time and size along with the pages and flavor, so an
+edited file is parsed again.  The cache keeps the last max_entries files in memory and, if
+spill_dir is set, also saves the tables as Parquet files so other processes (and later runs)
+don't have to parse the file at all.
 
+Looking up rule ids uses a SplintPdfRuleIndex, built once per file and set of column names,
+so each rule_from_pdf_rule_ids call is a dictionary lookup rather than a scan of every table.
+
+camelot parses pages one after the other.  With workers > 1 the pages are handed out one at a
+time to that many worker processes and the tables are put back together in page order.  Setting
+page_timeout (seconds) also runs the pages in worker processes.  A page taking longer than that
+has its worker killed (and replaced) so it can't hang the run, the tables from the other pages
+are returned and the page is listed in skipped_pages.  Rule id lookups that come up empty on a
+file with skipped pages fail, naming the pages, rather than being skipped.
 """
 
-from typing import Generator,Sequence
+import hashlib
+import itertools
+import multiprocessing
+import os
+import pathlib
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Generator, Sequence
 
 import camelot  # type: ignore
 import pandas as pd
@@ -17,10 +43,283 @@ from .splint_exception import SplintException
 from .splint_result import SR
 from .splint_util import str_to_bool
 
+DEFAULT_PDF_CACHE_SIZE = 32
+DEFAULT_FLAVOR = 'stream'
+DEFAULT_PDF_WORKERS = 1
+DEFAULT_PAGE_TIMEOUT = 0.0
+
+# How often the parent checks on the workers while waiting for pages.
+_POLL_SEC = 0.05
+
+# (absolute path, mtime ns, size, pages, flavor)
+PdfKey = tuple[str, int, int, str, str]
+
+
+def _promote_header(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The table that camelot returns seems to have the columns in the first row, this
+    moves those values into column names.
+    """
+    df = df.copy()
+    df.columns = df.iloc[0]
+    return df.drop(df.index[0])
+
+
+class SplintPdfTables(list):
+    """The tables read from a PDF, skipped_pages lists the pages that took longer than page_timeout."""
+
+    def __init__(self, tables: Sequence[pd.DataFrame] = (), skipped_pages: Sequence[int] = ()):
+        super().__init__(tables)
+        self.skipped_pages = list(skipped_pages)
+
+
+def _read_tables(file_path: str,
+                 pages: str,
+                 flavor: str,
+                 workers: int = DEFAULT_PDF_WORKERS,
+                 page_timeout: float = DEFAULT_PAGE_TIMEOUT) -> SplintPdfTables:
+    """Parse every table in the PDF, the first row of each table is the header."""
+    if workers < 1 or page_timeout < 0:
+        raise SplintException("PDF workers must be at least 1 and page_timeout must be >= 0.")
+    if workers == 1 and not page_timeout:
+        return SplintPdfTables(table.df for table in camelot.read_pdf(file_path, flavor=flavor, pages=pages))
+    return _read_tables_parallel(file_path, pages, flavor, workers, page_timeout)
+
+
+def _page_worker(worker: int, file_path: str, flavor: str, tasks, messages) -> None:
+    """Worker process, parse the pages sent on its tasks queue until it sends None."""
+    for page in iter(tasks.get, None):
+        messages.put(("start", worker, page, None))
+        try:
+            tables = [table.df for table in camelot.read_pdf(file_path, flavor=flavor, pages=str(page))]
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Not every exception can be pickled, so only the message is sent back.
+            messages.put(("error", worker, page, f"{type(exc).__name__}: {exc}"))
+        else:
+            messages.put(("done", worker, page, tables))
+
+
+def _read_tables_parallel(file_path: str,
+                          pages: str,
+                          flavor: str,
+                          workers: int,
+                          page_timeout: float) -> SplintPdfTables:
+    """
+    Parse the pages in worker processes and return the tables in page order.
+
+    Each worker is sent one page at a time, so when a page runs past page_timeout only that
+    worker is killed and only that page is lost.  A new worker takes over the remaining pages.
+    """
+    page_numbers = camelot.handlers.PDFHandler(file_path, pages=pages).pages
+    pending = deque(page_numbers)
+    messages: multiprocessing.Queue = multiprocessing.Queue()
+    # worker -> (process, tasks queue), the page it was sent and when it started on it.
+    processes: dict[int, tuple[multiprocessing.Process, multiprocessing.Queue]] = {}
+    assigned: dict[int, int] = {}
+    started: dict[int, float] = {}
+    page_tables: dict[int, list[pd.DataFrame]] = {}
+    skipped: list[int] = []
+    worker_ids = itertools.count()
+
+    def start_worker() -> None:
+        worker = next(worker_ids)
+        tasks: multiprocessing.Queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_page_worker,
+                                          args=(worker, file_path, flavor, tasks, messages),
+                                          daemon=True)
+        process.start()
+        processes[worker] = (process, tasks)
+        send_page(worker)
+
+    def send_page(worker: int) -> None:
+        _, tasks = processes[worker]
+        if pending:
+            assigned[worker] = pending.popleft()
+            tasks.put(assigned[worker])
+        else:
+            tasks.put(None)
+
+    try:
+        for _ in range(min(workers, len(page_numbers))):
+            start_worker()
+        while len(page_tables) + len(skipped) < len(page_numbers):
+            try:
+                kind, worker, page, payload = messages.get(timeout=_POLL_SEC)
+            except queue.Empty:
+                if not any(process.is_alive() for process, _ in processes.values()):
+                    raise SplintException(f"PDF worker processes exited early reading {file_path}")
+            else:
+                if kind == "start":
+                    started[worker] = time.monotonic()
+                elif kind == "done":
+                    # A page can finish just as its worker is killed, keep its tables after all.
+                    if page in skipped:
+                        skipped.remove(page)
+                    page_tables[page] = payload
+                    if worker in processes:
+                        del assigned[worker], started[worker]
+                        send_page(worker)
+                else:
+                    raise SplintException(f"Error extracting tables from page {page} of PDF: {file_path} ({payload})")
+            for worker, start in list(started.items()):
+                if page_timeout and time.monotonic() - start > page_timeout:
+                    process, _ = processes.pop(worker)
+                    process.terminate()
+                    process.join()
+                    del started[worker]
+                    skipped.append(assigned.pop(worker))
+                    if pending:
+                        start_worker()
+    finally:
+        for process, _ in processes.values():
+            if process.is_alive() and len(page_tables) + len(skipped) < len(page_numbers):
+                process.terminate()
+            process.join()
+
+    return SplintPdfTables((table for page in page_numbers if page in page_tables for table in page_tables[page]),
+                           skipped_pages=sorted(skipped))
+
+
+class SplintPdfTableCache:
+    """
+    LRU cache of the raw tables camelot extracts from PDF files.
+
+    Args:
+        max_entries: Number of (file, pages, flavor) entries kept in memory.
+        spill_dir: Optional folder where tables are also saved as Parquet files (needs pyarrow).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PDF_CACHE_SIZE, spill_dir: str | pathlib.Path | None = None):
+        if max_entries < 1:
+            raise SplintException("PDF cache max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.spill_dir = pathlib.Path(spill_dir) if spill_dir else None
+        self.hits = 0
+        self.misses = 0
+        self._tables: OrderedDict[PdfKey, SplintPdfTables] = OrderedDict()
+        self._indexes: dict[tuple[PdfKey, tuple[str, ...]], "SplintPdfRuleIndex"] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(file_path: str, pages: str = 'all', flavor: str = DEFAULT_FLAVOR) -> PdfKey:
+        """Cache key for a file, changes whenever the file is modified."""
+        try:
+            stat = os.stat(file_path)
+        except OSError as ioex:
+            raise SplintException(f"IO Error reading PDF file {file_path}.") from ioex
+        return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, str(pages), flavor
+
+    def tables(self,
+               file_path: str,
+               pages: str = 'all',
+               flavor: str = DEFAULT_FLAVOR,
+               workers: int = DEFAULT_PDF_WORKERS,
+               page_timeout: float = DEFAULT_PAGE_TIMEOUT) -> SplintPdfTables:
+        """
+        Raw tables in the file (header in the first row), parsing it only on a cache miss.
+
+        The frames are shared by everyone using the cache so they must not be modified.
+        """
+        return self._get(self.key(file_path, pages, flavor), file_path, workers, page_timeout)
+
+    def _get(self, key: PdfKey, file_path: str, workers: int, page_timeout: float) -> SplintPdfTables:
+        _, _, _, pages, flavor = key
+        with self._lock:
+            if key in self._tables:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return self._tables[key]
+        tables = self._load_spilled(key)
+        if tables is None:
+            tables = _read_tables(file_path, pages, flavor, workers, page_timeout)
+            self._spill(key, tables)
+        with self._lock:
+            self.misses += 1
+            self._tables[key] = tables
+            self._tables.move_to_end(key)
+            while len(self._tables) > self.max_entries:
+                old_key, _ = self._tables.popitem(last=False)
+                self._indexes = {k: v for k, v in self._indexes.items() if k[0] != old_key}
+        return tables
+
+    def rule_index(self,
+                   file_path: str,
+                   col_names: dict | None = None,
+                   pages: str = 'all',
+                   flavor: str = DEFAULT_FLAVOR,
+                   workers: int = DEFAULT_PDF_WORKERS,
+                   page_timeout: float = DEFAULT_PAGE_TIMEOUT) -> "SplintPdfRuleIndex":
+        """Rule id index for the file, built once per file and set of column names."""
+        col_names = DEFAULT_COL_NAMES | col_names if col_names else DEFAULT_COL_NAMES
+        key = self.key(file_path, pages, flavor)
+        tables = self._get(key, file_path, workers, page_timeout)
+        index_key = (key, tuple(sorted(col_names.items())))
+        with self._lock:
+            index = self._indexes.get(index_key)
+        if index is None:
+            index = SplintPdfRuleIndex(tables, col_names=col_names, file_path=file_path)
+            with self._lock:
+                if index_key[0] in self._tables:
+                    self._indexes[index_key] = index
+        return index
+
+    def clear(self) -> None:
+        """Empty the in-memory cache, spilled Parquet files are kept."""
+        with self._lock:
+            self._tables.clear()
+            self._indexes.clear()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def _spill_path(self, key: PdfKey) -> pathlib.Path | None:
+        if self.spill_dir is None:
+            return None
+        return self.spill_dir / hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def _spill(self, key: PdfKey, tables: SplintPdfTables) -> None:
+        """
+        Save the tables, one Parquet file each, in a folder named by the hash of the key.
+
+        Files with skipped pages aren't saved so other processes and later runs try them again.
+        """
+        path = self._spill_path(key)
+        if path is None or path.exists() or tables.skipped_pages:
+            return
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary folder and rename it so readers never see part of an entry.
+        tmp = pathlib.Path(tempfile.mkdtemp(dir=self.spill_dir, prefix=".tmp-"))
+        try:
+            for i, table in enumerate(tables):
+                # Column names are positions, the header row is saved as data.
+                table.rename(columns=str).to_parquet(tmp / f"table_{i:04d}.parquet")
+            tmp.rename(path)
+        except OSError:
+            # Another process spilled the same file first.
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _load_spilled(self, key: PdfKey) -> SplintPdfTables | None:
+        path = self._spill_path(key)
+        if path is None or not path.is_dir():
+            return None
+        tables = []
+        for file in sorted(path.glob("table_*.parquet")):
+            df = pd.read_parquet(file)
+            df.columns = [int(col) for col in df.columns]
+            tables.append(df)
+        return SplintPdfTables(tables)
+
+
+PDF_TABLE_CACHE = SplintPdfTableCache()
+
 
 def extract_tables_from_pdf(file_path: str,
                             required_columns: Sequence[str] | None = None,
-                            pages: str = 'all') -> list[pd.DataFrame]:
+                            pages: str = 'all',
+                            flavor: str = DEFAULT_FLAVOR,
+                            cache: SplintPdfTableCache | bool = True,
+                            workers: int = DEFAULT_PDF_WORKERS,
+                            page_timeout: float = DEFAULT_PAGE_TIMEOUT) -> SplintPdfTables:
     """
     Extracts tables from a PDF file that include specified columns, and returns them in a list.
 
@@ -37,22 +336,31 @@ def extract_tables_from_pdf(file_path: str,
             Defaults to ["RuleId", "Note", "Status"].
         pages: The pages of the PDF to process. It could be 'all', a range like '1-7', or
             specific pages like '1,3,5'. Defaults to 'all'.
+        flavor: The camelot parsing method, 'stream' or 'lattice'. Defaults to 'stream'.
+        cache: True to use PDF_TABLE_CACHE, False to always parse the file, or the
+            SplintPdfTableCache to use.
+        workers: Number of processes parsing pages in parallel. Defaults to 1.
+        page_timeout: Seconds allowed for each page, 0 for no limit. Defaults to 0.
 
     Returns:
-        A list of pandas DataFrames representing the tables extracted from the PDF file.
+        A list of pandas DataFrames representing the tables extracted from the PDF file, its
+        skipped_pages are the pages that took longer than page_timeout.
     """
     required_columns = required_columns or ["RuleId", "Note", "Status"]
-    filtered_tables = []
+    filtered_tables = SplintPdfTables()
     try:
-        tables = camelot.read_pdf(file_path, flavor='stream', pages=pages)
+        if cache is False:
+            tables = _read_tables(file_path, pages, flavor, workers, page_timeout)
+        else:
+            tables = (PDF_TABLE_CACHE if cache is True else cache).tables(file_path, pages, flavor,
+                                                                          workers, page_timeout)
+        filtered_tables.skipped_pages = tables.skipped_pages
         for table in tables:
-            # The table that camelot returns seems to have the columns in
-            # the first row, this code moves those values into column names.
-            df = table.df
-            df.columns = df.iloc[0]
-            df = df.drop(df.index[0])
+            df = _promote_header(table)
             if set(required_columns).issubset(df.columns):
                 filtered_tables.append(df)
+    except SplintException:
+        raise
     except IOError as ioex:
         raise SplintException(f"IO Error reading PDF file {file_path}.") from ioex
     except Exception as exc:
@@ -69,12 +377,90 @@ DEFAULT_COL_NAMES = {
 }
 
 
+class SplintPdfRuleIndex:
+    """
+    All the rule id rows in a PDF's tables, indexed by rule id.
+
+    Rows are kept in the order they appear in the file.  Build one with
+    PDF_TABLE_CACHE.rule_index (or pdf_rule_index) so it is shared by every check on the file.
+
+        index = splint.pdf_rule_index("report.pdf")
+        for rule_id in ["Rule001", "Rule002"]:
+            yield from index.results(rule_id)
+    """
+
+    def __init__(self, tables: Sequence[pd.DataFrame], col_names: dict | None = None, file_path: str = ""):
+        self.col_names = DEFAULT_COL_NAMES | col_names if col_names else DEFAULT_COL_NAMES
+        self.file_path = file_path
+        self.skipped_pages = list(getattr(tables, "skipped_pages", []))
+        status_col = self.col_names['status_col']
+        note_col = self.col_names['note_col']
+        rule_col = self.col_names['rule_col']
+        skip_col = self.col_names['skip_col']
+        required = {rule_col, note_col, status_col}
+
+        # rule id -> [(status, note, skip)] using the raw (unconverted) cell values.
+        self._rows: dict[str, list[tuple]] = {}
+        for table in tables:
+            df = _promote_header(table)
+            if not required.issubset(df.columns):
+                continue
+            skips = df[skip_col] if skip_col in df.columns else [False] * len(df)
+            for rule_id, status, note, skip in zip(df[rule_col], df[status_col], df[note_col], skips):
+                self._rows.setdefault(rule_id, []).append((status, note, skip))
+
+    def __contains__(self, rule_id) -> bool:
+        return rule_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def rule_ids(self) -> list[str]:
+        """Rule ids in the order they first appear."""
+        return list(self._rows)
+
+    def results(self,
+                rule_id: str,
+                default_msg: str | None = None,
+                max_results: int = 1) -> Generator[SR, None, None]:
+        """Same results as rule_from_pdf_rule_ids for a single rule id."""
+        count = 0
+        for status, note, skip in self._rows.get(rule_id, ()):
+            yield SR(status=str_to_bool(status), msg=default_msg or note, skipped=skip)
+            count += 1
+            if count > max_results:
+                raise SplintException(f"Maximum number of results ({max_results}) exceeded for {self.file_path}")
+        if count == 0 and self.skipped_pages:
+            yield SR(status=False, msg=f"No results found in {self.file_path}, pages {self.skipped_pages} "
+                                       f"timed out and were skipped")
+        elif count == 0:
+            yield SR(status=None, skipped=True, msg=f"No results found in {self.file_path}")
+
+
+def pdf_rule_index(file_path: str,
+                   col_names: dict | None = None,
+                   pages: str = 'all',
+                   flavor: str = DEFAULT_FLAVOR,
+                   workers: int = DEFAULT_PDF_WORKERS,
+                   page_timeout: float = DEFAULT_PAGE_TIMEOUT) -> SplintPdfRuleIndex:
+    """Index of every rule id row in the PDF's tables, cached in PDF_TABLE_CACHE."""
+    try:
+        return PDF_TABLE_CACHE.rule_index(file_path, col_names=col_names, pages=pages, flavor=flavor,
+                                          workers=workers, page_timeout=page_timeout)
+    except SplintException:
+        raise
+    except Exception as exc:
+        raise SplintException(f"Error extracting tables from PDF: {file_path}") from exc
+
+
 def rule_from_pdf_rule_ids(file_path: str,
                            rule_id: str,
                            default_msg: str | None = None,
                            col_names: dict | None = None,
                            max_results: int = 1,
-                           pages="all") -> Generator[SR, None, None]:
+                           pages="all",
+                           workers: int = DEFAULT_PDF_WORKERS,
+                           page_timeout: float = DEFAULT_PAGE_TIMEOUT) -> Generator[SR, None, None]:
     """
         Yield matching rule ID results from tables contained in a specified PDF file.
 
@@ -101,6 +487,10 @@ def rule_from_pdf_rule_ids(file_path: str,
            Maximum number of results to yield. The function raises an exception when exceed this number. Defaults to 1.
         pages : str
            Specific pages from the PDF file to be read. Defaults to 'all'.
+        workers : int, optional
+           Number of processes parsing pages in parallel. Defaults to 1.
+        page_timeout : float, optional
+           Seconds allowed for each page, 0 for no limit. Defaults to 0.
 
         Yields:
         -------
@@ -115,26 +505,5 @@ def rule_from_pdf_rule_ids(file_path: str,
         SplintException
            If the number of yielded results exceeds the maximum limit specified by `max_results`.
         """
-    col_names = DEFAULT_COL_NAMES | col_names if col_names else DEFAULT_COL_NAMES
-    status_col = col_names['status_col']
-    note_col = col_names['note_col']
-    rule_col = col_names['rule_col']
-    skip_col = col_names['skip_col']
-
-    tables = extract_tables_from_pdf(file_path,
-                                     required_columns=[rule_col, note_col, status_col],
-                                     pages=pages)
-    count = 0
-    for table in tables:
-        if rule_col in table.columns:
-            df = table[table[rule_col] == rule_id]
-            for _, rule_data in df.iterrows():
-                status = str_to_bool(rule_data[status_col])
-                skip = rule_data.get(skip_col, False)
-                msg = default_msg or rule_data[note_col]
-                yield SR(status=status, msg=msg, skipped=skip)
-                count += 1
-                if count > max_results:
-                    raise SplintException(f"Maximum number of results ({max_results}) exceeded for {file_path}")
-    if count == 0:
-        yield SR(status=None, skipped=True, msg=f"No results found in {file_path}")
+    index = pdf_rule_index(file_path, col_names=col_names, pages=pages, workers=workers, page_timeout=page_timeout)
+    yield from index.results(rule_id, default_msg=default_msg, max_results=max_results)
@@ -1,21 +1,50 @@
 """
 This module provides functions for using ping to verify network connectivity.
 
-
+Hosts are pinged one at a time unless max_workers is more than 1, in which case up to that
+many pings run at once in a thread pool, so a sweep takes about as long as the slowest host
+rather than the sum of all of them.  Results come back in the order of the hosts, or with
+ordered=False, as soon as each ping finishes.
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Generator
 
 import ping3
 
+from .splint_exception import SplintException
 from .splint_format import SM
 from .splint_result import SR
 
 NO_HOSTS_MSG = "No hosts provided for ping."
 MIN_LATENCY_MS = 0.0001
+DEFAULT_PING_WORKERS = 1
+
+
+def _ping_host(host: str, timeout_ms: float) -> SR:
+    """Ping a single host."""
+    try:
+        # ping3 timeouts are in seconds, the unit only applies to the returned latency.
+        latency = ping3.ping(host, timeout=timeout_ms / 1000.0, unit='ms')
 
+        if latency is False or latency is None:
+            return SR(status=False,
+                      msg=f"No ping response from server {SM.code(host)} timeout = {timeout_ms:0.1f} ms")
+        if latency < MIN_LATENCY_MS:
+            latency_str = f"{MIN_LATENCY_MS:0.1f}"
+            return SR(status=True, msg=f"Host {SM.code(host)} is up: response time < {SM.code(latency_str)} ms")
+        latency_str = f"{latency:0.1f}"
+        return SR(status=True, msg=f"Host {SM.code(host)} is up, response time = {SM.code(latency_str)} ms")
+    except Exception:
+        # Unknown hosts, bad host names and permission problems all mean the host can't be reached.
+        return SR(status=False, msg=f"Host {SM.code(host)} not found: {SM.fail(host)}")
 
-def rule_ping_check(hosts: str | list, timeout_ms: float = 4000.0, skip_on_none=False, pass_on_none=False) -> Generator[
-    SR, None, None]:
+
+def rule_ping_check(hosts: str | list,
+                    timeout_ms: float = 4000.0,
+                    skip_on_none=False,
+                    pass_on_none=False,
+                    max_workers: int = DEFAULT_PING_WORKERS,
+                    ordered: bool = True) -> Generator[SR, None, None]:
     """
     Given a sequence of hosts perform ping checks against each of them given a single timeout
     value.  This function handles the following:
@@ -27,9 +56,15 @@ def rule_ping_check(hosts: str | list, timeout_ms: float = 4000.0, skip_on_none=
         timeout_ms(4000): Time in milliseconds.
         skip_on_none(False): If true an empty host list is a skip
         pass_on_none(False): If try the tests passes on empty host list
+        max_workers(1): Number of hosts pinged at the same time.
+        ordered(True): Yield results in the order of the hosts, if False yield each result
+                       as soon as its ping finishes.
     Yields:
         list of results
     """
+    if max_workers < 1:
+        raise SplintException("max_workers must be at least 1 for ping checks.")
+
     hosts = hosts.replace(',',' ').split() if isinstance(hosts, str) else hosts
 
     if len(hosts) == 0:
@@ -40,19 +75,12 @@ def rule_ping_check(hosts: str | list, timeout_ms: float = 4000.0, skip_on_none=
             yield SR(status=pass_on_none, msg=NO_HOSTS_MSG)
             return
 
-    for host in hosts:
-        try:
-            latency = ping3.ping(host, timeout=timeout_ms, unit='ms')
-
-            if latency is False:
-                yield SR(status=False,
-                         msg=f"No ping response from server {SM.code(host)} timeout = {timeout_ms:0.1f} ms")
-            elif latency < MIN_LATENCY_MS:
-                latency_str = f"{MIN_LATENCY_MS:0.1f}"
-                yield SR(status=True, msg=f"Host {SM.code(host)} is up: response time < {SM.code(latency_str)} ms")
-            else:
-                latency_str = f"{latency:0.1f}"
-                yield SR(status=True, msg=f"Host {SM.code(host)} is up, response time = {SM.code(latency_str)} ms")
-        except Exception:
-            # Document your exception handling logic here
-            yield SR(status=False, msg=f"Host {SM.code(host)} not found: {SM.fail(host)}")
+    if max_workers == 1 or len(hosts) == 1:
+        for host in hosts:
+            yield _ping_host(host, timeout_ms)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(hosts))) as pool:
+        futures = [pool.submit(_ping_host, host, timeout_ms) for host in hosts]
+        for future in (futures if ordered else as_completed(futures)):
+            yield future.result()
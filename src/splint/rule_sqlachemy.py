@@ -1,56 +1,129 @@
 """
-Set of baseline rules that uses the pyfilesystem module to OS-agnostic checks on things
-about the file system, file existing, age etc.
+Rules that check the schema of database tables using SQLAlchemy.
+
+Reflecting a table is a round trip (or several) to the database, and a package usually checks
+many tables on the same engine, so the rules can share a SplintReflectionCache that keeps
+reflected columns for ttl_sec seconds per engine.  Without one every call reflects afresh.
+rule_sql_schema checks a whole {table: expected columns} dict after reflecting every table in
+one go.
 """
 
-from typing import Generator,Sequence
+import threading
+import time
+import weakref
+from typing import Generator, Sequence
 
-from sqlalchemy import Engine, MetaData, Table
+from sqlalchemy import Engine, inspect
 from sqlalchemy.sql.type_api import TypeEngine
 
+from .splint_exception import SplintException
 from .splint_result import SR
 from .splint_format import SM
 
+DEFAULT_REFLECTION_TTL_SEC = 300.0
 
-def rule_sql_table_col_name_schema(engine: Engine,
-                                   table: str,
-                                   expected_columns: Sequence[str],
-                                   extra_columns_ok: bool = True) -> Generator[SR, None, None]:
+# Column name -> reflected type, in table order.
+Columns = dict[str, TypeEngine]
+
+
+def _columns(reflected: list[dict]) -> Columns:
+    """Name -> type from the column dicts the SQLAlchemy inspector returns."""
+    return {column["name"]: column["type"] for column in reflected}
+
+
+def _reflect_table(engine: Engine, table: str, schema: str | None) -> Columns:
+    return _columns(inspect(engine).get_columns(table, schema=schema))
+
+
+def _reflect_all(engine: Engine, schema: str | None) -> dict[str, Columns]:
+    return {table: _columns(columns)
+            for (_, table), columns in inspect(engine).get_multi_columns(schema=schema).items()}
+
+
+class SplintReflectionCache:
     """
-    Take a connection, a table, and column names and verify that the table has those columns.
-    Note that this does NOT verify the data types of the columns.
-    Args:
-        engine: SQLAlchemy engine object
-        table: Name of the table
-        columns: List of expected column names
+    Reflected table columns per engine and schema, kept for ttl_sec seconds.
 
-    Returns:
-        A generator yielding assertion results for each column
+    Nothing is cached unless a cache is passed to the rules.  Engines are held weakly so
+    disposing of an engine drops its entries.  Call invalidate after changing a schema to see
+    the change before the TTL runs out.
     """
 
-    if not table:
-        yield SR(status=False, msg="Table name cannot be blank.")
-        return
+    def __init__(self, ttl_sec: float = DEFAULT_REFLECTION_TTL_SEC):
+        if ttl_sec < 0:
+            raise SplintException("Reflection cache ttl_sec must be >= 0.")
+        self.ttl_sec = ttl_sec
+        self.reflections = 0
+        # engine -> {(schema, table): (expires, columns)} and
+        # engine -> {schema: expiry of the last reflect-all}.
+        self._tables: weakref.WeakKeyDictionary[Engine, dict[tuple[str | None, str], tuple[float, Columns]]] = \
+            weakref.WeakKeyDictionary()
+        self._all_expires: weakref.WeakKeyDictionary[Engine, dict[str | None, float]] = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
 
-    if not expected_columns:
-        yield SR(status=False, msg="Column list cannot be empty.")
-        return
+    def columns(self, engine: Engine, table: str, schema: str | None = None) -> Columns:
+        """Columns of table, raises NoSuchTableError if it doesn't exist."""
+        now = time.monotonic()
+        with self._lock:
+            expires, columns = self._tables.get(engine, {}).get((schema, table), (0.0, {}))
+            if expires > now:
+                return columns
+        self.reflections += 1
+        columns = _reflect_table(engine, table, schema)
+        with self._lock:
+            self._tables.setdefault(engine, {})[(schema, table)] = (now + self.ttl_sec, columns)
+        return columns
 
-    count = 0
+    def all_columns(self, engine: Engine, schema: str | None = None) -> dict[str, Columns]:
+        """Columns of every table in schema, all reflected in one pass when the cached set is stale."""
+        now = time.monotonic()
+        with self._lock:
+            if self._all_expires.get(engine, {}).get(schema, 0.0) > now:
+                return {table: columns for (table_schema, table), (expires, columns) in self._tables[engine].items()
+                        if table_schema == schema and expires > now}
+        self.reflections += 1
+        tables = _reflect_all(engine, schema)
+        with self._lock:
+            cached = self._tables.setdefault(engine, {})
+            for key in [key for key in cached if key[0] == schema]:
+                del cached[key]
+            cached.update({(schema, table): (now + self.ttl_sec, columns) for table, columns in tables.items()})
+            self._all_expires.setdefault(engine, {})[schema] = now + self.ttl_sec
+        return tables
 
-    for expected_column in expected_columns:
-        if not expected_column.strip():
-            yield SR(status=False, msg="Column names cannot be empty.")
-            count += 1
+    def invalidate(self, engine: Engine | None = None) -> None:
+        """Forget the reflected tables for engine, or for every engine."""
+        with self._lock:
+            if engine is None:
+                self._tables.clear()
+                self._all_expires.clear()
+            else:
+                self._tables.pop(engine, None)
+                self._all_expires.pop(engine, None)
 
-    if count:
-        return
+    def __len__(self) -> int:
+        return sum(len(tables) for tables in self._tables.values())
 
-    # Get the table's metadata
-    metadata = MetaData()
-    table_obj = Table(table, metadata, autoload_with=engine)
-    actual_columns = set(table_obj.columns.keys())
 
+def _reflect(engine: Engine, table: str, schema: str | None, cache: SplintReflectionCache | None) -> Columns:
+    if cache is None:
+        return _reflect_table(engine, table, schema)
+    return cache.columns(engine, table, schema)
+
+
+def _bad_column_list(expected_columns: Sequence) -> list[SR]:
+    """Results for an empty column list or blank column names, empty if the list is OK."""
+    if not expected_columns:
+        return [SR(status=False, msg="Column list cannot be empty.")]
+    names = [column if isinstance(column, str) else column[0] for column in expected_columns]
+    return [SR(status=False, msg="Column names cannot be empty.") for name in names if not name.strip()]
+
+
+def _check_column_names(table: str,
+                        actual_columns: Columns,
+                        expected_columns: Sequence[str],
+                        extra_columns_ok: bool) -> Generator[SR, None, None]:
     # Verify expected columns exist
     for column in expected_columns:
         if column in actual_columns:
@@ -60,19 +133,87 @@ def rule_sql_table_col_name_schema(engine: Engine,
 
     # If extra columns existing in the database is OK then don't check
     if not extra_columns_ok:
-        extra_columns = actual_columns - set(expected_columns)
+        extra_columns = set(actual_columns) - set(expected_columns)
 
-        # This is very subtle.  We want the ordering of actual columns here  rather than iterating
-        # over the set (that varies with python version).   For small sets this isn't to terrible
+        # Iterate over the actual columns so the results are in table order.
         for column in actual_columns:
             if column in extra_columns:
                 yield SR(status=False, msg=f"Column {SM.code(column)} is UNEXPECTED in table {SM.code(table)}")
 
 
+def _check_column_types(table: str,
+                        actual_columns: Columns,
+                        expected_columns: Sequence[tuple[str, TypeEngine]],
+                        extra_columns_ok: bool) -> Generator[SR, None, None]:
+    # Verify expected columns exist and have correct types
+    for expected_column, expected_type in expected_columns:
+        actual_type = actual_columns.get(expected_column)
+
+        # Check if column exists
+        if actual_type:
+            # Remove any qualifiers from the SQLAlchemy type to get base type
+            unqualified_actual_type = actual_type.__class__.__name__
+            unqualified_expected_type = expected_type.__class__.__name__
+
+            # Check if types match
+            if unqualified_actual_type == unqualified_expected_type:
+                # pylint: disable=line-too-long
+                yield SR(status=True,
+                         msg=f"Column {SM.expected(expected_column)} of type {SM.expected(expected_type)} is correctly present in table {SM.code(table)}")
+            else:
+                # pylint: disable=line-too-long
+                yield SR(status=False,
+                         msg=f"Column {SM.expected(expected_column)}  has incorrect type. Expected: {SM.expected(unqualified_expected_type)} , got: {SM.actual(unqualified_actual_type)}")
+        else:
+            yield SR(status=False, msg=f"Missing column in table {table}: {SM.expected(expected_column)} ")
+
+    # If extra columns existing in the database is OK then don't check
+    if not extra_columns_ok:
+        expected_names = set(column for column, _ in expected_columns)
+        for column in actual_columns:
+            if column not in expected_names:
+                yield SR(status=False, msg=f"Unexpected column in table {SM.code(table)}: {SM.code(column)}")
+
+
+def rule_sql_table_col_name_schema(engine: Engine,
+                                   table: str,
+                                   expected_columns: Sequence[str],
+                                   extra_columns_ok: bool = True,
+                                   schema: str | None = None,
+                                   cache: SplintReflectionCache | None = None) -> Generator[SR, None, None]:
+    """
+    Take a connection, a table, and column names and verify that the table has those columns.
+    Note that this does NOT verify the data types of the columns.
+    Args:
+        engine: SQLAlchemy engine object
+        table: Name of the table
+        columns: List of expected column names
+        schema: (default=None) Schema the table is in, None for the default schema.
+        cache: (default=None) SplintReflectionCache to share reflected tables between calls,
+            None to reflect the table every time.
+
+    Returns:
+        A generator yielding assertion results for each column
+    """
+
+    if not table:
+        yield SR(status=False, msg="Table name cannot be blank.")
+        return
+
+    bad_columns = _bad_column_list(expected_columns)
+    if bad_columns:
+        yield from bad_columns
+        return
+
+    yield from _check_column_names(table, _reflect(engine, table, schema, cache), expected_columns, extra_columns_ok)
+
+
 def rule_sql_table_schema(engine: Engine,
                           table: str,
                           expected_columns: list[tuple[str, TypeEngine]],
-                          extra_columns_ok: bool = True) -> Generator[SR, None, None]:
+                          extra_columns_ok: bool = True,
+                          schema: str | None = None,
+                          cache: SplintReflectionCache | None = None) -> Generator[SR, None, None]:
     """
     Take a connection, a table, and column names and verify that the table has those columns
     AND the correct types.
@@ -81,6 +222,9 @@ def rule_sql_table_schema(engine: Engine,
         table: Name of the table
         expected_columns: List of expected column name,type pairs
         extra_columns_ok: (default=True) Ignore additional columns in the table.
+        schema: (default=None) Schema the table is in, None for the default schema.
+        cache: (default=None) SplintReflectionCache to share reflected tables between calls,
+            None to reflect the table every time.
 
     Returns:
         A generator yielding assertion results for each column
@@ -93,35 +237,49 @@ def rule_sql_table_schema(engine: Engine,
         yield SR(status=False, msg="Column list cannot be empty.")
         return
 
-    # Get the table's metadata
-    metadata = MetaData()
-    table_obj = Table(table, metadata, autoload_with=engine)
-    actual_columns = {column.name: column.type for column in table_obj.columns}
+    yield from _check_column_types(table, _reflect(engine, table, schema, cache), expected_columns, extra_columns_ok)
 
-    # Verify expected columns exist and have correct types
-    for expected_column, expected_type in expected_columns:
-        actual_type = actual_columns.get(expected_column)
 
-        # Check if column exists
-        if actual_type:
-            # Remove any qualifiers from the SQLAlchemy type to get base type
-            unqualified_actual_type = actual_type.__class__.__name__
-            unqualified_expected_type = expected_type.__class__.__name__
+def rule_sql_schema(engine: Engine,
+                    expected_schema: dict[str, Sequence[str] | Sequence[tuple[str, TypeEngine]]],
+                    extra_columns_ok: bool = True,
+                    extra_tables_ok: bool = True,
+                    schema: str | None = None,
+                    cache: SplintReflectionCache | None = None) -> Generator[SR, None, None]:
+    """
+    Verify many tables at once after reflecting the whole database in one pass.
 
-            # Check if types match
-            if unqualified_actual_type == unqualified_expected_type:
-                # pylint: disable=line-too-long
-                yield SR(status=True,
-                         msg=f"Column {SM.expected(expected_column)} of type {SM.expected(expected_type)} is correctly present in table {SM.code(table)}")
-            else:
-                # pylint: disable=line-too-long
-                yield SR(status=False,
-                         msg=f"Column {SM.expected(expected_column)}  has incorrect type. Expected: {SM.expected(unqualified_expected_type)} , got: {SM.actual(unqualified_actual_type)}")
+    Args:
+        engine: SQLAlchemy engine object
+        expected_schema: Table name -> expected columns, either column names (checked like
+            rule_sql_table_col_name_schema) or (name, type) pairs (like rule_sql_table_schema).
+        extra_columns_ok: (default=True) Ignore additional columns in the tables.
+        extra_tables_ok: (default=True) Ignore tables that aren't in expected_schema.
+        schema: (default=None) Schema to check, None for the default schema.
+        cache: (default=None) SplintReflectionCache to share reflected tables between calls,
+            None to reflect every time.
+
+    Returns:
+        A generator yielding assertion results for each table and column
+    """
+    if not expected_schema:
+        yield SR(status=False, msg="Expected schema cannot be empty.")
+        return
+
+    tables = _reflect_all(engine, schema) if cache is None else cache.all_columns(engine, schema)
+
+    for table, expected_columns in expected_schema.items():
+        bad_columns = _bad_column_list(expected_columns)
+        if bad_columns:
+            yield from bad_columns
+        elif table not in tables:
+            yield SR(status=False, msg=f"Table {SM.code(table)} is MISSING")
+        elif all(isinstance(column, str) for column in expected_columns):
+            yield from _check_column_names(table, tables[table], expected_columns, extra_columns_ok)
         else:
-            yield SR(status=False, msg=f"Missing column in table {table}: {SM.expected(expected_column)} ")
+            yield from _check_column_types(table, tables[table], expected_columns, extra_columns_ok)
 
-    # If extra columns existing in the database is OK then don't check
-    if not extra_columns_ok:
-        extra_columns = set(actual_columns.keys()) - set(column for column, _ in expected_columns)
-        for column in extra_columns:
-            yield SR(status=False, msg=f"Unexpected column in table {SM.code(table)}: {SM.code(column)}")
+    if not extra_tables_ok:
+        for table in tables:
+            if table not in expected_schema:
+                yield SR(status=False, msg=f"Table {SM.code(table)} is UNEXPECTED")
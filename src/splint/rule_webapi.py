@@ -8,18 +8,170 @@ Includes:
 
 - `rule_web_api`: Verifies a URLs HTTP response status code and compares returned JSON data.
 
+- `rule_web_apis`: rule_web_api for many (url, expected JSON) pairs.
+
 Uses the `requests` library for HTTP requests, and handles exceptions accordingly.
+
+Requests go through a shared SplintHttpClient so connections are pooled and kept alive
+between checks instead of paying for a new TCP (and TLS) handshake per URL.  The client can
+use httpx for HTTP/2 (pip install httpx[http2]).  Given max_workers the URL checks run that
+many at a time in a thread pool, yielding results in URL order or, with ordered=False, as
+each response arrives.  The shared client's pool grows to max_workers, a client passed in
+must already be that big, and close_default_http_client (also run at exit) closes it.
 """
-from typing import Sequence
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+from .splint_exception import SplintException
 from .splint_result import SR
 from .splint_format import SM
 
+DEFAULT_POOL_SIZE = 10
+DEFAULT_URL_WORKERS = 1
+
+
+class SplintHttpClient:
+    """
+    Pooled HTTP client shared by the web rules.
+
+    Args:
+        pool_size: Connections kept open per host, should be at least the max_workers used.
+        http2: Use httpx with HTTP/2 rather than requests (needs httpx[http2]).
+
+    Errors from httpx are raised as the matching requests exceptions so the rules handle
+    both clients the same way.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, http2: bool = False):
+        if pool_size < 1:
+            raise SplintException("HTTP pool_size must be at least 1.")
+        self.pool_size = pool_size
+        self.http2 = http2
+        if http2:
+            try:
+                import httpx  # pylint: disable=import-outside-toplevel
+                self._client = httpx.Client(http2=True,
+                                            limits=httpx.Limits(max_connections=pool_size,
+                                                                max_keepalive_connections=pool_size))
+            except ImportError as error:
+                raise SplintException(f"HTTP/2 requires httpx[http2]: {error}") from error
+            self._httpx = httpx
+        else:
+            self._client = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self._client.mount("http://", adapter)
+            self._client.mount("https://", adapter)
+            self._httpx = None
+
+    def get(self, url: str, timeout: float):
+        """GET url, the response has status_code and json() with either client."""
+        if self._httpx is None:
+            return self._client.get(url, timeout=timeout)
+        try:
+            return self._client.get(url, timeout=timeout)
+        except self._httpx.TimeoutException as ex:
+            raise requests.exceptions.Timeout(str(ex)) from ex
+        except (self._httpx.HTTPError, self._httpx.InvalidURL) as ex:
+            raise RequestException(str(ex)) from ex
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+
+_default_client: SplintHttpClient | None = None
+_retired_clients: list[SplintHttpClient] = []
+_default_client_lock = threading.Lock()
+
+
+def default_http_client(pool_size: int = DEFAULT_POOL_SIZE) -> SplintHttpClient:
+    """
+    The client used by the web rules when none is given, created on first use.
+
+    The client is replaced by a larger one when pool_size is more than it holds.  The old client
+    may still be in use by other checks, so it is only closed by close_default_http_client.
+    """
+    global _default_client  # pylint: disable=global-statement
+    with _default_client_lock:
+        if _default_client is None or _default_client.pool_size < pool_size:
+            if _default_client is not None:
+                _retired_clients.append(_default_client)
+            _default_client = SplintHttpClient(pool_size=max(pool_size, DEFAULT_POOL_SIZE))
+        return _default_client
+
+
+def close_default_http_client() -> None:
+    """Close the shared client's connections, the next check opens a new one.  Runs at exit."""
+    global _default_client  # pylint: disable=global-statement
+    with _default_client_lock:
+        clients = _retired_clients + ([_default_client] if _default_client is not None else [])
+        _retired_clients.clear()
+        _default_client = None
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_default_http_client)
+
 
-def rule_url_200(urls:str|Sequence[str], expected_status=200, timeout_sec=5):
+def _client_for(client: SplintHttpClient | None, max_workers: int) -> SplintHttpClient:
+    """client, or the shared client, with a pool big enough for max_workers checks at a time."""
+    if client is None:
+        return default_http_client(max_workers)
+    if client.pool_size < max_workers:
+        raise SplintException(f"HTTP client pool_size {client.pool_size} is smaller than max_workers {max_workers}.")
+    return client
+
+
+def _fan_out(check: Callable[..., SR], items: Sequence[tuple], max_workers: int, ordered: bool):
+    """Yield check(*item) for each item, up to max_workers at a time."""
+    if max_workers < 1:
+        raise SplintException("max_workers must be at least 1 for URL checks.")
+    if max_workers == 1 or len(items) <= 1:
+        for item in items:
+            yield check(*item)
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        futures = [pool.submit(check, *item) for item in items]
+        for future in (futures if ordered else as_completed(futures)):
+            yield future.result()
+
+
+def _check_url(client: SplintHttpClient, url: str, expected_status: int, timeout_sec: float) -> SR:
+    try:
+        response = client.get(url, timeout=timeout_sec)
+        url_str = SM.code(url)
+        code_str = SM.code(response.status_code)
+
+        if response.status_code == expected_status:
+            return SR(status=True, msg=f"URL {url_str} returned {code_str}")
+        return SR(
+            status=response.status_code == expected_status,
+            msg=f"URL {url_str} returned {code_str}",
+        )
+
+    except RequestException as ex:
+        return SR(status=False, msg=f"URL{SM.code(url)} exception.", except_=ex)
+
+
+def rule_url_200(urls:str|Sequence[str],
+                 expected_status=200,
+                 timeout_sec=5,
+                 max_workers: int = DEFAULT_URL_WORKERS,
+                 ordered: bool = True,
+                 client: SplintHttpClient | None = None):
     """
     Simple rule check to verify that URL is active.
     
@@ -29,6 +181,9 @@ def rule_url_200(urls:str|Sequence[str], expected_status=200, timeout_sec=5):
     urls(str|Sequence[str]): List of URLs to check or a string that can be split into URLs
     expected_status(200): Expected response status code
     timeout_sec(int): Timeout in seconds.
+    max_workers(1): Number of URLs checked at the same time.
+    ordered(True): Yield results in URL order, if False as soon as each URL responds.
+    client(None): SplintHttpClient to use, defaults to the shared pooled client.
     
     """
 
@@ -36,22 +191,11 @@ def rule_url_200(urls:str|Sequence[str], expected_status=200, timeout_sec=5):
     if isinstance(urls, str):
         urls = urls.replace(","," ").split()
 
-    for url in urls:
-        try:
-            response = requests.get(url, timeout=timeout_sec)
-            url_str = SM.code(url)
-            code_str = SM.code(response.status_code)
-
-            if response.status_code == expected_status:
-                yield SR(status=True, msg=f"URL {url_str} returned {code_str}")
-            else:
-                yield SR(
-                    status=response.status_code == expected_status,
-                    msg=f"URL {url_str} returned {code_str}",
-                )
-
-        except RequestException as ex:
-            yield SR(status=False, msg=f"URL{SM.code(url)} exception.", except_=ex)
+    client = _client_for(client, max_workers)
+    yield from _fan_out(_check_url,
+                        [(client, url, expected_status, timeout_sec) for url in urls],
+                        max_workers,
+                        ordered)
 
 
 def is_mismatch(dict1, dict2):
@@ -79,22 +223,23 @@ def is_mismatch(dict1, dict2):
     return None  # Return None if it is a subset.
 
 
-def rule_web_api(url: str, json_d: dict, timeout_sec=5, expected_response=200, timeout_expected=False):
-    """Simple rule check to verify that URL is active and handles timeouts."""
-
+def _check_web_api(client: SplintHttpClient,
+                   url: str,
+                   json_d: dict,
+                   timeout_sec: float,
+                   expected_response: int,
+                   timeout_expected: bool) -> SR:
     try:
 
-        response = requests.get(url, timeout=timeout_sec)
+        response = client.get(url, timeout=timeout_sec)
 
         if response.status_code != expected_response:
-            yield SR(status=False, msg=f"URL {SM.code(url)} expected {SM.expected(expected_response)} returned {SM.actual(response.status_code)} ")
-            return
+            return SR(status=False, msg=f"URL {SM.code(url)} expected {SM.expected(expected_response)} returned {SM.actual(response.status_code)} ")
 
         # This handles an expected failure by return true but not checking the json
         if expected_response != 200:
-            yield SR(status=True,
-                     msg=f"URL {SM.code(url)} returned {SM.code(response.status_code)}, no JSON comparison needed.")
-            return
+            return SR(status=True,
+                      msg=f"URL {SM.code(url)} returned {SM.code(response.status_code)}, no JSON comparison needed.")
 
         response_json: dict = response.json()
         # d_status = verify_dicts(response_json, json_d)
@@ -102,11 +247,51 @@ def rule_web_api(url: str, json_d: dict, timeout_sec=5, expected_response=200, t
         d_status = is_mismatch(json_d, response_json)
 
         if d_status is None:
-            yield SR(status=True,
-                     msg=f"URL {SM.code(url)} returned the expected JSON {SM.code(json_d)}")
-        else:
-            yield SR(status=False,
-                     msg=f"URL {SM.code(url)} did not match at key {d_status}")
-    
+            return SR(status=True,
+                      msg=f"URL {SM.code(url)} returned the expected JSON {SM.code(json_d)}")
+        return SR(status=False,
+                  msg=f"URL {SM.code(url)} did not match at key {d_status}")
+
     except (requests.exceptions.ReadTimeout, requests.exceptions.Timeout):  # pragma: no cover
-        yield SR(status=timeout_expected, msg=f"URL {SM.code(url)} timed out.")
+        return SR(status=timeout_expected, msg=f"URL {SM.code(url)} timed out.")
+
+
+def rule_web_api(url: str,
+                 json_d: dict,
+                 timeout_sec=5,
+                 expected_response=200,
+                 timeout_expected=False,
+                 client: SplintHttpClient | None = None):
+    """Simple rule check to verify that URL is active and handles timeouts."""
+    yield _check_web_api(_client_for(client, 1), url, json_d, timeout_sec, expected_response,
+                         timeout_expected)
+
+
+def _check_web_api_safe(client: SplintHttpClient, url: str, *args) -> SR:
+    """_check_web_api that turns connection errors into a failed result."""
+    try:
+        return _check_web_api(client, url, *args)
+    except RequestException as ex:
+        return SR(status=False, msg=f"URL {SM.code(url)} exception.", except_=ex)
+
+
+def rule_web_apis(checks: dict[str, dict] | Iterable[tuple[str, dict]],
+                  timeout_sec=5,
+                  expected_response=200,
+                  timeout_expected=False,
+                  max_workers: int = DEFAULT_URL_WORKERS,
+                  ordered: bool = True,
+                  client: SplintHttpClient | None = None):
+    """
+    rule_web_api for many (url, expected JSON) pairs, given as a dict or a sequence of pairs.
+
+    Unlike rule_web_api a URL that can't be reached is a failed result rather than an
+    exception, so one bad host doesn't stop the other checks.
+    """
+    pairs = checks.items() if isinstance(checks, dict) else checks
+    client = _client_for(client, max_workers)
+    yield from _fan_out(_check_web_api_safe,
+                        [(client, url, json_d, timeout_sec, expected_response, timeout_expected)
+                         for url, json_d in pairs],
+                        max_workers,
+                        ordered)
@@ -27,9 +27,18 @@ DEFAULT_FINISH_ON_FAIL = False  # If a splint function yields fail result stop p
 DEFAULT_SKIP_ON_NONE = False
 DEFAULT_FAIL_ON_NONE = False
 DEFAULT_INDEX = 1  # All splint functions are given an index of 1 when created.
+DEFAULT_TIMEOUT_SEC = 0  # Time budget in seconds for check functions, 0 means no limit.
+DEFAULT_DEPENDS_ON: list[str] = []  # Ruids of functions that must pass before a function runs.
+DEFAULT_PROVIDES = None  # Env keys an env function returns, None means unknown so it always runs.
+DEFAULT_REQUIRES: list[str] = []  # Env keys an env function reads from the environment it is handed.
+DEFAULT_ENV_SCOPE = "run"  # How long env function values are kept, see ENV_SCOPES.
+DEFAULT_TEARDOWN = None  # Called with the values of an env function when they are discarded.
 
+# run: built for every run, session: kept by the checker, module: kept by the module and shared by every checker.
+ENV_SCOPES = ("run", "session", "module")
 
-def _parse_ttl_string(input_string: str) -> float:
+
+def _parse_ttl_string(input_string: str, default_unit: str = "m") -> float:
     """
     Use regular expression to match a TTL string.  This pattern was a pain to figure out.  There
     are so many permutations that need to be handled that are subtle (like the order matters in the
@@ -37,6 +46,7 @@ def _parse_ttl_string(input_string: str) -> float:
 
     Args:
         input_string (str): The input string to parse.
+        default_unit (str): The unit used when the string doesn't have one.  Defaults to minutes.
 
     Returns:
         Tuple[Optional[float], Optional[str]]: A tuple containing the parsed floating-point number
@@ -61,7 +71,7 @@ def _parse_ttl_string(input_string: str) -> float:
     matches = re.findall(pattern, input_string)
     if len(matches) == 1 and len(matches[0]) == 2:
         if matches[0][1] == '':
-            unit = "m"
+            unit = default_unit
         else:
             unit = matches[0][1]
         number = float(matches[0][0]) / scale[unit]
@@ -72,6 +82,30 @@ def _parse_ttl_string(input_string: str) -> float:
     return 0.0
 
 
+def _parse_timeout_string(input_string: str) -> float:
+    """
+    Timeouts use the same strings as TTLs ("30s", "2min", ".5hr") but are stored in
+    seconds and a number without units is assumed to be in seconds.
+
+    Args:
+        input_string (str): The input string to parse.
+
+    Returns:
+        float: The timeout in seconds.
+    """
+    return _parse_ttl_string(input_string, default_unit="s") * 60.0
+
+
+def _name_list(names, name: str) -> list[str]:
+    """Lists of names (ruids, env keys) may be given as a single string or any iterable of strings."""
+    if isinstance(names, str):
+        names = [names]
+    names = list(names)
+    if not all(isinstance(item, str) and item for item in names):
+        raise SplintException(f"{name} must be a list of non-empty strings.")
+    return names
+
+
 def attributes(
         *,
         tag=DEFAULT_TAG,
@@ -84,6 +118,8 @@ def attributes(
         finish_on_fail=DEFAULT_FINISH_ON_FAIL,  # Abort the whole run
         skip_on_none=DEFAULT_SKIP_ON_NONE,
         fail_on_none=DEFAULT_FAIL_ON_NONE,
+        timeout=DEFAULT_TIMEOUT_SEC,
+        depends_on=None,
 
 ):
     """
@@ -94,6 +130,8 @@ def attributes(
 
     # throws exception on bad input
     ttl_minutes = _parse_ttl_string(str(ttl_minutes))
+    timeout = _parse_timeout_string(str(timeout))
+    depends_on = _name_list(depends_on or [], "depends_on")
 
     if weight in [None, True, False] or weight <= 0:
         raise SplintException("Weight must be numeric and > than 0.0.  Nominal value is 100.0.")
@@ -116,6 +154,61 @@ def attributes(
         func.finish_on_fail = finish_on_fail
         func.skip_on_none = skip_on_none
         func.fail_on_none = fail_on_none
+        func.timeout = timeout
+        func.depends_on = depends_on
+        return func
+
+    return decorator
+
+
+def env(*, provides=DEFAULT_PROVIDES, requires=None, scope=DEFAULT_ENV_SCOPE, teardown=DEFAULT_TEARDOWN,
+        ttl_minutes=DEFAULT_TTL_MIN):
+    """
+    Decorator to describe what an environment function builds and how long it is kept.
+
+    By default, every env function is called before a run since there is no way to know
+    what it will return.  If an env function declares the keys it provides, the checker only
+    calls it when one of the collected check functions has a parameter with that name, so
+    filtered runs don't pay for database connections or files they never use.
+
+    If the env function reads values built by an earlier env function, list those keys in
+    requires so they get built too.
+
+    Much like pytest fixtures, env functions can be scoped.  By default, they are called for
+    every run, "session" values are kept by the checker for all of its runs and "module" values
+    are kept by the module, so every checker using the module shares them.  Kept values are
+    rebuilt after ttl_minutes (0 means never) and teardown is called with the dictionary the
+    env function returned when they are discarded.
+
+    @env(provides=["db_engine"], scope="session", teardown=lambda env: env["db_engine"].dispose())
+    def env_database(_):
+        return {"db_engine": create_engine(URL)}
+
+    Args:
+        provides: Names of the keys in the dictionary the function returns.
+        requires: Names of the environment keys the function reads.
+        scope: One of "run", "session" or "module".
+        teardown: Function called with the returned dictionary when it is discarded.
+        ttl_minutes: How long session/module values are kept, same format as the ttl_minutes attribute.
+    """
+    if provides is not None:
+        provides = _name_list(provides, "Env provides")
+    requires = _name_list(requires or [], "Env requires")
+
+    if scope not in ENV_SCOPES:
+        raise SplintException(f"Invalid env scope '{scope}', must be one of {ENV_SCOPES}")
+    if teardown is not None and not callable(teardown):
+        raise SplintException("Env teardown must be callable.")
+
+    # throws exception on bad input
+    ttl_minutes = _parse_ttl_string(str(ttl_minutes))
+
+    def decorator(func):
+        func.provides = provides
+        func.requires = requires
+        func.scope = scope
+        func.teardown = teardown
+        func.ttl_minutes = ttl_minutes
         return func
 
     return decorator
@@ -137,6 +230,12 @@ def get_attribute(func, attr, default_value=None):
         "skip_on_none": DEFAULT_SKIP_ON_NONE,
         "fail_on_none": DEFAULT_FAIL_ON_NONE,
         "index": DEFAULT_INDEX,
+        "timeout": DEFAULT_TIMEOUT_SEC,
+        "depends_on": DEFAULT_DEPENDS_ON,
+        "provides": DEFAULT_PROVIDES,
+        "requires": DEFAULT_REQUIRES,
+        "scope": DEFAULT_ENV_SCOPE,
+        "teardown": DEFAULT_TEARDOWN,
     }
 
     default = default_value or defs[attr]
@@ -0,0 +1,273 @@
+"""
+Pluggable storage for TTL cached results.
+
+By default, functions with a `ttl_minutes` attribute keep their last results in memory on the
+SplintFunction object.  That cache is lost every time the process exits and isn't shared
+between processes (CLI runs, uvicorn workers, process pools).  The classes here move those
+results into a cache object that the checker hands to each function:
+
+- SplintMemoryCache: In process dictionary with LRU eviction.
+- SplintSqliteCache: SQLite database file, safe to share between processes.
+- SplintFileCache: One file per entry in a folder, read back using mmap.
+
+Entries are keyed by rule id, module, function name and a fingerprint of the arguments the
+function was called with (see splint_fingerprint), and they are evicted when their TTL expires
+or when the cache holds more than max_entries.
+"""
+
+import hashlib
+import mmap
+import os
+import pathlib
+import pickle
+import sqlite3
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+
+from .splint_exception import SplintException
+from .splint_result import SplintResult
+
+DEFAULT_MAX_ENTRIES = 1000
+
+
+def _dumps(results: list[SplintResult]) -> bytes | None:
+    """Pickle results, results that can't be pickled (odd exceptions) just aren't cached."""
+    try:
+        return pickle.dumps(results)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+class SplintCache(ABC):
+    """
+    Base class for TTL result caches.
+
+    Subclasses only need to support get/set/delete/clear.  Expiration times are absolute
+    time.time() values so they mean the same thing in every process.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise SplintException("Cache max_entries must be at least 1.")
+        self.max_entries = max_entries
+
+    @abstractmethod
+    def get(self, key: str) -> list[SplintResult] | None:  # pragma: no cover
+        """Return the cached results for key or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, results: list[SplintResult], ttl_sec: float) -> None:  # pragma: no cover
+        """Store results for key for ttl_sec seconds."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:  # pragma: no cover
+        """Remove a single key."""
+
+    @abstractmethod
+    def clear(self) -> None:  # pragma: no cover
+        """Remove everything in the cache."""
+
+    @abstractmethod
+    def __len__(self) -> int:  # pragma: no cover
+        """Number of entries, possibly including expired ones."""
+
+
+class SplintMemoryCache(SplintCache):
+    """
+    In-memory cache shared by every function that uses it.
+
+    Results are stored as is (no pickling), so cached results are the same objects that
+    were originally yielded, just like the built-in cache.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        super().__init__(max_entries)
+        self._data: OrderedDict[str, tuple[float, list[SplintResult]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks can't be pickled, this is needed to send functions to a process pool.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> list[SplintResult] | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, results = entry
+            if expires <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return list(results)
+
+    def set(self, key: str, results: list[SplintResult], ttl_sec: float) -> None:
+        with self._lock:
+            self._data[key] = (time.time() + ttl_sec, list(results))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SplintSqliteCache(SplintCache):
+    """
+    Cache stored in a SQLite database.
+
+    A new connection is made for each operation so one object can be used from many threads,
+    and SQLite's locking makes it safe for several processes to use the same file.
+    """
+
+    def __init__(self, path: str | pathlib.Path, max_entries: int = DEFAULT_MAX_ENTRIES, timeout_sec: float = 10.0):
+        super().__init__(max_entries)
+        self.path = str(path)
+        self.timeout_sec = timeout_sec
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS splint_cache "
+                         "(key TEXT PRIMARY KEY, expires REAL, stored REAL, payload BLOB)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connect, commit on success and always close."""
+        conn = sqlite3.connect(self.path, timeout=self.timeout_sec)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> list[SplintResult] | None:
+        with self._connect() as conn:
+            row = conn.execute("SELECT expires, payload FROM splint_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        expires, payload = row
+        if expires <= time.time():
+            self.delete(key)
+            return None
+        return pickle.loads(payload)
+
+    def set(self, key: str, results: list[SplintResult], ttl_sec: float) -> None:
+        payload = _dumps(results)
+        if payload is None:
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO splint_cache VALUES (?, ?, ?, ?)",
+                         (key, now + ttl_sec, now, payload))
+            conn.execute("DELETE FROM splint_cache WHERE expires <= ?", (now,))
+            conn.execute("DELETE FROM splint_cache WHERE key NOT IN "
+                         "(SELECT key FROM splint_cache ORDER BY stored DESC LIMIT ?)", (self.max_entries,))
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM splint_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM splint_cache")
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM splint_cache").fetchone()[0]
+
+
+class SplintFileCache(SplintCache):
+    """
+    Cache stored as one file per entry in a folder.
+
+    Each file holds the expiration time followed by the pickled results.  Files are written
+    to a temporary name and renamed into place, so readers in other processes never see a
+    partial file, and they are read with mmap so only the header is touched for expired entries.
+
+    Counting the files means listing the folder, so the size is only checked every
+    max_entries // 10 writes and the folder can briefly hold up to 10% more than max_entries.
+    """
+
+    _header = struct.Struct("<d")
+
+    def __init__(self, folder: str | pathlib.Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        super().__init__(max_entries)
+        self.folder = pathlib.Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self._evict_every = max(1, max_entries // 10)
+        self._writes = 0
+
+    def _file(self, key: str) -> pathlib.Path:
+        return self.folder / f"{hashlib.sha256(key.encode()).hexdigest()}.splint"
+
+    def _files(self) -> list[pathlib.Path]:
+        return list(self.folder.glob("*.splint"))
+
+    def get(self, key: str) -> list[SplintResult] | None:
+        file = self._file(key)
+        try:
+            with open(file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                (expires,) = self._header.unpack_from(mm, 0)
+                if expires > time.time():
+                    return pickle.loads(mm[self._header.size:])
+        except (FileNotFoundError, ValueError, struct.error):
+            # ValueError/struct.error are empty or truncated files.
+            return None
+        self.delete(key)
+        return None
+
+    def set(self, key: str, results: list[SplintResult], ttl_sec: float) -> None:
+        payload = _dumps(results)
+        if payload is None:
+            return
+        file = self._file(key)
+        tmp = file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(self._header.pack(time.time() + ttl_sec) + payload)
+        os.replace(tmp, file)
+        self._writes += 1
+        if self._writes >= self._evict_every:
+            self._writes = 0
+            self._evict()
+
+    def _evict(self):
+        """Remove the oldest files once there are too many."""
+        files = self._files()
+        if len(files) <= self.max_entries:
+            return
+        for file in sorted(files, key=self._mtime)[:len(files) - self.max_entries]:
+            file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _mtime(file: pathlib.Path) -> float:
+        """Modification time, another process may have already removed the file."""
+        try:
+            return file.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    def delete(self, key: str) -> None:
+        self._file(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for file in self._files():
+            file.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._files())
@@ -2,16 +2,23 @@
 This class manages running the checker against a list of functions.
 There is also support for low level progress for functions/classes.
 """
+import asyncio
 import datetime as dt
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Sequence
-
-import pandas as pd
-
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Sequence
+
+from .splint_attribute import _parse_timeout_string, get_attribute
+from .splint_cache import SplintCache
+from .splint_dag import SplintDag, results_passed
+from .splint_env import SplintEnvStore
 from .splint_exception import SplintException
 from .splint_format import SplintAbstractRender, SplintRenderText
 from .splint_function import SplintFunction
-from .splint_immutable import SplintEnvDataFrame, SplintEnvDict, SplintEnvList, SplintEnvSet
+from .splint_immutable import SplintEnvDict, SplintEnvList, SplintEnvSet
+from .splint_index import SplintFunctionIndex
 from .splint_module import SplintModule
 from .splint_package import SplintPackage
 from .splint_rc import SplintRC
@@ -19,6 +26,15 @@ from .splint_result import SplintResult
 from .splint_ruid import empty_ruids, ruid_issues, valid_ruids
 from .splint_score import ScoreByResult, ScoreStrategy
 
+if TYPE_CHECKING:
+    from .splint_result_table import SplintResultTable
+
+# Messages sent to the progress callback, see SplintBatchedProgress which relies on them.
+PROGRESS_START = "Start Rule Check"
+PROGRESS_FUNC_START = "Func Start"
+PROGRESS_FUNC_DONE = "Func done."
+PROGRESS_COMPLETE = "Rule Check Complete."
+
 
 # pylint: disable=R0903
 class SplintProgress(ABC):
@@ -112,6 +128,9 @@ def _param_int_list(params: list[str] | list[int] | int | str | None) -> list[in
 
     """
 
+    if params is None:
+        return []
+
     if isinstance(params, int):
         return [params]
 
@@ -201,6 +220,33 @@ def keep_phases(phases: list[str]):
     return filter_func
 
 
+# Supported ways of running the collected functions.
+EXECUTOR_SERIAL = "serial"
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTORS = (EXECUTOR_SERIAL, EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
+# Default number of functions allowed in flight at once for async runs.
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+def _collect_function_results(function_: SplintFunction) -> list[SplintResult]:
+    """
+    Run a splint function to completion and return all of its results.
+
+    This is the unit of work handed to the thread/process pools.  It needs to live at
+    module level so that it can be pickled when running with a process pool. Since
+    the pool worker is the only place that can stop a generator early, finish_on_fail
+    is handled here rather than in the checker loop.
+    """
+    results = []
+    for result in function_():
+        results.append(result)
+        if function_.finish_on_fail and result.status is False:
+            break
+    return results
+
+
 def debug_progress(count, msg: str | None = None, result: SplintResult | None = None
                    ):  # pylint: disable=unused-argument
     """Print a debug message."""
@@ -240,6 +286,13 @@ class SplintChecker:
             abort_on_exception=False,
             auto_setup: bool = False,
             auto_ruid: bool = False,
+            executor: str = EXECUTOR_SERIAL,
+            max_workers: int | None = None,
+            ordered: bool = False,
+            timeout: float | str = 0,
+            cache: SplintCache | None = None,
+            compact_results: bool = False,
+            result_table: bool = False,
     ):
         """
 
@@ -260,6 +313,20 @@ class SplintChecker:
             abort_on_exception: A bool flag indicating whether to abort on exceptions. def=False.
             auto_setup: A bool flag automatically invoke pre_collect/prepare. def=False.
             auto_ruid: A bool flag automatically generate rule_ids if they don't exist.
+            executor: How to run the collected functions, "serial", "thread" or "process".
+                      def = "serial".
+            max_workers: Maximum number of workers for the thread/process pools.
+                         If not provided, the concurrent.futures default is used.
+            ordered: When running concurrently, yield results in the collected (index) order
+                     rather than as functions complete. def=False.
+            timeout: Default time budget for functions without a timeout attribute, in seconds
+                     or as a string like "30s" or "2min". def=0 (no limit).
+            cache: Storage used by functions with a TTL.  If not provided, each function
+                   keeps its own results in memory.
+            compact_results: Make memory efficient slotted results that share the function
+                             level values (doc, ruid, tag...). def=False.
+            result_table: Also store the results in a columnar SplintResultTable (requires
+                          numpy) that the counts use. def=False.
         Raises:
             SplintException: If the provided packages, modules, or check_functions 
                              are not in the correct format.
@@ -274,6 +341,11 @@ class SplintChecker:
         self.score_strategy = score_strategy or ScoreByResult()
         self.score = 0.0
 
+        # Running totals (result/pass/fail/skip/warn/error) and score, updated as results are
+        # yielded so they can be shown live and the count properties don't rescan the results.
+        self.counts: Counter = Counter()
+        self._counted_results: list[SplintResult] | None = None
+
         # Allow an RC object to be specified.
         self.rc = rc
 
@@ -292,6 +364,11 @@ class SplintChecker:
         # THis dict has the environment values that are NULL
         self.env_nulls: dict[str, Any] = {}
 
+        # Values built by scoped env functions.  Session values are kept until close() while
+        # run values are torn down at the end of every run.
+        self.session_env = SplintEnvStore()
+        self.run_env = SplintEnvStore()
+
         # Connect the progress output to the checker object.  The NoProgress
         # class is a dummy class that does no progress reporting.
         self.progress_callback: SplintProgress = progress_object or SplintNoProgress()
@@ -302,10 +379,37 @@ class SplintChecker:
         # If any exception occurs stop processing
         self.abort_on_exception = abort_on_exception
 
+        # Concurrency settings.  Serial is the default because many rule functions are not
+        # written with threads in mind, and process pools require everything to pickle.
+        if executor not in EXECUTORS:
+            raise SplintException(f"Invalid executor '{executor}', must be one of {EXECUTORS}")
+        self.executor = executor
+        self.max_workers = max_workers
+        self.ordered = ordered
+
+        # Checker wide time budget for functions that don't set their own.
+        self.timeout = _parse_timeout_string(str(timeout))
+
+        # Shared storage for TTL results, e.g. SQLite so they survive restarts and are shared
+        # between processes.
+        self.cache = cache
+
+        # Runs with millions of results can use slotted results, see SplintCompactResult
+        self.compact_results = compact_results
+
+        # Columnar copy of the results for fast counting/grouping, rebuilt for every run.
+        self.use_result_table = result_table
+        self.result_table: "SplintResultTable | None" = None
+
         # These two have the collection of all checker functions from packages, modules, and adhoc
-        self.collected: list[SplintFunction] = []
+        self._collected: list[SplintFunction] = []
+        self._index: SplintFunctionIndex | None = None
+        self._prepared_index: SplintFunctionIndex | None = None
         self.pre_collected: list[SplintFunction] = []
 
+        # Dependencies between the collected functions for the current run
+        self._dag = SplintDag([])
+
         self.start_time = dt.datetime.now()
         self.end_time = dt.datetime.now()
         self.results: list[SplintResult] = []
@@ -323,11 +427,39 @@ class SplintChecker:
             self.pre_collect()
             self.prepare()
 
+    @property
+    def collected(self) -> list[SplintFunction]:
+        """The functions that will be run."""
+        return self._collected
+
+    @collected.setter
+    def collected(self, functions: list[SplintFunction]):
+        # Any change to the collected functions makes the index stale, unless the list is
+        # the one prepare() built, which is common when running subsets and then restoring.
+        self._collected = functions
+        if self._prepared_index is not None and functions is self._prepared_index.functions:
+            self._index = self._prepared_index
+        else:
+            self._index = None
+
+    @property
+    def index(self) -> SplintFunctionIndex:
+        """
+        Attribute index over the collected functions, built on first use after each change.
+        Assigning collected resets it, the length check catches functions appended in place.
+        """
+        if self._index is None or len(self._index) != len(self._collected):
+            self._index = SplintFunctionIndex(self._collected)
+        return self._index
+
     @staticmethod
     def _make_immutable_env(env: dict) -> dict:
         """
         Converts mutable containers in a dictionary to immutable versions.
         """
+        # If pandas hasn't been imported there can't be any DataFrames, so don't import it.
+        pd = sys.modules.get("pandas")
+
         for key, value in env.items():
 
             # Detect mutable objects and convert them to immutable ones
@@ -335,7 +467,8 @@ class SplintChecker:
                 env[key] = SplintEnvList(value)
             elif isinstance(value, dict):
                 env[key] = SplintEnvDict(value)
-            elif isinstance(value, pd.DataFrame):
+            elif pd is not None and isinstance(value, pd.DataFrame):
+                from .splint_immutable_df import SplintEnvDataFrame  # pylint: disable=import-outside-toplevel
                 env[key] = SplintEnvDataFrame(value)
             elif isinstance(value, set):
                 env[key] = SplintEnvSet(value)
@@ -434,10 +567,8 @@ class SplintChecker:
         # At this point we have all the functions in the packages, modules and functions
         # Now we need to filter out the ones that are not wanted. Filter functions return
         # True if the function should be kept
-        self.collected = []
-        for splint_func in self.pre_collected:
-            if all(f(splint_func) for f in filter_functions):
-                self.collected.append(splint_func)
+        self.collected = [splint_func for splint_func in self.pre_collected
+                          if all(f(splint_func) for f in filter_functions)]
 
         # Now use the RC file.  Note that if you are running filter functions AND
         # an RC file this can be confusing.  Ideally you use one or the other. but
@@ -453,13 +584,26 @@ class SplintChecker:
 
         # If the user decided to set up ruids for every function OR if they didn't configure
         # any ruids then we can just run with the collected functions.
-        if empty_ruids(ruids) or valid_ruids(ruids):
-            return self.collected
+        if not (empty_ruids(ruids) or valid_ruids(ruids)):
+            # Otherwise there is a problem.
+            raise SplintException(
+                f"There are duplicate or missing RUIDS: {ruid_issues(ruids)}"
+            )
+
+        # Functions run after the functions they depend on.  Building the graph here means
+        # bad dependencies (cycles, unknown ruids) are found before anything runs.
+        self._dag = self._make_dag().in_run_order()
+        self.collected = list(self._dag.functions)
+
+        # Build the attribute index now so selecting functions and the header are fast.
+        self._prepared_index = self.index
+        return self.collected
 
-        # Otherwise there is a problem.
-        raise SplintException(
-            f"There are duplicate or missing RUIDS: {ruid_issues(ruids)}"
-        )
+    def _make_dag(self) -> SplintDag:
+        """Build the dependency graph for the collected functions."""
+        if not any(f.depends_on for f in self.collected):
+            return SplintDag(self.collected)
+        return SplintDag(self.collected, known_ruids={f.ruid for f in self.pre_collected})
 
     def auto_gen_ruids(self, template='__ruid__@id@'):
         """ Provide a mechanism for to transition from no ruids to ruids.  This way they
@@ -502,10 +646,8 @@ class SplintChecker:
         levels = _param_int_list(levels)
 
         # Exclude attributes that don't match
-        self.collected = [f for f in self.collected if f.tag not in tags and
-                          f.ruid not in ruids and
-                          f.level not in levels and
-                          f.phase not in phases]
+        excluded = set(map(id, self.index.select(tags=tags, ruids=ruids, levels=levels, phases=phases)))
+        self.collected = [f for f in self.collected if id(f) not in excluded]
         return self.collected
 
     def include_by_attribute(self,
@@ -526,10 +668,7 @@ class SplintChecker:
             return self.collected
 
         # Only include the attributes that match
-        self.collected = [f for f in self.collected if (f.tag in tags) or
-                          (f.ruid in ruids) or
-                          (f.level in levels) or
-                          (f.phase in phases)]
+        self.collected = self.index.select(tags=tags, ruids=ruids, levels=levels, phases=phases)
 
         return self.collected
 
@@ -541,18 +680,29 @@ class SplintChecker:
 
         This works very much like pytest, only without the scoping Parameters
         that are needed in multiple places aren't regenerated.
+
+        Env functions that declare what they provide (see splint.env) are only called
+        if a collected function needs one of those values, and scoped env functions are
+        only called if their values aren't already stored.
         Returns:
 
         """
 
+        # Anything left over from a run that was never finished.
+        self.run_env.clear()
+
         # Prime the environment with top level config
         # This should be json-able things
         full_env = self.env.copy()
 
-        for m in self.modules:
-            for env_func in m.env_functions:
-                # TODO: There should be exceptions on collisions
-                full_env.update(env_func(full_env))
+        for module, env_func in self.needed_env_functions():
+            store = self._env_store(module, env_func)
+            values = store.get(env_func)
+            if values is None:
+                values = env_func(full_env)
+                store.set(env_func, values, get_attribute(env_func, "ttl_minutes") * 60.0)
+            # TODO: There should be exceptions on collisions
+            full_env.update(values)
 
         # This is a concern, there should be no nulls, HOWEVER this is more complex
         # since there should be no nulls for parameters to the collected check functions.
@@ -561,6 +711,51 @@ class SplintChecker:
 
         return full_env
 
+    def required_env_keys(self) -> set[str]:
+        """Return the names of all the parameters of the collected functions."""
+        return {name for function_ in self.collected for name in function_.parameters}
+
+    def needed_env_functions(self) -> list[tuple[SplintModule, Any]]:
+        """
+        Return the (module, env function) pairs that need to be called for the collected
+        functions, in the order they are called.
+
+        Env functions that don't declare what they provide always run.  The list is walked
+        backwards so the keys required by a needed env function pull in the earlier env
+        functions that build them.
+        """
+        env_functions = [(m, env_func) for m in self.modules for env_func in m.env_functions]
+        needed_keys = self.required_env_keys()
+        needed = []
+        for module, env_func in reversed(env_functions):
+            provides = get_attribute(env_func, "provides")
+            if provides is None or needed_keys.intersection(provides):
+                needed.append((module, env_func))
+                needed_keys.update(get_attribute(env_func, "requires"))
+        return needed[::-1]
+
+    def _env_store(self, module: SplintModule, env_func) -> SplintEnvStore:
+        """The store that keeps the values of an env function for its scope."""
+        scope = get_attribute(env_func, "scope")
+        if scope == "session":
+            return self.session_env
+        if scope == "module":
+            return module.env_store
+        return self.run_env
+
+    def close(self):
+        """Tear down the values of the run and session scoped env functions."""
+        try:
+            self.run_env.clear()
+        finally:
+            self.session_env.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     @property
     def ruids(self):
         """
@@ -569,8 +764,7 @@ class SplintChecker:
         Returns:
             _type_: _description_
         """
-        r = sorted(set(f.ruid for f in self.collected))
-        return r
+        return list(self.index.ruids)
 
     @property
     def levels(self):
@@ -580,7 +774,7 @@ class SplintChecker:
         Returns:
             _type_: _description_
         """
-        return sorted(set(f.level for f in self.collected))
+        return list(self.index.levels)
 
     @property
     def tags(self):
@@ -590,7 +784,7 @@ class SplintChecker:
         Returns:
             _type_: _description_
         """
-        return sorted(set(f.tag for f in self.collected))
+        return list(self.index.tags)
 
     @property
     def phases(self):
@@ -600,7 +794,7 @@ class SplintChecker:
         Returns:
             _type_: _description_
         """
-        return sorted(set(f.phase for f in self.collected))
+        return list(self.index.phases)
 
     class AbortYieldException(Exception):
         """Allow breaking out of multi level loop without state variables"""
@@ -609,7 +803,8 @@ class SplintChecker:
         """
         Yield all the results from the collected functions
 
-        This is where the rule engine does its work.
+        This is where the rule engine does its work.  Depending on the executor setting
+        the functions are run one after the other or fanned out to a thread/process pool.
 
         Args:
             env: The environment to use for the rule functions
@@ -622,66 +817,364 @@ class SplintChecker:
         # empty.  This is not an error condition.  It is possible
         # that the filter functions have filtered out all the
         # functions.
-        count = 0
-        self.progress_callback(count, self.function_count, "Start Rule Check")
+        self.progress_callback(0, self.function_count, PROGRESS_START)
         self.start_time = dt.datetime.now()
 
-        try:
+        self._prepare_functions()
 
-            env = self.load_environments()
+        try:
+            if self.executor == EXECUTOR_SERIAL:
+                count = yield from self._yield_serial()
+            else:
+                count = yield from self._yield_concurrent()
+        finally:
+            self.run_env.clear()
+            if self.result_table is not None:
+                self.result_table.flush()
 
-            # Shuts up linter
-            # result: SplintResult | None = None
-            # function: SplintFunction | None = None
+        self.end_time = dt.datetime.now()
+        self.progress_callback(count,
+                               self.function_count,
+                               PROGRESS_COMPLETE)
+
+    def _prepare_functions(self):
+        """Hand the environment and checker wide settings to the collected functions."""
+        env = self.load_environments()
+
+        # The graph built by prepare is reused unless the collected list has been changed
+        # since (as the API does when selecting functions).
+        if self._dag.functions != self.collected:
+            self._dag = self._make_dag()
+
+        # Lots of magic here
+        for function_ in self.collected:
+            function_.env = env
+            function_.default_timeout = self.timeout
+            if self.cache is not None:
+                function_.cache = self.cache
+            if self.compact_results:
+                function_.compact_results = True
+
+        self.counts.clear()
+        self._counted_results = None
+        self.score_strategy.reset()
+
+        if self.use_result_table:
+            # Imported here so numpy is only loaded when it is used.
+            from .splint_result_table import SplintResultTable  # pylint: disable=import-outside-toplevel
+            self.result_table = SplintResultTable()
+
+    def _render(self, result: SplintResult) -> SplintResult:
+        """Attach the renderer to the result.  The message is only rendered when msg_rendered is
+           read, so runs that never show messages (scores, JSON output) don't pay for it."""
+        if self.renderer:
+            result.defer_render(self.renderer)
+        else:
+            result.msg_rendered = result.msg
+        self._record(result)
+        return result
+
+    def _record(self, result: SplintResult):
+        """Add a yielded result to the running counts, the running score and the result table."""
+        counts = self.counts
+        counts["result"] += 1
+        if result.skipped:
+            counts["skip"] += 1
+        elif result.status:
+            counts["pass"] += 1
+        else:
+            counts["fail"] += 1
+        if result.warn_msg:
+            counts["warn"] += 1
+        if result.except_:
+            counts["error"] += 1
+        self.score_strategy.update(result)
+        if self.result_table is not None:
+            self.result_table.append(result)
+
+    def _check_abort(self, result: SplintResult):
+        """Check early exits for the whole run."""
+        if self.abort_on_fail and result.status is False:
+            raise self.AbortYieldException()
+
+        if self.abort_on_exception and result.except_:
+            raise self.AbortYieldException()
+
+    def _abort_progress(self, count: int, function_: SplintFunction | None):
+        """Report why the run was aborted."""
+        name = function_.function_name if function_ is not None else "???"
+
+        if self.abort_on_fail:
+            self.progress_callback(count,
+                                   self.function_count,
+                                   f"Abort on fail: {name}")
+        if self.abort_on_exception:
+            self.progress_callback(count,
+                                   self.function_count,
+                                   f"Abort on exception: {name}")
+
+    def _dependency_skip(self, pos: int, passed: dict[int, bool]) -> list[SplintResult]:
+        """Return a skipped result if any of the dependencies of the function at pos didn't pass."""
+        failed = self._dag.failed_dependencies(pos, passed)
+        if not failed:
+            return []
+        function_ = self._dag.functions[pos]
+        return [function_.skip_result(f"Skipped {function_.function_name}, dependencies did not pass: {failed}")]
 
+    def _yield_serial(self):
+        """Run the collected functions one after the other, returns the function count."""
+        count = 0
+        function_ = None
+        passed: dict[int, bool] = {}
+        try:
             # Count here to enable progress bars
-            for count, function_ in enumerate(self.collected, start=1):
-
-                # Lots of magic here
-                function_.env = env
+            for count, pos in enumerate(self._dag.order, start=1):
+                function_ = self._dag.functions[pos]
 
                 self.progress_callback(count,
                                        self.function_count,
-                                       f"Func Start {function_.function_name}")
-                for result in function_():
+                                       f"{PROGRESS_FUNC_START} {function_.function_name}")
+                passed[pos] = True
+                for result in self._dependency_skip(pos, passed) or function_():
+                    passed[pos] = passed[pos] and result.status is True
 
-                    # Render the message if needed.  The render happens right before it is yielded so it "knows" as 
-                    # much as possible at this point.
-                    result.msg_rendered = result.msg if not self.renderer else self.renderer.render(result.msg)
+                    yield self._render(result)
 
-                    yield result
+                    self._check_abort(result)
 
-                    # Check early exits
-                    if self.abort_on_fail and result.status is False:
-                        raise self.AbortYieldException()
+                    # Stop yielding from a function
+                    if function_.finish_on_fail and result.status is False:
+                        self.progress_callback(count, self.function_count,
+                                               f"Early exit. {function_.function_name} failed.")
+                        break
+                    self.progress_callback(count, self.function_count, "", result)
+                self.progress_callback(count, self.function_count, PROGRESS_FUNC_DONE)
 
-                    if self.abort_on_exception and result.except_:
-                        raise self.AbortYieldException()
+        except self.AbortYieldException:
+            self._abort_progress(count, function_)
+
+        return count
+
+    def _make_pool(self) -> Executor:
+        """Create the pool that matches the executor setting."""
+        if self.executor == EXECUTOR_PROCESS:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _yield_concurrent(self):
+        """
+        Fan the collected functions out to a pool and yield results as each function
+        completes (or in index order if requested).  Returns the function count.
+
+        Results are streamed a function at a time since each worker runs its function
+        to completion.  When the run is aborted, functions that haven't started are
+        cancelled and the results of functions still in flight are dropped.
+
+        NOTE: With the process executor functions run in a copy of the checker, so TTL
+              caches are not updated, and functions/environments must be picklable.
+        """
+        count = 0
+        function_ = None
+        aborted = False
+        pool = self._make_pool()
+        try:
+            completed = self._completed_functions(pool)
+            if self.ordered:
+                completed = self._in_collected_order(completed)
+            else:
+                completed = ((function_, results) for _, function_, results in completed)
+
+            for count, (function_, results) in enumerate(completed, start=1):
+                for result in results:
+
+                    yield self._render(result)
+
+                    self._check_abort(result)
 
-                    # Stop yielding from a function
                     if function_.finish_on_fail and result.status is False:
                         self.progress_callback(count, self.function_count,
                                                f"Early exit. {function_.function_name} failed.")
                         break
                     self.progress_callback(count, self.function_count, "", result)
-                self.progress_callback(count, self.function_count, "Func done.")
+                self.progress_callback(count, self.function_count, PROGRESS_FUNC_DONE)
 
         except self.AbortYieldException:
-            name = function_.function_name if function_ is not None else "???"
+            aborted = True
+            self._abort_progress(count, function_)
 
-            if self.abort_on_fail:
-                self.progress_callback(count,
-                                       self.function_count,
-                                       f"Abort on fail: {name}")
-            if self.abort_on_exception:
-                self.progress_callback(count,
-                                       self.function_count,
-                                       f"Abort on exception: {name}")
+        finally:
+            # Don't wait around for work whose results will be thrown away.
+            pool.shutdown(wait=not aborted, cancel_futures=True)
+
+        return count
+
+    def _completed_functions(self, pool: Executor):
+        """
+        Submit functions to the pool as soon as their dependencies have finished and yield
+        (position, function, results) as each function completes.  Functions whose dependencies
+        didn't pass are never submitted, they complete immediately with a skipped result.
+        """
+        dag = self._dag
+        passed: dict[int, bool] = {}
+        waiting_on = [len(deps) for deps in dag.dependencies]
+        ready = [pos for pos in dag.order if waiting_on[pos] == 0]
+        running = {}
+
+        def finish(pos: int, results: list[SplintResult]):
+            """Record the outcome of a function and queue up the dependents it unblocked."""
+            passed[pos] = results_passed(results)
+            for dependent in dag.dependents[pos]:
+                waiting_on[dependent] -= 1
+                if waiting_on[dependent] == 0:
+                    ready.append(dependent)
+            return pos, dag.functions[pos], results
+
+        while ready or running:
+            # Start everything that is ready, skipped functions finish right away.
+            while ready:
+                pos = ready.pop(0)
+                skipped = self._dependency_skip(pos, passed)
+                if skipped:
+                    yield finish(pos, skipped)
+                    continue
+                func = dag.functions[pos]
+                self.progress_callback(pos + 1, self.function_count, f"{PROGRESS_FUNC_START} {func.function_name}")
+                running[pool.submit(_collect_function_results, func)] = pos
+
+            if running:
+                future = next(as_completed(running))
+                yield finish(running.pop(future), future.result())
+
+    @staticmethod
+    def _in_collected_order(completed):
+        """Buffer completed functions and release them in collected (position) order."""
+        buffered = {}
+        next_pos = 0
+        for pos, function_, results in completed:
+            buffered[pos] = (function_, results)
+            while next_pos in buffered:
+                yield buffered.pop(next_pos)
+                next_pos += 1
+
+    async def ayield_all(self, env=None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """
+        Async version of yield_all.
+
+        All collected functions are driven from one event loop with at most max_concurrency
+        functions in flight.  Coroutine and async generator functions are awaited directly
+        while regular functions are run in a thread pool (sized by max_workers) so they
+        don't block the loop.  Results are yielded as they arrive.
+
+        Args:
+            env: The environment to use for the rule functions
+            max_concurrency: The maximum number of functions running at the same time.
+
+        Yields:
+            _type_: SplintResult
+        """
+        if max_concurrency < 1:
+            raise SplintException("max_concurrency must be at least 1.")
+
+        self.progress_callback(0, self.function_count, PROGRESS_START)
+        self.start_time = dt.datetime.now()
+
+        self._prepare_functions()
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        # Functions wait for the functions they depend on before taking a concurrency slot.
+        dag = self._dag
+        finished = [asyncio.Event() for _ in dag.functions]
+        passed: dict[int, bool] = {}
+
+        async def run_function(pos: int, func: SplintFunction):
+            """Push the results of one function onto the queue, None marks the end."""
+            outcome = True
+            try:
+                for dep in dag.dependencies[pos]:
+                    await finished[dep].wait()
+                skipped = self._dependency_skip(pos, passed)
+                if skipped:
+                    outcome = False
+                    await queue.put((func, skipped[0]))
+                    return
+                async with semaphore:
+                    self.progress_callback(pos + 1, self.function_count, f"{PROGRESS_FUNC_START} {func.function_name}")
+                    if func.is_async:
+                        results = func.acall()
+                        try:
+                            async for result in results:
+                                outcome = outcome and result.status is True
+                                await queue.put((func, result))
+                                if func.finish_on_fail and result.status is False:
+                                    break
+                        finally:
+                            await results.aclose()
+                    else:
+                        for result in await loop.run_in_executor(pool, _collect_function_results, func):
+                            outcome = outcome and result.status is True
+                            await queue.put((func, result))
+            finally:
+                passed[pos] = outcome
+                finished[pos].set()
+                await queue.put((func, None))
+
+        tasks = [asyncio.create_task(run_function(pos, func))
+                 for pos, func in enumerate(dag.functions)]
+
+        count = 0
+        function_ = None
+        try:
+            while count < len(tasks):
+                function_, result = await queue.get()
+                if result is None:
+                    count += 1
+                    self.progress_callback(count, self.function_count, PROGRESS_FUNC_DONE)
+                    continue
+
+                yield self._render(result)
+
+                self._check_abort(result)
+
+                if function_.finish_on_fail and result.status is False:
+                    self.progress_callback(count, self.function_count,
+                                           f"Early exit. {function_.function_name} failed.")
+                else:
+                    self.progress_callback(count, self.function_count, "", result)
+
+        except self.AbortYieldException:
+            self._abort_progress(count, function_)
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.run_env.clear()
+            if self.result_table is not None:
+                self.result_table.flush()
 
         self.end_time = dt.datetime.now()
         self.progress_callback(count,
                                self.function_count,
-                               "Rule Check Complete.")
+                               PROGRESS_COMPLETE)
+
+    async def arun_all(self, env=None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """
+        List version of ayield_all.
+
+        """
+        self.results = [result async for result in self.ayield_all(env=env, max_concurrency=max_concurrency)]
+
+        self._counted_results = self.results
+        self.score = self.score_strategy.value()
+        self.progress_callback(self.function_count,
+                               self.function_count,
+                               f"Score = {self.score:.1f}")
+        return self.results
 
     def run_all(self, env=None):
         """
@@ -692,40 +1185,65 @@ class SplintChecker:
         # A deceptively important line of code
         self.results = list(self.yield_all(env=env))
 
-        self.score = self.score_strategy(self.results)
+        self._counted_results = self.results
+        self.score = self.score_strategy.value()
         self.progress_callback(self.function_count,
                                self.function_count,
                                f"Score = {self.score:.1f}")
         return self.results
 
+    @property
+    def _counts(self) -> Counter | None:
+        """The running counts if they were counted from self.results (and it hasn't been changed)."""
+        if self._counted_results is self.results and self.counts["result"] == len(self.results):
+            return self.counts
+        return None
+
+    @property
+    def running_score(self) -> float:
+        """Score of the results yielded so far in the current (or last) run."""
+        return self.score_strategy.value()
+
     @property
     def clean_run(self):
         """ No exceptions """
+        if self._counts is not None:
+            return self._counts["error"] == 0
         return all(not r.except_ for r in self.results)
 
     @property
     def perfect_run(self):
         """No fails or skips"""
+        if self._counts is not None:
+            return self._counts["pass"] == self._counts["result"] and self._counts["warn"] == 0
         return all(r.status and not r.skipped and not r.warn_msg for r in self.results)
 
     @property
     def skip_count(self):
         """Number of skips"""
+        if self._counts is not None:
+            return self._counts["skip"]
         return len([r for r in self.results if r.skipped])
 
     @property
     def warn_count(self):
         """Number of warns"""
+        if self._counts is not None:
+            return self._counts["warn"]
         return len([r for r in self.results if r.warn_msg])
 
     @property
     def pass_count(self):
         """Number of passes"""
+        if self._counts is not None:
+            return self._counts["pass"]
         return len([r for r in self.results if r.status and not r.skipped])
 
     @property
     def fail_count(self):
         """Number of fails"""
+        if self._counts is not None:
+            return self._counts["fail"]
         return len([r for r in self.results if not r.status and not r.skipped])
 
     @property
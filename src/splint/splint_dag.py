@@ -0,0 +1,90 @@
+"""
+Dependencies between check functions.
+
+Check functions can list the ruids of functions that must pass before they are worth running
+using the depends_on attribute (e.g. don't check table schemas if the database isn't
+reachable).  SplintDag turns those lists into a graph over a list of functions, rejects
+cycles and provides a run order with every function after the functions it depends on.
+"""
+
+import heapq
+from typing import Sequence
+
+from .splint_exception import SplintException
+from .splint_function import SplintFunction
+from .splint_result import SplintResult
+
+
+def results_passed(results: Sequence[SplintResult]) -> bool:
+    """A function passed if none of its results failed or were skipped."""
+    return all(result.status is True for result in results)
+
+
+class SplintDag:
+    """
+    Dependency graph over a list of functions, nodes are positions in that list.
+
+    Dependencies on ruids that exist (known_ruids) but are not in the list, usually because
+    they were filtered out, are ignored.  Dependencies on unknown ruids are assumed to be typos
+    and raise an exception.
+    """
+
+    def __init__(self, functions: Sequence[SplintFunction], known_ruids: set[str] | None = None):
+        self.functions = list(functions)
+        self.dependencies: list[list[int]] = [[] for _ in self.functions]
+        self.dependents: list[list[int]] = [[] for _ in self.functions]
+
+        # Without any dependencies the run order is just the list order.
+        if not any(function_.depends_on for function_ in self.functions):
+            self.order = list(range(len(self.functions)))
+            return
+
+        position = {function_.ruid: pos for pos, function_ in enumerate(self.functions) if function_.ruid}
+        known_ruids = set(position) | set(known_ruids or [])
+        for pos, function_ in enumerate(self.functions):
+            for ruid in function_.depends_on:
+                if ruid not in known_ruids:
+                    raise SplintException(f"Function {function_.function_name} depends on unknown ruid '{ruid}'")
+                if ruid in position:
+                    self.dependencies[pos].append(position[ruid])
+                    self.dependents[position[ruid]].append(pos)
+
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> list[int]:
+        """
+        Kahn's algorithm, always picking the lowest position that is ready (from a heap) so
+        functions without dependencies keep their original order.
+        """
+        waiting_on = [len(deps) for deps in self.dependencies]
+        # Positions are added in increasing order so the list is already a heap.
+        ready = [pos for pos, count in enumerate(waiting_on) if count == 0]
+        order = []
+        while ready:
+            pos = heapq.heappop(ready)
+            order.append(pos)
+            for dependent in self.dependents[pos]:
+                waiting_on[dependent] -= 1
+                if waiting_on[dependent] == 0:
+                    heapq.heappush(ready, dependent)
+
+        if len(order) != len(self.functions):
+            cycle = sorted(self.functions[pos].ruid for pos, count in enumerate(waiting_on) if count)
+            raise SplintException(f"Dependency cycle between functions: {cycle}")
+        return order
+
+    def in_run_order(self) -> "SplintDag":
+        """The same graph with the functions listed in run order, so order is 0, 1, 2..."""
+        if self.order == list(range(len(self.functions))):
+            return self
+        new_pos = {old: new for new, old in enumerate(self.order)}
+        dag = SplintDag.__new__(SplintDag)
+        dag.functions = [self.functions[pos] for pos in self.order]
+        dag.dependencies = [[new_pos[dep] for dep in self.dependencies[pos]] for pos in self.order]
+        dag.dependents = [[new_pos[dep] for dep in self.dependents[pos]] for pos in self.order]
+        dag.order = list(range(len(dag.functions)))
+        return dag
+
+    def failed_dependencies(self, pos: int, passed: dict[int, bool]) -> list[str]:
+        """Return the ruids of the dependencies of pos that didn't pass."""
+        return [self.functions[dep].ruid for dep in self.dependencies[pos] if not passed.get(dep, False)]
@@ -0,0 +1,79 @@
+"""
+Storage for the values built by scoped env functions.
+
+Env functions are normally called for every run.  Building database engines or parsing large
+spreadsheets for every run (or every HTTP request when running behind the API) is slow, so
+env functions can be given a scope (see splint.env) and their values are kept in a
+SplintEnvStore until they expire or are torn down:
+
+- The checker keeps one store for "session" values and one for "run" values that is cleared
+  at the end of every run.
+- Each SplintModule keeps a store for "module" values.
+"""
+
+import threading
+import time
+from typing import Callable
+
+from .splint_attribute import get_attribute
+from .splint_exception import SplintException
+
+EnvFunction = Callable[[dict], dict]
+
+
+class SplintEnvStore:
+    """Values returned by env functions keyed by the env function that built them."""
+
+    def __init__(self):
+        # Values are (expiration time or None for never, dictionary returned by the env function)
+        self._entries: dict[EnvFunction, tuple[float | None, dict]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, env_func: EnvFunction) -> dict | None:
+        """Return the stored values for env_func, expired values are torn down and None returned."""
+        with self._lock:
+            entry = self._entries.get(env_func)
+        if entry is None:
+            return None
+        expires, values = entry
+        if expires is not None and expires <= time.time():
+            self.teardown(env_func)
+            return None
+        return values
+
+    def set(self, env_func: EnvFunction, values: dict, ttl_sec: float = 0.0) -> None:
+        """Keep values for env_func, for ttl_sec seconds if it is > 0, otherwise until torn down."""
+        with self._lock:
+            self._entries[env_func] = (time.time() + ttl_sec if ttl_sec > 0 else None, values)
+
+    def teardown(self, env_func: EnvFunction) -> None:
+        """Forget the values for env_func, calling its teardown function if it has one."""
+        with self._lock:
+            entry = self._entries.pop(env_func, None)
+        if entry is None:
+            return
+        teardown = get_attribute(env_func, "teardown")
+        if teardown is not None:
+            teardown(entry[1])
+
+    def clear(self) -> None:
+        """
+        Tear down everything, newest first, since later env functions may depend on earlier ones.
+
+        Every teardown is attempted even if some fail, the first failure is then reported.
+        """
+        errors = []
+        for env_func in reversed(list(self._entries)):
+            try:
+                self.teardown(env_func)
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                errors.append((env_func, ex))
+        if errors:
+            env_func, ex = errors[0]
+            raise SplintException(f"Env teardown failed for {env_func.__name__}: {ex}") from ex
+
+    def __contains__(self, env_func: EnvFunction) -> bool:
+        return env_func in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,144 @@
+"""
+Stable fingerprints for the values passed to check functions.
+
+TTL caching needs to know if a function is being called with the same arguments as last time.
+Python's hash() isn't stable between processes and many useful values (lists, dicts, DataFrames)
+aren't hashable at all, so this module walks values and builds a sha256 digest:
+
+- Simple values (str, int, float, bool, None, bytes) hash their type and repr.
+- Lists, tuples, sets and dicts hash their contents.
+- pathlib.Path values hash the path along with the file's size and modification time, so
+  editing a file invalidates the cache.
+- pandas DataFrames/Series and numpy arrays hash their contents.
+- Anything else is pickled, and if that fails, falls back to repr.
+
+If you have your own types you can either give them a `__splint_fingerprint__` method that
+returns a fingerprint-able value, or register a hook for the type with `register_fingerprint`.
+"""
+
+import hashlib
+import pathlib
+import pickle
+import sys
+from typing import Any, Callable
+
+_HOOKS: dict[type, Callable[[Any], Any]] = {}
+
+
+def register_fingerprint(type_: type, hook: Callable[[Any], Any]) -> None:
+    """
+    Register a function that converts values of a type into something that can be fingerprinted.
+
+    The hook can return any value this module knows how to fingerprint, typically a string or
+    bytes.  Hooks are checked before the built-in handling so they can override it.
+
+    Args:
+        type_: The type (subclasses included) the hook handles.
+        hook: Function taking a value and returning a fingerprint-able value.
+    """
+    _HOOKS[type_] = hook
+
+
+def unregister_fingerprint(type_: type) -> None:
+    """Remove a hook registered with register_fingerprint."""
+    _HOOKS.pop(type_, None)
+
+
+def fingerprint(value: Any) -> str:
+    """Return a stable hex digest for value."""
+    digest = hashlib.sha256()
+    _update(digest, value)
+    return digest.hexdigest()
+
+
+def _file_stamp(path: pathlib.PurePath) -> str:
+    """Path plus size and mtime so file changes give a new fingerprint."""
+    try:
+        stat = pathlib.Path(path).stat()
+        return f"{path}|{stat.st_size}|{stat.st_mtime_ns}"
+    except OSError:
+        return f"{path}|missing"
+
+
+def _update(digest, value: Any) -> None:  # pylint: disable=too-many-return-statements
+    """Recursively add value to the digest."""
+
+    # Each kind of value is prefixed with a marker so 1, "1" and [1] have different fingerprints.
+    # Container markers don't use the type name so the immutable env wrappers (SplintEnvList,
+    # SplintEnvDataFrame...) match the values they wrap.
+
+    for type_, hook in _HOOKS.items():
+        if isinstance(value, type_):
+            digest.update(f"hook:{type_.__qualname__}".encode())
+            _update(digest, hook(value))
+            return
+
+    custom = getattr(value, "__splint_fingerprint__", None)
+    if callable(custom):
+        digest.update(f"custom:{type(value).__qualname__}".encode())
+        _update(digest, custom())
+        return
+
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        digest.update(f"{type(value).__name__}:{value!r}".encode())
+        return
+
+    if isinstance(value, (bytes, bytearray)):
+        digest.update(b"bytes:" + value)
+        return
+
+    if isinstance(value, pathlib.PurePath):
+        digest.update(f"path:{_file_stamp(value)}".encode())
+        return
+
+    if isinstance(value, (list, tuple)):
+        digest.update(f"{'list' if isinstance(value, list) else 'tuple'}[{len(value)}".encode())
+        for item in value:
+            _update(digest, item)
+        digest.update(b"]")
+        return
+
+    if isinstance(value, dict):
+        digest.update(f"dict{{{len(value)}".encode())
+        for key, item in sorted(value.items(), key=lambda kv: repr(kv[0])):
+            _update(digest, key)
+            _update(digest, item)
+        digest.update(b"}")
+        return
+
+    if isinstance(value, (set, frozenset)):
+        digest.update(f"set({len(value)}".encode())
+        for item_fp in sorted(fingerprint(item) for item in value):
+            digest.update(item_fp.encode())
+        digest.update(b")")
+        return
+
+    # Only look for pandas/numpy if they have already been imported, there is no reason to
+    # pay for importing them to check values that can't possibly be theirs.
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, (pd.DataFrame, pd.Series)):
+        try:
+            row_hashes = pd.util.hash_pandas_object(value, index=True).values.tobytes()
+        except TypeError:
+            # Columns holding unhashable objects (lists, dicts), let pickle deal with it.
+            row_hashes = None
+        if row_hashes is not None:
+            if isinstance(value, pd.DataFrame):
+                digest.update(b"dataframe:")
+                digest.update(repr(list(value.columns)).encode())
+                digest.update(repr(list(map(str, value.dtypes))).encode())
+            else:
+                digest.update(f"series:{value.name!r}|{value.dtype}".encode())
+            digest.update(row_hashes)
+            return
+
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        digest.update(f"ndarray:{value.dtype}|{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+        return
+
+    try:
+        digest.update(b"pickle:" + pickle.dumps(value))
+    except Exception:  # pylint: disable=broad-exception-caught
+        digest.update(f"repr:{value!r}".encode())
@@ -18,7 +18,11 @@ The default formatting is plain text, which effectively just removes all formatt
 
 """
 
+import functools
+import os
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 
 # Supported HTML style tags
 # Define your tags as constants
@@ -216,6 +220,11 @@ class SplintAbstractRender(ABC):
     """
     Base class for all splint renderers.  This has a list of all supported tags, the abstract
     render method and a concrete cleanup that removes all unrendered tags.
+
+    Renderers that just swap tags for other text list them in `replacements`, a dict of
+    tag -> (open, close) text.  All the tags are matched by one compiled regex that is built
+    the first time a class renders, so a message is rendered in a single pass (and messages
+    without any markup aren't touched at all) rather than with a str.replace per tag.
     """
 
     # List of all known tags.  We need the list of all tags because code will need to run through all
@@ -224,21 +233,54 @@ class SplintAbstractRender(ABC):
             TAG_PASS, TAG_CODE, TAG_RED, TAG_BLUE, TAG_GREEN, TAG_PURPLE, TAG_ORANGE, TAG_YELLOW, TAG_BLACK, TAG_WHITE,
             TAG_WARN, TAG_SKIP]
 
+    # Tag -> (open text, close text).  Tags that aren't listed are removed.  This is compiled the
+    # first time it is used, so replace the dict rather than changing it in place.
+    replacements: dict[str, tuple[str, str]] = {}
+
     @abstractmethod
     def render(self, msg):  # pragma: no cover
         """Base class render method"""
 
+    @classmethod
+    def _compiled(cls, replacements: dict[str, tuple[str, str]]) -> tuple[str, re.Pattern, dict[str, str]]:
+        """
+        Text every tag starts with, the regex matching all tags and what each tag becomes,
+        cached per class (and per replacements dict for cleanup).
+        """
+        key = (cls, id(replacements))
+        compiled = _COMPILED.get(key)
+        # The dict is kept in the cache entry so a new dict that reuses an old id is recompiled.
+        if compiled is None or compiled[3] is not replacements:
+            fmt = SplintMarkup()
+            substitutions = {}
+            for tag in cls.tags:
+                open_text, close_text = replacements.get(tag, ("", ""))
+                substitutions[fmt.open_tag(tag)] = open_text
+                substitutions[fmt.close_tag(tag)] = close_text
+            # Longest first so no tag can be matched by the start of a longer one
+            pattern = re.compile("|".join(re.escape(text) for text in sorted(substitutions, key=len, reverse=True)))
+            prefix = os.path.commonprefix([fmt.open_delim.split("@")[0], fmt.close_delim.split("@")[0]])
+            compiled = _COMPILED[key] = (prefix, pattern, substitutions, replacements)
+        return compiled[:3]
+
+    def _substitute(self, msg, replacements: dict[str, tuple[str, str]]):
+        """Replace every tag in one pass."""
+        prefix, pattern, substitutions = self._compiled(replacements)
+        if not msg or prefix not in msg:
+            return msg
+        return pattern.sub(lambda match: substitutions[match.group()], msg)
+
     def cleanup(self, msg):
         """
         It is optional for subclasses to replace all the render tags.  This method provides
         support to wipeout all un rendered tags.
         """
-        fmt = SplintMarkup()
+        return self._substitute(msg, _NO_REPLACEMENTS)
 
-        # Find all the defined tags and blow them away.
-        for tag in self.tags:
-            msg = msg.replace(f'{fmt.open_tag(tag)}', '').replace(f'{fmt.close_tag(tag)}', '')
-        return msg
+
+# Compiled tag patterns by (renderer class, replacements), see SplintAbstractRender._compiled
+_COMPILED: dict[tuple[type, int], tuple[str, re.Pattern, dict[str, str], dict]] = {}
+_NO_REPLACEMENTS: dict[str, tuple[str, str]] = {}
 
 
 class SplintRenderText(SplintAbstractRender):
@@ -249,147 +291,115 @@ class SplintRenderText(SplintAbstractRender):
     """
 
     def render(self, msg):
-        # Call the baseclass cleanup messages since this is a do-nothing class.
-        return self.cleanup(msg)
+        # Swap the tags this class knows about and remove the rest, the text renderer knows none.
+        return self._substitute(msg, self.replacements)
 
 
 class SplintBasicMarkdown(SplintRenderText):
     "Markdown render class"
 
-    def render(self, msg):
-        """Basic markdown render method that converts tags to markdown"""
-        fmt = SplintMarkup()
-        replacements = {TAG_BOLD: '**',
-                        TAG_ITALIC: '*',
-                        TAG_STRIKETHROUGH: '~~',
-                        TAG_CODE: '`',
-                        TAG_PASS: '`',
-                        TAG_FAIL: '`',
-                        TAG_WARN: '`',
-                        TAG_SKIP: '`',
-                        TAG_EXPECTED: '`',
-                        TAG_ACTUAL: '`'}
-        # Phase 1 replace all substitutions
-        for md, replacement in replacements.items():
-            open_tag = fmt.open_tag(md)
-            close_tag = fmt.close_tag(md)
-            msg = msg.replace(open_tag, replacement).replace(close_tag, replacement)
-
-        # Phase 2 replace all unused tags.
-        return self.cleanup(msg)
+    replacements = {TAG_BOLD: ('**', '**'),
+                    TAG_ITALIC: ('*', '*'),
+                    TAG_STRIKETHROUGH: ('~~', '~~'),
+                    TAG_CODE: ('`', '`'),
+                    TAG_PASS: ('`', '`'),
+                    TAG_FAIL: ('`', '`'),
+                    TAG_WARN: ('`', '`'),
+                    TAG_SKIP: ('`', '`'),
+                    TAG_EXPECTED: ('`', '`'),
+                    TAG_ACTUAL: ('`', '`')}
 
 
 class SplintBasicRichRenderer(SplintRenderText):
     """Rich render class"""
 
-    def render(self, msg):
-        """Basic markdown render method that converts tags to rich formatted code"""
-        fmt = SplintMarkup()
-        replacements = {TAG_BOLD: ('[bold]', '[/bold]'),
-                        TAG_ITALIC: ('[italic]', '[/italic]'),
-                        TAG_UNDERLINE: ('[u]', '[/u]'),
-                        TAG_STRIKETHROUGH: ('[strike]', '[/strike]'),
-                        TAG_PASS: ('[green]', '[/green]'),
-                        TAG_FAIL: ('[red]', '[/red]'),
-                        TAG_WARN: ('[orange]', '[/orange]'),
-                        TAG_SKIP: ('[purple]', '[/purple]'),
-                        TAG_EXPECTED: ('[green]', '[/green]'),
-                        TAG_ACTUAL: ('[green]', '[/green]'),
-                        TAG_RED: ('[red]', '[/red]'),
-                        TAG_GREEN: ('[green]', '[/green]'),
-                        TAG_BLUE: ('[blue]', '[/blue]'),
-                        TAG_YELLOW: ('[yellow]', '[/yellow]'),
-                        TAG_ORANGE: ('[orange]', '[/orange]'),
-                        TAG_PURPLE: ('[purple]', '[/purple]'),
-                        TAG_BLACK: ('[black]', '[/black]'),
-                        TAG_WHITE: ('[white]', '[/white]'),
-                        }
-
-        # Phase 1 replace all substitutions
-        for md, replacement in replacements.items():
-            msg = msg.replace(f"{fmt.open_tag(md)}", replacement[0]).replace(f"{fmt.close_tag(md)}", replacement[1])
-
-        # Phase 2 replace all unused tags.
-        return self.cleanup(msg)
+    replacements = {TAG_BOLD: ('[bold]', '[/bold]'),
+                    TAG_ITALIC: ('[italic]', '[/italic]'),
+                    TAG_UNDERLINE: ('[u]', '[/u]'),
+                    TAG_STRIKETHROUGH: ('[strike]', '[/strike]'),
+                    TAG_PASS: ('[green]', '[/green]'),
+                    TAG_FAIL: ('[red]', '[/red]'),
+                    TAG_WARN: ('[orange]', '[/orange]'),
+                    TAG_SKIP: ('[purple]', '[/purple]'),
+                    TAG_EXPECTED: ('[green]', '[/green]'),
+                    TAG_ACTUAL: ('[green]', '[/green]'),
+                    TAG_RED: ('[red]', '[/red]'),
+                    TAG_GREEN: ('[green]', '[/green]'),
+                    TAG_BLUE: ('[blue]', '[/blue]'),
+                    TAG_YELLOW: ('[yellow]', '[/yellow]'),
+                    TAG_ORANGE: ('[orange]', '[/orange]'),
+                    TAG_PURPLE: ('[purple]', '[/purple]'),
+                    TAG_BLACK: ('[black]', '[/black]'),
+                    TAG_WHITE: ('[white]', '[/white]'),
+                    }
 
 
 class SplintBasicStreamlitRenderer(SplintRenderText):
     """Streamlit renderer class."""
 
-    def render(self, msg):
-        """Basic markdown render method that converts tags to streamlit format strings"""
-
-        fmt = SplintMarkup()
-        replacements = {
-            TAG_BOLD: ('**', '**'),
-            TAG_ITALIC: ('*', '*'),
-            TAG_CODE: ('`', '`'),
-            TAG_PASS: (':green[', ']'),
-            TAG_FAIL: (':red[', ']'),
-            TAG_WARN: (':orange[', ']'),
-            TAG_SKIP: (':purple[', ']'),
-            TAG_EXPECTED: (':green[', ']'),
-            TAG_ACTUAL: (':green[', ']'),
-            TAG_RED: (':red[', ']'),
-            TAG_GREEN: (':green[', ']'),
-            TAG_BLUE: (':blue[', ']'),
-            TAG_YELLOW: (':yellow[', ']'),
-            TAG_ORANGE: (':orange[', ']'),
-            TAG_PURPLE: (':purple[', ']'),
-            TAG_BLACK: (':black[', ']'),
-            TAG_WHITE: (':white[', ']'),
-        }
-
-        # Phase 1 replace all substitutions
-        for md, replacement in replacements.items():
-            open_tag = fmt.open_tag(md)
-            close_tag = fmt.close_tag(md)
-
-            msg = msg.replace(open_tag, replacement[0]).replace(close_tag, replacement[1])
-
-        # Phase 2 replace all unused tags.
-        msg = self.cleanup(msg)
-
-        return msg
+    replacements = {
+        TAG_BOLD: ('**', '**'),
+        TAG_ITALIC: ('*', '*'),
+        TAG_CODE: ('`', '`'),
+        TAG_PASS: (':green[', ']'),
+        TAG_FAIL: (':red[', ']'),
+        TAG_WARN: (':orange[', ']'),
+        TAG_SKIP: (':purple[', ']'),
+        TAG_EXPECTED: (':green[', ']'),
+        TAG_ACTUAL: (':green[', ']'),
+        TAG_RED: (':red[', ']'),
+        TAG_GREEN: (':green[', ']'),
+        TAG_BLUE: (':blue[', ']'),
+        TAG_YELLOW: (':yellow[', ']'),
+        TAG_ORANGE: (':orange[', ']'),
+        TAG_PURPLE: (':purple[', ']'),
+        TAG_BLACK: (':black[', ']'),
+        TAG_WHITE: (':white[', ']'),
+    }
 
 
 class SplintBasicHTMLRenderer(SplintRenderText):
     """HTML renderer"""
 
-    def render(self, msg):
-        """Basic markdown render method that converts tags to html"""
-
-        fmt = SplintMarkup()
-        replacements = {
-            TAG_BOLD: ('<b>', '</b>'),
-            TAG_ITALIC: ('<i>', '</i>'),
-            TAG_UNDERLINE: ('<u>', '</u>'),
-            TAG_STRIKETHROUGH: ('<s>', '</s>'),
-            TAG_CODE: ('<code>', '</code>'),
-            TAG_PASS: ('<span style="color:green">', '</span>'),
-            TAG_FAIL: ('<span style="color:red">', '</span>'),
-            TAG_WARN: ('<span style="color:orange">', '</span>'),
-            TAG_SKIP: ('<span style="color:purple">', '</span>'),
-            TAG_EXPECTED: ('<span style="color:green">', '</span>'),
-            TAG_ACTUAL: ('<span style="color:red">', '</span>'),
-            TAG_RED: ('<span style="color:red">', '</span>'),
-            TAG_GREEN: ('<span style="color:green">', '</span>'),
-            TAG_BLUE: ('<span style="color:blue">', '</span>'),
-            TAG_YELLOW: ('<span style="color:yellow">', '</span>'),
-            TAG_ORANGE: ('<span style="color:orange">', '</span>'),
-            TAG_PURPLE: ('<span style="color:purple">', '</span>'),
-            TAG_BLACK: ('<span style="color:black">', '</span>'),
-            TAG_WHITE: ('<span style="color:white">', '</span>'),
-        }
-
-        # Phase 1 replace all substitutions
-        for md, replacement in replacements.items():
-            open_tag = fmt.open_tag(md)
-            close_tag = fmt.close_tag(md)
-
-            msg = msg.replace(open_tag, replacement[0]).replace(close_tag, replacement[1])
-
-        # Phase 2 replace all unused tags.
-        msg = self.cleanup(msg)
-
-        return msg
+    replacements = {
+        TAG_BOLD: ('<b>', '</b>'),
+        TAG_ITALIC: ('<i>', '</i>'),
+        TAG_UNDERLINE: ('<u>', '</u>'),
+        TAG_STRIKETHROUGH: ('<s>', '</s>'),
+        TAG_CODE: ('<code>', '</code>'),
+        TAG_PASS: ('<span style="color:green">', '</span>'),
+        TAG_FAIL: ('<span style="color:red">', '</span>'),
+        TAG_WARN: ('<span style="color:orange">', '</span>'),
+        TAG_SKIP: ('<span style="color:purple">', '</span>'),
+        TAG_EXPECTED: ('<span style="color:green">', '</span>'),
+        TAG_ACTUAL: ('<span style="color:red">', '</span>'),
+        TAG_RED: ('<span style="color:red">', '</span>'),
+        TAG_GREEN: ('<span style="color:green">', '</span>'),
+        TAG_BLUE: ('<span style="color:blue">', '</span>'),
+        TAG_YELLOW: ('<span style="color:yellow">', '</span>'),
+        TAG_ORANGE: ('<span style="color:orange">', '</span>'),
+        TAG_PURPLE: ('<span style="color:purple">', '</span>'),
+        TAG_BLACK: ('<span style="color:black">', '</span>'),
+        TAG_WHITE: ('<span style="color:white">', '</span>'),
+    }
+
+
+# Rules often yield the same message over and over, so rendered messages are cached.
+RENDER_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_cached(renderer: SplintAbstractRender, msg: str) -> str:
+    return renderer.render(msg)
+
+
+def render_cached(renderer: SplintAbstractRender, msg) -> str:
+    """Render msg with renderer, using an LRU cache keyed by (renderer, msg) when both are hashable."""
+    if isinstance(renderer, Hashable) and isinstance(msg, Hashable):
+        return _render_cached(renderer, msg)
+    return renderer.render(msg)
+
+
+def clear_render_cache() -> None:
+    """Forget all cached rendered messages, needed if a renderer's output changes."""
+    _render_cached.cache_clear()
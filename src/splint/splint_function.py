@@ -4,15 +4,23 @@ deal of metadata is stored in the function and extracted from information about
 its signature, its generator status etc.  This information is used so users do not need to
 configure functions in multiple places.  Design elements from fastapi and pytest are obvious.
 """
+import asyncio
+import copy
+import importlib
 import inspect
+import queue
 import re
+import sys
+import threading
 import time
 import traceback
-from typing import Any, Generator
+from typing import Any, AsyncGenerator, Generator
 
 from .splint_attribute import get_attribute
+from .splint_cache import SplintCache, SplintMemoryCache
 from .splint_exception import SplintException
-from .splint_result import SplintResult
+from .splint_fingerprint import fingerprint
+from .splint_result import SplintCompactResult, SplintFunctionInfo, SplintResult
 
 
 def result_hook_fix_blank_msg(sfunc: "SplintFunction",
@@ -50,8 +58,40 @@ def result_hook_fix_blank_msg(sfunc: "SplintFunction",
     return result
 
 
+# Number of different environments each function remembers TTL results for.
+LOCAL_CACHE_ENTRIES = 32
+
+
+class _FunctionTimeout(Exception):
+    """Raised internally when an async function runs past its time budget."""
+
+
+class _ModuleRef:
+    """Picklable stand-in for a module object, see SplintFunction.__getstate__."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+
 ATTRIBUTES = ("tag", "level", "phase", "weight", "skip", "ruid", "skip_on_none",
-              "fail_on_none", "ttl_minutes", "finish_on_fail")
+              "fail_on_none", "ttl_minutes", "finish_on_fail", "timeout", "depends_on")
+
+
+def _without_renderer(result: SplintResult) -> SplintResult:
+    """
+    Copy of a result without the renderer the checker attached for deferred rendering, so
+    cached entries don't carry (and pickle) it.  Replayed results are given one again.
+    """
+    if result._renderer is None:  # pylint: disable=protected-access
+        return result
+    result = copy.copy(result)
+    result._renderer = None  # pylint: disable=protected-access
+    return result
+
+
+# SplintFunction attributes that SplintFunctionInfo is built from.
+_INFO_SOURCES = frozenset(("module", "function_name", "doc", "ruid", "tag", "level", "phase", "ttl_minutes",
+                           "skip_on_none", "fail_on_none"))
 
 
 class SplintFunction:
@@ -82,11 +122,15 @@ class SplintFunction:
                  allowed_exceptions: tuple[type[BaseException], ...] = None,  # So mypy understands types
                  env: dict[Any, Any] = None,
                  pre_sr_hooks: Any = None,
-                 post_sr_hooks: Any = None):
+                 post_sr_hooks: Any = None,
+                 cache: SplintCache | None = None,
+                 compact_results: bool = False):
         self.env = env or {}
         self.module = module
         self.function = function_
         self.is_generator = inspect.isgeneratorfunction(function_)
+        self.is_coroutine = inspect.iscoroutinefunction(function_)
+        self.is_async_generator = inspect.isasyncgenfunction(function_)
         self.function_name = function_.__name__
 
         # Using inspect gets the docstring without the python indent.
@@ -123,6 +167,11 @@ class SplintFunction:
         self.ttl_minutes: float = get_attribute(function_, "ttl_minutes")
         self.finish_on_fail: bool = get_attribute(function_, "finish_on_fail")
         self.index = get_attribute(function_, "index")
+        self.timeout: float = get_attribute(function_, "timeout")
+        self.depends_on: list[str] = list(get_attribute(function_, "depends_on"))
+
+        # Time budget used when the function doesn't have its own, the checker sets this.
+        self.default_timeout: float = 0.0
 
         # Support Time To Live using the return value of time.time.  Resolution of this
         # is on the order of 10e-6 depending on OS.  In my case this is WAY more than I
@@ -131,6 +180,17 @@ class SplintFunction:
         self.last_ttl_start: float = 0.0  # this will be compared to time.time() for ttl caching
         self.last_results: list[SplintResult] = []
 
+        # Optional shared/persistent storage for TTL results.  Without one, each function has
+        # its own small in-memory cache.  Either way, entries are keyed by a fingerprint of the
+        # arguments, so a checker serving many environments never replays the wrong results.
+        self.cache: SplintCache | None = cache
+        self._local_cache = SplintMemoryCache(max_entries=LOCAL_CACHE_ENTRIES)
+
+        # Functions yielding huge numbers of results can make slotted results that share one
+        # record of the function level values (see SplintCompactResult).
+        self.compact_results = compact_results
+        self._info: SplintFunctionInfo | None = None
+
         if self.weight in [True, False, None]:
             raise SplintException("Boolean and none types are not allowed for weights.")
 
@@ -147,6 +207,37 @@ class SplintFunction:
     def __str__(self):
         return f"SplintFunction({self.function_name=})"
 
+    def __setattr__(self, name, value):
+        # The shared info record for compact results is rebuilt when a value in it changes.
+        if name in _INFO_SOURCES:
+            self.__dict__["_info"] = None
+        super().__setattr__(name, value)
+
+    @property
+    def is_async(self) -> bool:
+        """Does this function need an event loop to run?"""
+        return self.is_coroutine or self.is_async_generator
+
+    def __getstate__(self):
+        """
+        Support pickling so functions can be run in a process pool.
+
+        Module objects and signature parameters can't be pickled, so the module is
+        stored by name and the parameters are rebuilt from the function on unpickle.
+        """
+        state = self.__dict__.copy()
+        state["parameters"] = None
+        if inspect.ismodule(self.module):
+            state["module"] = _ModuleRef(self.module.__name__)
+        return state
+
+    def __setstate__(self, state):
+        if isinstance(state["module"], _ModuleRef):
+            name = state["module"].name
+            state["module"] = sys.modules.get(name) or importlib.import_module(name)
+        self.__dict__.update(state)
+        self.parameters = inspect.signature(self.function).parameters
+
     def _get_parameter_values(self):
         args = []
         for param in self.parameters.values():
@@ -157,11 +248,103 @@ class SplintFunction:
 
         return args
 
-    def _cache_result(self, result):
+    def _cache_result(self, result, stop: threading.Event | None = None):
         """Simple caching saves results if ttl_minutes is no 0"""
-        if self.ttl_minutes:
+        if self.ttl_minutes and (stop is None or not stop.is_set()):
             self.last_results.append(result)
 
+    def _none_arg_results(self, args) -> list[SplintResult]:
+        """
+        If any arguments are None that is a bad thing.  That means that
+        a file could not be opened or other data is not available. If
+        Functions are not allowed to update the environment this only
+        needs to run once, rather than on every function call
+        """
+        for count, arg in enumerate([arg for arg in args if arg is None], start=1):
+
+            # Make a nice message if there is a ruid for this rule
+            ruid_msg = f'|{self.ruid}' if self.ruid else ''
+
+            if self.fail_on_none:
+                return [SplintResult(status=False,
+                                     msg=f"Failed due to None arg. {count} in func='{self.function_name}'{ruid_msg}",
+                                     fail_on_none=True)]
+            if self.skip_on_none:
+                return [SplintResult(status=None, skipped=True,
+                                     msg=f"Skipped due to None arg. {count} in func='{self.function_name}{ruid_msg}'",
+                                     skip_on_none=True)]
+        return []
+
+    def _cache_key(self, args) -> str | None:
+        """
+        Key for the cache, so the same function with different arguments doesn't collide.
+
+        Fingerprinting large arguments isn't free, so this is worked out once per call and
+        None when the function isn't cached.
+        """
+        if not self.ttl_minutes:
+            return None
+        module_name = getattr(self.module, "__name__", self.module or "")
+        return f"{self.ruid}|{module_name}|{self.function_name}|{fingerprint(args)}"
+
+    def _ttl_cache(self) -> SplintCache:
+        """The cache backend in use, note that empty caches are falsy."""
+        return self.cache if self.cache is not None else self._local_cache
+
+    def _get_cached(self, key: str | None) -> list[SplintResult] | None:
+        """Return the results to replay from the TTL cache, or None to run the function."""
+        if key is None:
+            return None
+        return self._ttl_cache().get(key)
+
+    def _store_cached(self, key: str | None):
+        """Save the results of a complete run to the cache."""
+        if key is not None:
+            self._ttl_cache().set(key, [_without_renderer(r) for r in self.last_results], self.ttl_minutes * 60)
+
+    def _load_returned(self, results, start_time, end_time) -> list[SplintResult]:
+        """
+        Convert the return value of a non-generator function into a list of results.
+
+        This allows for returning a single result using return or multiple results
+        returning a list of results.
+        """
+        if isinstance(results, SplintResult):
+            results = [results]
+
+        # TODO: I could not make a decorator work for this, so I just put it here.
+        #       Ideally the attribute decorator could see a non generator function
+        #       and wrap at creation rather than having this crap here.
+        elif isinstance(results, bool):
+            results = [SplintResult(status=results)]
+        if not isinstance(results[0], SplintResult):
+            raise SplintException(f"Invalid return from splint function {self.function_name}")
+
+        # TODO: Time is wrong here, we should estimate each part taking
+        #       1/count of the total time
+        return [self.load_result(r, start_time, end_time, count=1) for r in results]
+
+    def _load_yielded(self, result, start_time, end_time, count) -> SplintResult:
+        """Convert a single yielded value from a generator function into a result."""
+        if isinstance(result, bool):
+            result = SplintResult(status=result)
+        elif isinstance(result, list):
+            raise SplintException(
+                "Function yielded a list rather than a SplintResult or boolean"
+            )
+
+        return self.load_result(result, start_time, end_time, count)
+
+    def _exception_result(self, e: BaseException, count: int) -> SplintResult:
+        """Generically handle exceptions here so we can keep running."""
+        result = SplintResult(status=False)
+        result = self.load_result(result, 0, 0, count)
+        result.except_ = e
+        result.traceback = traceback.format_exc()
+        mod_msg = "" if not self.module else f"{self.module}"
+        result.msg = f"Exception '{e}' occurred while running {mod_msg}.{self.function.__name__}"
+        return result
+
     def __call__(self, *args, **kwds) -> Generator[SplintResult, None, None]:
         """Call the user provided function and collect information about the result.
 
@@ -171,6 +354,9 @@ class SplintFunction:
         manages the details that we'd prefer to handle in the core of the system
         rather than inside the check functions.
 
+        Async functions are run to completion on a private event loop, use acall
+        if you are already running inside an event loop.
+
         Raises:
             SplintException: Exceptions are remapped to SplintExceptions for easier handling
 
@@ -180,98 +366,240 @@ class SplintFunction:
         Yields:
             Iterator[SplintResult]:
         """
+        # Async functions handle their own timeouts by cancelling on the event loop.
+        timeout = self.timeout or self.default_timeout
+        if timeout and not self.is_async:
+            yield from self._call_with_timeout(timeout, *args, **kwds)
+        else:
+            yield from self._call(*args, **kwds)
+
+    def _call_with_timeout(self, timeout: float, *args, **kwds) -> Generator[SplintResult, None, None]:
+        """
+        Run the function in a worker thread and give up on it after timeout seconds.
+
+        Running in a thread means functions that never give control back (blocking I/O,
+        tight loops) are still bounded.  Python has no way to kill a thread, so a function
+        that blows its budget (or whose results stop being read) is left to finish in a
+        daemon thread and anything it produces after that is thrown away, not cached.
+
+        NOTE: The function runs on a different thread than the caller, so environment values
+        tied to the thread that made them (sqlite3 connections, some DB sessions) can't be
+        used by functions with a timeout.
+        """
+        results: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        done = object()
+
+        def worker():
+            try:
+                for result in self._call(*args, stop=stop, **kwds):
+                    if stop.is_set():
+                        return
+                    results.put(result)
+            except BaseException as ex:  # pylint: disable=broad-exception-caught
+                # Hand anything the function didn't handle back to the calling thread.
+                results.put(ex)
+            finally:
+                results.put(done)
+
+        start_time = time.time()
+        deadline = start_time + timeout
+        count = 0
+        threading.Thread(target=worker, name=f"splint-{self.function_name}", daemon=True).start()
+
+        try:
+            while True:
+                try:
+                    item = results.get(timeout=max(deadline - time.time(), 0.0))
+                except queue.Empty:
+                    stop.set()
+                    yield self._timeout_result(timeout, start_time, count + 1)
+                    return
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                count += 1
+                yield item
+        finally:
+            # Timed out, or the caller stopped reading (finish_on_fail, abort, break).
+            stop.set()
+
+    def skip_result(self, msg: str) -> SplintResult:
+        """Make the result for a function that the checker decided not to run."""
+        now = time.time()
+        return self.load_result(SplintResult(status=None, skipped=True, msg=msg), now, now)
+
+    def _timeout_result(self, timeout: float, start_time: float, count: int) -> SplintResult:
+        """Make the failed result for a function that ran out of time."""
+
+        mod_msg = "" if not self.module else f"{self.module}"
+        result = SplintResult(status=False,
+                              timed_out=True,
+                              msg=f"Timeout after {timeout:0.1f} sec while running {mod_msg}.{self.function_name}")
+        return self.load_result(result, start_time, time.time(), count)
+
+    def _call(self, *args, stop: threading.Event | None = None, **kwds) -> Generator[SplintResult, None, None]:
+        """
+        Call the function without any time limits, see __call__.
+
+        Once stop is set (by _call_with_timeout) results are no longer saved for the TTL cache.
+        """
+        if self.is_async:
+            yield from asyncio.run(self._acollect())
+            return
+
         # Call the stored function and collect information about the result
         start_time: float = time.time()
 
         # Function returns a generator that needs to be iterated over
         args = self._get_parameter_values()
 
-        # If any arguments are None that is a bad thing.  That means that
-        # a file could not be opened or other data is not available. If
-        # Functions are not allowed to update the environment this only
-        # needs to run once, rather than on every function call
-        for count, arg in enumerate([arg for arg in args if arg is None], start=1):
-
-            # Make a nice message if there is a ruid for this rule
-            ruid_msg = f'|{self.ruid}' if self.ruid else ''
-
-            if self.fail_on_none:
-                yield SplintResult(status=False,
-                                   msg=f"Failed due to None arg. {count} in func='{self.function_name}'{ruid_msg}",
-                                   fail_on_none=True)
-                return
-            if self.skip_on_none:
-                yield SplintResult(status=None, skipped=True,
-                                   msg=f"Skipped due to None arg. {count} in func='{self.function_name}{ruid_msg}'",
-                                   skip_on_none=True)
-                return
+        none_results = self._none_arg_results(args)
+        if none_results:
+            yield from none_results
+            return
 
         # It is possible for an exception to occur before the generator is created.
         # so we need a value to be set for count.
         count = 1
 
         # If we need values from the result cache, then we can just yield them back
-        if self.ttl_minutes * 60 + self.last_ttl_start > time.time():
-            yield from self.last_results
+        cache_key = self._cache_key(args)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            yield from cached
             return
 
         try:
             self.last_results = []
             self.last_ttl_start = start_time
 
-            # This allows for returning a single result using return or
-            # multiple results returning a list of results.
             if not self.is_generator:
                 # If the function is not a generator, then just call it
                 results = self.function(*args)
                 end_time = time.time()
-                if isinstance(results, SplintResult):
-                    results = [results]
-
-                # TODO: I could not make a decorator work for this, so I just put it here.
-                #       Ideally the attribute decorator could see a non generator function
-                #       and wrap at creation rather than having this crap here.
-                elif isinstance(results, bool):
-                    results = [SplintResult(status=results)]
-                if not isinstance(results[0], SplintResult):
-                    raise SplintException(f"Invalid return from splint function {self.function_name}")
-                for count, r in enumerate(results, start=1):
-                    # TODO: Time is wrong here, we should estimate each part taking
-                    #       1/count of the total time
-                    r = self.load_result(r, start_time, end_time, count=1)
+                for r in self._load_returned(results, start_time, end_time):
                     yield r
 
-                    self._cache_result(r)
+                    self._cache_result(r, stop)
 
             else:
                 # Functions can return multiple results, track them with a count attribute.
                 for count, result in enumerate(self.function(*args, **kwds), start=1):
                     end_time = time.time()
 
-                    if isinstance(result, bool):
-                        result = SplintResult(status=result)
-                    elif isinstance(result, list):
-                        raise SplintException(
-                            "Function yielded a list rather than a SplintResult or boolean"
-                        )
-
-                    result = self.load_result(result, start_time, end_time, count)
+                    result = self._load_yielded(result, start_time, end_time, count)
 
                     yield result
 
-                    self._cache_result(result)
+                    self._cache_result(result, stop)
 
                     start_time = time.time()
 
+            if stop is None or not stop.is_set():
+                self._store_cached(cache_key)
+
+        except self.allowed_exceptions as e:
+            yield self._exception_result(e, count)
+
+    async def _acollect(self) -> list[SplintResult]:
+        """Gather all the results from acall, used to run async functions from sync code."""
+        return [result async for result in self.acall()]
+
+    async def acall(self) -> AsyncGenerator[SplintResult, None]:
+        """
+        Async version of __call__.
+
+        Coroutine functions and async generators are awaited on the running event loop.
+        Regular functions are pushed to a thread so they don't block the loop.
+
+        Timeouts for async functions cancel the function, this only works if the function
+        gives control back to the event loop.
+
+        Yields:
+            AsyncIterator[SplintResult]:
+        """
+        if not self.is_async:
+            for result in await asyncio.to_thread(list, self()):
+                yield result
+            return
+
+        start_time: float = time.time()
+
+        args = self._get_parameter_values()
+
+        none_results = self._none_arg_results(args)
+        if none_results:
+            for result in none_results:
+                yield result
+            return
+
+        count = 0
+
+        cache_key = self._cache_key(args)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            for result in cached:
+                yield result
+            return
+
+        timeout = self.timeout or self.default_timeout
+        deadline = start_time + timeout if timeout else None
+
+        try:
+            self.last_results = []
+            self.last_ttl_start = start_time
+
+            if self.is_coroutine:
+                results = await self._await_before(self.function(*args), deadline)
+                end_time = time.time()
+                for r in self._load_returned(results, start_time, end_time):
+                    yield r
+
+                    self._cache_result(r)
+
+            else:
+                generator = self.function(*args)
+                try:
+                    while True:
+                        try:
+                            result = await self._await_before(generator.__anext__(), deadline)
+                        except StopAsyncIteration:
+                            break
+                        count += 1
+                        end_time = time.time()
+
+                        result = self._load_yielded(result, start_time, end_time, count)
+
+                        yield result
+
+                        self._cache_result(result)
+
+                        start_time = time.time()
+                finally:
+                    await generator.aclose()
+
+            self._store_cached(cache_key)
+
+        except _FunctionTimeout:
+            yield self._timeout_result(timeout, start_time, count + 1)
+
         except self.allowed_exceptions as e:
-            # Generically handle exceptions here so we can keep running.
-            result = SplintResult(status=False)
-            result = self.load_result(result, 0, 0, count)
-            result.except_ = e
-            result.traceback = traceback.format_exc()
-            mod_msg = "" if not self.module else f"{self.module}"
-            result.msg = f"Exception '{e}' occurred while running {mod_msg}.{self.function.__name__}"
-            yield result
+            yield self._exception_result(e, max(count, 1))
+
+    @staticmethod
+    async def _await_before(awaitable, deadline: float | None):
+        """Await something, raising _FunctionTimeout if the deadline passes first."""
+        if deadline is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, max(deadline - time.time(), 0.0))
+        except asyncio.TimeoutError as ex:
+            # Tell our timeout apart from a TimeoutError raised by the function itself.
+            if time.time() >= deadline:
+                raise _FunctionTimeout() from ex
+            raise
 
     def _get_section(self, header="", text=None):
         """
@@ -308,6 +636,27 @@ class SplintFunction:
         # If the header wasn't found, return the text before the first header
         return ""
 
+    @property
+    def info(self) -> SplintFunctionInfo:
+        """
+        The function level values shared by compact results.  Attributes like ruid can be
+        changed after the function is created (auto ruids), setting one of them (see
+        __setattr__) makes the record be rebuilt the next time it is needed.
+        """
+        if self._info is None:
+            self._info = SplintFunctionInfo(pkg_name=getattr(self.module, "__package__", ""),
+                                            module_name=getattr(self.module, "__name__", ""),
+                                            func_name=self.function_name,
+                                            doc=self.doc,
+                                            ruid=self.ruid,
+                                            tag=self.tag,
+                                            level=self.level,
+                                            phase=self.phase,
+                                            ttl_minutes=self.ttl_minutes,
+                                            skip_on_none=self.skip_on_none,
+                                            fail_on_none=self.fail_on_none)
+        return self._info
+
     def load_result(self, result: SplintResult, start_time, end_time, count=1):
         """
         Provide a bunch of metadata about the function call, mostly hoisting
@@ -317,24 +666,28 @@ class SplintFunction:
         1 possible hierarchy.  Tall-skinny data that can be transformed into wide or
         hierarchical.
         """
-        # Use getattr to avoid repeating the same pattern of checking if self.module exists
-        result.pkg_name = getattr(self.module, "__package__", "")
-        result.module_name = getattr(self.module, "__name__", "")
-
-        # Assign the rest of the attributes directly
-        result.ruid = self.ruid
-        result.func_name = self.function_name
-        result.doc = self.doc
-        result.tag = self.tag
-        result.level = self.level
-        result.phase = self.phase
+        if self.compact_results:
+            result = SplintCompactResult.from_result(result, self.info)
+        else:
+            # Use getattr to avoid repeating the same pattern of checking if self.module exists
+            result.pkg_name = getattr(self.module, "__package__", "")
+            result.module_name = getattr(self.module, "__name__", "")
+
+            # Assign the rest of the attributes directly
+            result.ruid = self.ruid
+            result.func_name = self.function_name
+            result.doc = self.doc
+            result.tag = self.tag
+            result.level = self.level
+            result.phase = self.phase
+            result.ttl_minutes = self.ttl_minutes
+
+            result.fail_on_none = self.fail_on_none
+            result.skip_on_none = self.skip_on_none
+
         result.runtime_sec = end_time - start_time
-        result.ttl_minutes = self.ttl_minutes
         result.count = count
 
-        result.fail_on_none = self.fail_on_none
-        result.skip_on_none = self.skip_on_none
-
         # Apply all (usually 1 or 0) hooks to the result
         for hook in self.result_hooks:
             if result is not None:
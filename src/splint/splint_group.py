@@ -0,0 +1,127 @@
+"""
+Streaming hierarchical summaries of results.
+
+group_by keeps every result in its group, which is what you want to display them but not
+to summarize millions of them.  SplintResultGrouper instead keeps counts (pass, fail, error,
+skip and warn) and a running score for every node of the hierarchy and can be fed one
+result at a time, e.g. straight from yield_all:
+
+    grouper = splint.SplintResultGrouper(["pkg_name", "module_name", "func_name"])
+    for result in grouper.tee(checker.yield_all()):
+        ...
+    grouper.summary()
+
+Groups are kept in the order they first appear.
+"""
+
+from typing import Any, Iterable, Iterator, Sequence
+
+from .splint_exception import SplintException
+from .splint_result import SplintResult, format_overview, result_kind
+from .splint_score import ScoreByResult, ScoreStrategy
+
+RESULT_KINDS = ("pass", "fail", "error", "skip", "warn")
+
+
+class SplintGroupNode:
+    """Counts and score for one group, plus its sub-groups."""
+
+    __slots__ = ("counts", "scorer", "groups", "results")
+
+    def __init__(self, scorer: ScoreStrategy, keep_results: bool = False):
+        self.counts = dict.fromkeys(("total",) + RESULT_KINDS, 0)
+        self.scorer = scorer
+        self.groups: dict[Any, "SplintGroupNode"] = {}
+        self.results: list[SplintResult] | None = [] if keep_results else None
+
+    def add(self, result: SplintResult) -> None:
+        """Count a result in this group."""
+        self.counts["total"] += 1
+        self.counts[result_kind(result)] += 1
+        self.scorer.update(result)
+        if self.results is not None:
+            self.results.append(result)
+
+    @property
+    def score(self) -> float:
+        """Score of the results in this group."""
+        return self.scorer.value()
+
+    def overview(self) -> str:
+        """Same summary as splint.overview for the results in this group."""
+        return format_overview(self.counts)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Counts and score of this group and (recursively) its sub-groups."""
+        d: dict[str, Any] = dict(self.counts)
+        d["score"] = self.score
+        if self.groups:
+            d["groups"] = {key: node.as_dict() for key, node in self.groups.items()}
+        return d
+
+
+class SplintResultGrouper:
+    """
+    Single pass hierarchical grouping of results by a list of SplintResult attributes.
+
+    Each node scores its results with its own instance of score_strategy's class (by_result
+    by default), using the incremental update/value protocol so scores are always current.
+    Results are only kept, on the leaf nodes, when keep_results is set.
+    """
+
+    def __init__(self,
+                 keys: Sequence[str],
+                 score_strategy: ScoreStrategy | type[ScoreStrategy] | str | None = None,
+                 keep_results: bool = False):
+        if not keys:
+            raise SplintException("Empty key list for grouping results.")
+        self.keys = list(keys)
+        if score_strategy is None:
+            self._strategy_class: type[ScoreStrategy] = ScoreByResult
+        elif isinstance(score_strategy, ScoreStrategy):
+            self._strategy_class = type(score_strategy)
+        else:
+            self._strategy_class = type(ScoreStrategy.strategy_factory(score_strategy))
+        self.keep_results = keep_results
+        self.root = self._node(leaf=False)
+
+    def _node(self, leaf: bool) -> SplintGroupNode:
+        return SplintGroupNode(self._strategy_class(), keep_results=leaf and self.keep_results)
+
+    def add(self, result: SplintResult) -> None:
+        """Count a result in the root and every group on its path."""
+        node = self.root
+        node.add(result)
+        last = len(self.keys) - 1
+        for depth, key in enumerate(self.keys):
+            value = getattr(result, key)
+            child = node.groups.get(value)
+            if child is None:
+                child = node.groups[value] = self._node(leaf=depth == last)
+            child.add(result)
+            node = child
+
+    def update(self, results: Iterable[SplintResult]) -> "SplintResultGrouper":
+        """Add all the results."""
+        for result in results:
+            self.add(result)
+        return self
+
+    def tee(self, results: Iterable[SplintResult]) -> Iterator[SplintResult]:
+        """Add each result and pass it on, use this to group results while yield_all runs."""
+        for result in results:
+            self.add(result)
+            yield result
+
+    def node(self, *path) -> SplintGroupNode:
+        """The node for a path of group values, e.g. grouper.node("my_pkg", "my_module")."""
+        node = self.root
+        for value in path:
+            if value not in node.groups:
+                raise SplintException(f"No group {list(path)} in the results.")
+            node = node.groups[value]
+        return node
+
+    def summary(self) -> dict[str, Any]:
+        """Nested dict with the counts and score of every group."""
+        return self.root.as_dict()
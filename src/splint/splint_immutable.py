@@ -7,9 +7,8 @@ checking run.
 
 THERE IS NO ASSURANCE THAT THIS WILL WORK IN ALL CASES. DON'T WRITE TO THE ENV VARIABLES!
 
+SplintEnvDataFrame lives in splint_immutable_df so pandas is only imported when it is used.
 """
-import pandas as pd
-
 from .splint_exception import SplintException
 
 
@@ -59,6 +58,10 @@ class SplintEnvList(list):
     def reverse(self):
         raise SplintException("Environment list is immutable, reverse is not supported")
 
+    def __reduce__(self):
+        # Default pickling rebuilds the list with append/extend which are blocked.
+        return self.__class__, (list(self),)
+
 
 class SplintEnvDict(dict):
     """
@@ -94,39 +97,18 @@ class SplintEnvDict(dict):
     def setdefault(self, key, default=None):
         raise SplintException("Environment dict is immutable, setdefault is not supported")
 
-
-class SplintEnvDataFrame(pd.DataFrame):
-    """
-    A class for a non-mutable pandas DataFrame. Operations causing modifications raise a
-    SplintException.
-
-    Similar to ImmutableList and ImmutableDict, this class shields large dataframes from
-    unintentional changes due to Python's dynamic nature.  This is not perfect and not
-    intended to be perfect.  I'm just trying to help...
-    """
-
-    def __init__(self, *args, **kwargs):
-        # super(SplintEnvDataFrame, self).__init__(*args, **kwargs)
-        super().__init__(*args, **kwargs)
-
-    def __setitem__(self, key, value):
-        raise SplintException("Environment DataFrame does not support item assignment")
-
-    def __delitem__(self, key):
-        raise SplintException("Environment DataFrame doesn't support column deletion")
-
-    def append(self, other, ignore_index=False, verify_integrity=False, sort=None):
-        raise SplintException("Environment DataFrame is immutable, append is not supported")
-
-    def pop(self, item):
-        raise SplintException("Environment DataFrame is immutable, pop is not supported")
-
-    def drop(self, labels=None, axis=0, index=None, columns=None, level=None, inplace=False, errors='raise'):
-        raise SplintException("Environment DataFrame is immutable, drop is not supported")
-
-    def insert(self, loc, column, value, allow_duplicates=False):
-        raise SplintException("Environment DataFrame is immutable, insert is not supported")
+    def __reduce__(self):
+        # Default pickling rebuilds the dict with __setitem__ which is blocked.
+        return self.__class__, (dict(self),)
 
 
 class SplintEnvSet(frozenset):
     """ Support immutable sets using frozenset """
+
+
+def __getattr__(name):
+    # SplintEnvDataFrame needs pandas, load it on first use.
+    if name == "SplintEnvDataFrame":
+        from .splint_immutable_df import SplintEnvDataFrame  # pylint: disable=import-outside-toplevel
+        return SplintEnvDataFrame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,74 @@
+"""
+Attribute index over a list of SplintFunctions.
+
+Selecting functions by tag/ruid/phase/level (the API endpoints, include_by_attribute) and
+listing the distinct attribute values used to mean scanning and sorting every function on
+every call.  The index is built once per list of functions and answers those in
+O(matches) time.
+"""
+
+import bisect
+from collections import defaultdict
+from typing import Iterable
+
+from .splint_function import SplintFunction
+
+
+def _positions_by(functions: list[SplintFunction], attr: str) -> dict:
+    """Map each value of attr to the positions of the functions that have it."""
+    positions = defaultdict(list)
+    for pos, function_ in enumerate(functions):
+        positions[getattr(function_, attr)].append(pos)
+    return dict(positions)
+
+
+class SplintFunctionIndex:
+    """
+    Inverted index from attribute values to functions.
+
+    Results are always returned in the same order as the list the index was built from.
+    """
+
+    def __init__(self, functions: Iterable[SplintFunction]):
+        # Lists are kept as is (not copied) so callers can tell which list an index belongs to.
+        self.functions = functions if isinstance(functions, list) else list(functions)
+        self.by_tag = _positions_by(self.functions, "tag")
+        self.by_ruid = _positions_by(self.functions, "ruid")
+        self.by_phase = _positions_by(self.functions, "phase")
+        self.by_level = _positions_by(self.functions, "level")
+
+        # Sorted (level, position) pairs for range queries
+        self._level_pairs = sorted((f.level, pos) for pos, f in enumerate(self.functions))
+        self._level_keys = [level for level, _ in self._level_pairs]
+
+        self.tags = sorted(self.by_tag)
+        self.ruids = sorted(self.by_ruid)
+        self.phases = sorted(self.by_phase)
+        self.levels = sorted(self.by_level)
+
+    def __len__(self):
+        return len(self.functions)
+
+    def _functions(self, positions: Iterable[int]) -> list[SplintFunction]:
+        return [self.functions[pos] for pos in sorted(set(positions))]
+
+    def select(self,
+               tags: Iterable[str] = (),
+               ruids: Iterable[str] = (),
+               phases: Iterable[str] = (),
+               levels: Iterable[int] = ()) -> list[SplintFunction]:
+        """Return the functions that match ANY of the given tags, ruids, phases or levels."""
+        positions = []
+        for index, values in ((self.by_tag, tags),
+                              (self.by_ruid, ruids),
+                              (self.by_phase, phases),
+                              (self.by_level, levels)):
+            for value in values:
+                positions.extend(index.get(value, []))
+        return self._functions(positions)
+
+    def level_range(self, low: int | None = None, high: int | None = None) -> list[SplintFunction]:
+        """Return the functions with low <= level <= high, a missing bound is unbounded."""
+        start = 0 if low is None else bisect.bisect_left(self._level_keys, low)
+        end = len(self._level_keys) if high is None else bisect.bisect_right(self._level_keys, high)
+        return self._functions(pos for _, pos in self._level_pairs[start:end])
@@ -11,6 +11,7 @@ import pathlib
 import sys
 from collections import Counter
 
+from .splint_env import SplintEnvStore
 from .splint_exception import SplintException
 from .splint_function import SplintFunction
 
@@ -39,6 +40,8 @@ class SplintModule:
         self.check_prefix: str = check_prefix
         self.env_prefix: str = env_prefix
         self.doc = ""
+        # Values from env functions with module scope, shared by every checker using this module
+        self.env_store = SplintEnvStore()
         if auto_load:
             self.load()
 
@@ -61,6 +64,10 @@ class SplintModule:
         """Add a discovered environment function to the list"""
         self.env_functions.append(func)
 
+    def close(self):
+        """Tear down the values of the module scoped env functions."""
+        self.env_store.clear()
+
     @staticmethod
     def _add_sys_path(module_file):
         """Add a module's directory to sys.path if it's not already there."""
@@ -0,0 +1,156 @@
+"""
+Batched progress reporting.
+
+The checker calls its progress callback when each function starts and ends and for every
+result, so a run with many cheap checks makes a huge number of calls.  Progress bars that
+redraw a UI (or send the progress over the network) on every call end up slowing the run down.
+
+SplintBatchedProgress is a SplintProgress that sits between the checker and a slow consumer.
+It collects the calls and hands the consumer a single SplintProgressEvent at most every
+interval_sec seconds or max_batch results, with the results since the last event and the
+counts so far.  Run level messages (start, complete, aborts, the score) are always passed on
+right away.
+
+    def show(event: splint.SplintProgressEvent):
+        bar.progress(event.fraction, f"{event.counts['fail']} fails so far")
+
+    checker.progress_callback = splint.SplintBatchedProgress(show, interval_sec=0.2)
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .splint_checker import PROGRESS_COMPLETE, PROGRESS_FUNC_DONE, PROGRESS_FUNC_START, PROGRESS_START, \
+    SplintProgress
+from .splint_exception import SplintException
+from .splint_result import SplintResult, result_kind
+
+EVENT_START = "start"
+EVENT_FUNCTION_START = "function_start"
+EVENT_FUNCTION_END = "function_end"
+EVENT_RESULT = "result"
+EVENT_MESSAGE = "message"
+EVENT_COMPLETE = "complete"
+
+
+@dataclass
+class SplintProgressEvent:
+    """
+    What happened since the last event.
+
+    Attributes:
+        kind: Kind of the most recent progress call (start, function_start, function_end,
+              result, message or complete).
+        current: Progress count (functions) from the most recent call.
+        total: Number of functions in the run.
+        msg: The most recent non-empty message.
+        results: Results since the last event.
+        counts: Counts of the results so far in the run (total, pass, fail, error, skip, warn).
+        functions_started: Functions started so far.
+        functions_done: Functions finished so far.
+    """
+    kind: str
+    current: int = 0
+    total: int = 0
+    msg: str = ""
+    results: list[SplintResult] = field(default_factory=list)
+    counts: dict[str, int] = field(default_factory=dict)
+    functions_started: int = 0
+    functions_done: int = 0
+
+    @property
+    def fraction(self) -> float:
+        """Progress from 0.0 to 1.0 based on the functions run."""
+        if self.total <= 0:
+            return 0.0
+        return min(max(self.current / self.total, 0.0), 1.0)
+
+
+def _event_kind(msg: str, result: SplintResult | None) -> str:
+    """Work out what a progress call is reporting."""
+    if result is not None:
+        return EVENT_RESULT
+    if msg == PROGRESS_START:
+        return EVENT_START
+    if msg == PROGRESS_COMPLETE:
+        return EVENT_COMPLETE
+    if msg == PROGRESS_FUNC_DONE:
+        return EVENT_FUNCTION_END
+    if msg.startswith(PROGRESS_FUNC_START):
+        return EVENT_FUNCTION_START
+    return EVENT_MESSAGE
+
+
+class SplintBatchedProgress(SplintProgress):
+    """
+    Progress adapter that coalesces progress calls into SplintProgressEvents.
+
+    Args:
+        callback: Called with each SplintProgressEvent.
+        interval_sec: Minimum time between events, 0 to only batch by count.
+        max_batch: Send an event once this many results are waiting.
+    """
+
+    def __init__(self,
+                 callback: Callable[[SplintProgressEvent], None],
+                 interval_sec: float = 0.25,
+                 max_batch: int = 1000):
+        super().__init__()
+        if interval_sec < 0 or max_batch < 1:
+            raise SplintException("interval_sec must be >= 0 and max_batch must be >= 1.")
+        self.callback = callback
+        self.interval_sec = interval_sec
+        self.max_batch = max_batch
+        self.events_sent = 0
+        self._reset()
+
+    def _reset(self):
+        """Start counting a new run."""
+        self._pending = SplintProgressEvent(EVENT_START)
+        self._counts = dict.fromkeys(("total", "pass", "fail", "error", "skip", "warn"), 0)
+        self._started = 0
+        self._done = 0
+        self._dirty = False
+        self._last_sent = time.monotonic()
+
+    def __call__(self, current_iteration: int, max_iterations, text: str, result=None):
+        kind = _event_kind(text, result)
+        if kind == EVENT_START:
+            self._reset()
+        elif kind == EVENT_FUNCTION_START:
+            self._started += 1
+        elif kind == EVENT_FUNCTION_END:
+            self._done += 1
+        elif kind == EVENT_RESULT:
+            self._counts["total"] += 1
+            self._counts[result_kind(result)] += 1
+            self._pending.results.append(result)
+
+        pending = self._pending
+        pending.kind = kind
+        pending.current = current_iteration
+        pending.total = max_iterations
+        if text:
+            pending.msg = text
+        self._dirty = True
+
+        # Run level events go out right away, the rest when the batch is big or old enough.
+        if kind in (EVENT_START, EVENT_COMPLETE, EVENT_MESSAGE) or \
+                len(pending.results) >= self.max_batch or \
+                time.monotonic() - self._last_sent >= self.interval_sec:
+            self.flush()
+
+    def flush(self):
+        """Send an event now if anything happened since the last one."""
+        if not self._dirty:
+            return
+        event = self._pending
+        event.counts = dict(self._counts)
+        event.functions_started = self._started
+        event.functions_done = self._done
+        self._pending = SplintProgressEvent(event.kind, event.current, event.total, event.msg)
+        self._dirty = False
+        self._last_sent = time.monotonic()
+        self.events_sent += 1
+        self.callback(event)
@@ -5,6 +5,43 @@ import re
 from typing import Sequence
 from .splint_exception import SplintException
 
+# Characters that make a pattern a regular expression rather than a literal name.
+_REGEX_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+# Global inline flags such as (?i) at the start of a pattern.
+_INLINE_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+class _PatternMatcher:
+    """
+    Matches a value against a list of patterns as if calling re.fullmatch for each one.
+
+    Patterns without regex characters (the common case, e.g. "r1" or "db") are matched with a
+    set lookup, while the remaining patterns are compiled into one alternation.  Patterns with
+    groups (whose backreference numbers would shift) or inline flags (which must come first)
+    can't be merged and are matched one at a time.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.literals = frozenset(p for p in patterns if not _REGEX_CHARS.intersection(p))
+        regexes = [p for p in patterns if p not in self.literals]
+        try:
+            compiled = [re.compile(p) for p in regexes]
+            self.separate = [regex for regex in compiled if regex.groups or _INLINE_FLAGS.match(regex.pattern)]
+            mergeable = [regex.pattern for regex in compiled if regex not in self.separate]
+            self.regex = re.compile("|".join(f"(?:{p})" for p in mergeable)) if mergeable else None
+        except re.error as error:
+            raise SplintException(f"Invalid RC pattern in {regexes}: {error}") from error
+
+    def __bool__(self):
+        return bool(self.literals) or self.regex is not None or bool(self.separate)
+
+    def match(self, value: str) -> bool:
+        """True if value fully matches any of the patterns."""
+        return (value in self.literals or
+                (self.regex is not None and self.regex.fullmatch(value) is not None) or
+                any(regex.fullmatch(value) for regex in self.separate))
+
 
 class SplintRC:
     """
@@ -45,12 +82,6 @@ class SplintRC:
         self.expand_attributes(rc_data)
         self.name = rc_data['display_name']
 
-        # This is a special case
-        self.is_inclusion_list_empty = all(not r for r in [self.ruids,
-                                                           self.phases,
-                                                           self.tags,
-                                                           self.levels])
-
     # def _not_int_list(self, lst):
     #    return [item for item in lst if not item.isdigit()]
 
@@ -110,6 +141,19 @@ class SplintRC:
         self.phases, self.ex_phases = self._separate_values(rc_data.get('phases', []))
         self.levels, self.ex_levels = self._separate_values(rc_data.get('levels', []))
 
+        # This is a special case
+        self.is_inclusion_list_empty = all(not r for r in [self.ruids,
+                                                           self.phases,
+                                                           self.tags,
+                                                           self.levels])
+
+        # Compile the patterns once (in ruid, tag, level, phase order) rather than on every match.
+        self._matchers = [_PatternMatcher(p) for p in (self.ruids, self.tags, self.levels, self.phases)]
+        self._ex_matchers = [_PatternMatcher(p) for p in (self.ex_ruids, self.ex_tags, self.ex_levels, self.ex_phases)]
+
+        # Decisions are remembered, so re-applying the RC (every prepare()) is just lookups.
+        self._match_cache: dict[tuple[str, str, str, str], bool] = {}
+
     def does_match(self, ruid: str = "", tag: str = "", phase: str = "", level: str = "") -> bool:
         """
         Determines whether a given `ruid`/`tag`/`phase`/`level` matches any of the inclusions
@@ -131,29 +175,28 @@ class SplintRC:
         # This is sort of a hack levels must be integers, this makes any non integer level not match
         level = str(level)
 
-        # This is a bit problematic because levels are ints not strs
-        patterns: list[tuple[list, str]] = [(self.ruids, ruid),
-                                            (self.tags, tag),
-                                            (self.levels, level),
-                                            (self.phases, phase)]
-        ex_patterns: list[tuple[list, str]] = [(self.ex_ruids, ruid),
-                                               (self.ex_tags, tag),
-                                               (self.ex_levels, level),
-                                               (self.ex_phases, phase)]
+        key = (ruid, tag, level, phase)
+        match = self._match_cache.get(key)
+        if match is None:
+            match = self._match_cache[key] = self._does_match(key)
+        return match
+
+    def _does_match(self, attributes: tuple[str, str, str, str]) -> bool:
+        """Uncached does_match, attributes are (ruid, tag, level, phase)."""
 
         # Check if any of the inputs match an inclusion pattern
         if not self.is_inclusion_list_empty:
-            for pattern_list, attribute in patterns:
+            for matcher, attribute in zip(self._matchers, attributes):
                 if not attribute:
                     continue
-                if pattern_list and not any(re.fullmatch(pat, attribute) for pat in pattern_list):
+                if matcher and not matcher.match(attribute):
                     return False
 
         # Check if any of the inputs match an exclusion pattern
-        for ex_pattern_list, attribute in ex_patterns:
+        for ex_matcher, attribute in zip(self._ex_matchers, attributes):
             if not attribute:
                 continue
-            if any(re.fullmatch(exclusion, attribute) for exclusion in ex_pattern_list):
+            if ex_matcher.match(attribute):
                 return False
 
         return True
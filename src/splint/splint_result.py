@@ -1,14 +1,11 @@
 """ This module contains the SplintResult class and some common result transformers. """
 
-import itertools
 import traceback
-from collections import Counter
-from dataclasses import asdict, dataclass, field
-from operator import attrgetter
-from typing import Any,Sequence 
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Iterable, Sequence
 
 from .splint_exception import SplintException
-from .splint_format import SplintMarkup
+from .splint_format import SplintAbstractRender, SplintMarkup, render_cached
 
 
 @dataclass
@@ -34,6 +31,7 @@ class SplintResult:
         except_ (Exception): Raised exception, if any. Default is None.
         traceback (str): Exception traceback, if any. Default is "".
         skipped (bool): Function skip flag. Default is False.
+        timed_out (bool): Function ran past its timeout. Default is False.
         tag (str): Function tag. Default is "".
         level (int): Function level. Default is 1.
         count (int): Return value count from a SplintFunction.
@@ -51,7 +49,10 @@ class SplintResult:
     info_msg: str = ""
     warn_msg: str = ""
 
-    msg_rendered = ""
+    # msg_rendered is a property (see below) that renders msg the first time it is read.
+    # These aren't annotated so they stay out of the dataclass fields (as_dict, repr, __init__).
+    _msg_rendered = ""
+    _renderer = None
 
     # Function Info
     doc: str = ""
@@ -63,6 +64,7 @@ class SplintResult:
     except_: Exception | None = None
     traceback: str = ""
     skipped: bool = False
+    timed_out: bool = False
 
     weight: float = 100.0
 
@@ -95,11 +97,131 @@ class SplintResult:
         d['except_'] = str(d['except_'])
         return d
 
+    @property
+    def msg_rendered(self) -> str:
+        """The rendered message, rendering is deferred until it is first needed."""
+        if self._renderer is not None:
+            self._msg_rendered = render_cached(self._renderer, self.msg)
+            self._renderer = None
+        return self._msg_rendered
+
+    @msg_rendered.setter
+    def msg_rendered(self, value: str):
+        self._msg_rendered = value
+        self._renderer = None
+
+    def defer_render(self, renderer: SplintAbstractRender) -> None:
+        """Render msg with renderer when msg_rendered is read rather than now."""
+        self._renderer = renderer
+
 
 # Shorthand
 SR = SplintResult
 
 
+@dataclass(frozen=True, slots=True)
+class SplintFunctionInfo:
+    """
+    The SplintResult fields that come from the function that made the result.
+
+    Every result from a function has the same values for these, so compact results share one
+    of these records rather than each carrying their own copy.
+    """
+    pkg_name: str = ""
+    module_name: str = ""
+    func_name: str = ""
+    doc: str = ""
+    ruid: str = ""
+    tag: str = ""
+    level: int = 1
+    phase: str = ""
+    ttl_minutes: float = 0.0
+    skip_on_none: bool = False
+    fail_on_none: bool = False
+
+
+FUNCTION_INFO_FIELDS = tuple(SplintFunctionInfo.__dataclass_fields__)
+
+# Everything else is specific to a single result.
+RESULT_FIELDS = ("status", "msg", "info_msg", "warn_msg", "msg_rendered", "runtime_sec", "except_",
+                 "traceback", "skipped", "timed_out", "weight", "count", "mit_msg", "owner_list")
+
+# owner_list is almost always empty, compact results only make the list when it is used, and
+# msg_rendered is a property backed by _msg_rendered and _renderer.
+_SLOT_FIELDS = tuple(name for name in RESULT_FIELDS if name not in ("msg_rendered", "owner_list")) + \
+               ("_msg_rendered", "_renderer", "_owner_list")
+
+
+class SplintCompactResult(SplintResult):
+    """
+    Memory efficient SplintResult for functions that yield huge numbers of results.
+
+    Per-result values are stored in slots and the function level values (doc, ruid, tag...)
+    are read from a shared SplintFunctionInfo.  Attribute access, equality and as_dict() work
+    just like SplintResult.  Assigning a function level value gives this result its own copy
+    of the info record, so other results are never changed.
+
+    This is a SplintResult subclass so isinstance checks keep working, which means instances
+    still have a (normally empty) __dict__.  A result takes about 260 bytes instead of 400 on
+    CPython 3.11, plus its message strings.
+    """
+
+    __slots__ = _SLOT_FIELDS + ("info",)
+
+    def __init__(self, info: SplintFunctionInfo | None = None, **kwargs):
+        # pylint: disable=super-init-not-called
+        self.info = info or SplintFunctionInfo()
+        self._renderer = None
+        self._msg_rendered = kwargs.pop("msg_rendered", "")
+        for name in RESULT_FIELDS:
+            if name != "msg_rendered":
+                setattr(self, name, kwargs.pop(name, getattr(SplintResult, name, None)))
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+        if self.except_ is not None and not self.traceback:
+            self.traceback = traceback.format_exc()
+
+    @classmethod
+    def from_result(cls, result: SplintResult, info: SplintFunctionInfo) -> "SplintCompactResult":
+        """Make a compact copy of result that shares info."""
+        compact = cls.__new__(cls)
+        compact.info = info
+        for name in _SLOT_FIELDS[:-1]:
+            # Reads the backing _msg_rendered/_renderer so a deferred render stays deferred
+            setattr(compact, name, getattr(result, name))
+        # Don't hang on to the (usually empty) list from the original result
+        compact.owner_list = result.owner_list or None
+        return compact
+
+    @property
+    def owner_list(self) -> list[str]:
+        """Owners, the list is created the first time it is needed."""
+        if self._owner_list is None:
+            self._owner_list = []
+        return self._owner_list
+
+    @owner_list.setter
+    def owner_list(self, value: list[str] | None):
+        self._owner_list = value
+
+
+def _info_property(name: str) -> property:
+    """Property that reads a function level value from the shared info record."""
+
+    def getter(self):
+        return getattr(self.info, name)
+
+    def setter(self, value):
+        if getattr(self.info, name) != value:
+            self.info = replace(self.info, **{name: value})
+
+    return property(getter, setter, doc=f"{name} from the function that made the result.")
+
+
+for _name in FUNCTION_INFO_FIELDS:
+    setattr(SplintCompactResult, _name, _info_property(_name))
+
+
 class SplintYield:
     """
     This allows syntactic sugar to know how many times a generator
@@ -221,7 +343,7 @@ def results_as_dict(results: list[SplintResult]):
     return [result.as_dict() for result in results]
 
 
-def group_by(results: Sequence[SplintResult], keys: Sequence[str]) -> dict[str, Any]:
+def group_by(results: Iterable[SplintResult], keys: Sequence[str]) -> dict[str, Any]:
     """
     Groups a list of SplintResult by a list of keys.
 
@@ -229,61 +351,61 @@ def group_by(results: Sequence[SplintResult], keys: Sequence[str]) -> dict[str,
     SplintResult as the grouping criteria.  You can group in any order or depth with
     any number of keys.
 
+    The results are grouped in a single pass using nested dictionaries, so groups (and the
+    results in them) are in the order they first appear.  Use SplintResultGrouper for
+    counts and scores per group without keeping the results.
+
     Args:
-        results (Sequence[SplintResult]): The list of results to group.
-        keys (Sequence[str]): The list of keys to group by.S
+        results (Iterable[SplintResult]): The results to group.
+        keys (Sequence[str]): The list of keys to group by.
 
     """
 
     if not keys:
         raise SplintException("Empty key list for grouping results.")
 
-    key = keys[0]
-    key_func = attrgetter(key)
+    *parent_keys, leaf_key = keys
+    grouped: dict[str, Any] = {}
+    for result in results:
+        node = grouped
+        for key in parent_keys:
+            node = node.setdefault(getattr(result, key), {})
+        node.setdefault(getattr(result, leaf_key), []).append(result)
+    return grouped
 
-    # I do not believe this is an actual test case as it would require a bug in
-    # the code.  I'm leaving it here for now.
-    # if not all(hasattr(x, key) for x in results):
-    #    raise splint.SplintValueError(f"All objects must have an attribute '{key}'")
 
-    # Sort and group by the first key
-    results = sorted(results, key=key_func)
-    group_results: list[tuple[str, Any]] = [(k, list(g)) for k, g in itertools.groupby(results, key=key_func)]
+def result_kind(result: SplintResult) -> str:
+    """The overview category of a result, one of skip, error, fail, warn or pass."""
+    if result.skipped:
+        return "skip"
+    if result.except_:
+        return "error"
+    if not result.status:
+        return "fail"
+    if result.warn_msg:
+        return "warn"
+    return "pass"
 
-    # Recursively group by the remaining keys
-    if len(keys) > 1:
-        for i, (k, group) in enumerate(group_results):
-            group_results[i] = (k, group_by(group, keys[1:]))
 
-    return dict(group_results)
+def format_overview(counts: dict[str, int]) -> str:
+    """Format a dict of result_kind counts (plus a total) as an overview string."""
+    return f"Total: {counts['total']}, Passed: {counts['pass']}, Failed: {counts['fail']}, " \
+           f"Errors: {counts['error']}, Skipped: {counts['skip']}, Warned: {counts['warn']}"
 
 
-def overview(results: list[SplintResult]) -> str:
+def overview(results: Iterable[SplintResult]) -> str:
     """
     Returns an overview of the results.
 
     Args:
-        results (list[SplintResult]): The list of results to summarize.
+        results (Iterable[SplintResult]): The results to summarize, any iterable works so
+                                          this can be used on yield_all directly.
 
     Returns:
         str: A summary of the results.
     """
-
-    result_counter = Counter(
-        'skip' if result.skipped else
-        'error' if result.except_ else
-        'fail' if not result.status else
-        'warn' if result.warn_msg else
-        'pass'
-        for result in results
-    )
-
-    total = len(results)
-    passed = result_counter['pass']
-    failed = result_counter['fail']
-    errors = result_counter['error']
-    skipped = result_counter['skip']
-    warned = result_counter['warn']
-
-    return f"Total: {total}, Passed: {passed}, Failed: {failed}, " \
-           f"Errors: {errors}, Skipped: {skipped}, Warned: {warned}"
+    counts = dict.fromkeys(("total", "pass", "fail", "error", "skip", "warn"), 0)
+    for result in results:
+        counts[result_kind(result)] += 1
+        counts["total"] += 1
+    return format_overview(counts)
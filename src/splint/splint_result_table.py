@@ -0,0 +1,221 @@
+"""
+Columnar storage for results.
+
+A list of SplintResult objects is flexible, but counting, grouping and scoring millions of
+them means walking the list in Python.  SplintResultTable keeps the fields used for
+aggregation in NumPy arrays instead:
+
+- status is int8 (1 pass, 0 fail, -1 None), the flags are bool arrays.
+- weight, runtime_sec, count and level are numeric arrays.
+- ruid, tag, phase, pkg_name, module_name and func_name are categorical codes into a list of
+  categories.
+
+Results are buffered and written to the arrays in batches, and the arrays grow by doubling,
+so appending is cheap.  Column access returns views and exports to pandas/Arrow don't copy the
+numeric data.
+
+NumPy is required, pandas and pyarrow only for their exports.
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from .splint_exception import SplintException
+from .splint_result import SplintResult
+
+DEFAULT_BATCH_SIZE = 4096
+
+STATUS_PASS = 1
+STATUS_FAIL = 0
+STATUS_NONE = -1
+
+NUMERIC_COLUMNS = {
+    "status": np.int8,
+    "skipped": np.bool_,
+    "timed_out": np.bool_,
+    "error": np.bool_,
+    "warn": np.bool_,
+    "weight": np.float64,
+    "runtime_sec": np.float64,
+    "count": np.int64,
+    "level": np.int64,
+}
+
+CATEGORICAL_COLUMNS = ("ruid", "tag", "phase", "pkg_name", "module_name", "func_name")
+
+# Also coded, but not exported, is the (pkg_name, module_name, func_name) of each result.
+_CODED_COLUMNS = CATEGORICAL_COLUMNS + ("function",)
+
+
+def _row(result: SplintResult) -> tuple:
+    """The numeric values for a result in NUMERIC_COLUMNS order."""
+    status = STATUS_NONE if result.status is None else STATUS_PASS if result.status else STATUS_FAIL
+    return (status, result.skipped, result.timed_out, result.except_ is not None, bool(result.warn_msg),
+            result.weight, result.runtime_sec, result.count, result.level)
+
+
+class SplintResultTable:
+    """
+    Column oriented results.
+
+    Only the fields needed for counting, grouping and scoring are stored, messages stay
+    with the result objects.
+    """
+
+    def __init__(self, results: Iterable[SplintResult] = (), batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise SplintException("Batch size must be at least 1.")
+        self.batch_size = batch_size
+        self._size = 0
+        self._capacity = 0
+        self._columns: dict[str, np.ndarray] = {name: np.empty(0, dtype=dtype)
+                                                for name, dtype in NUMERIC_COLUMNS.items()}
+        self._codes: dict[str, np.ndarray] = {name: np.empty(0, dtype=np.int32) for name in _CODED_COLUMNS}
+        self._categories: dict[str, list] = {name: [] for name in _CODED_COLUMNS}
+        self._category_codes: dict[str, dict] = {name: {} for name in _CODED_COLUMNS}
+        self._pending_rows: list[tuple] = []
+        self._pending_codes: list[list[int]] = []
+        self.extend(results)
+
+    def __len__(self) -> int:
+        return self._size + len(self._pending_rows)
+
+    def _code(self, column: str, value) -> int:
+        """Categorical code for value, adding a new category if needed."""
+        codes = self._category_codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._categories[column])
+            self._categories[column].append(value)
+        return code
+
+    def append(self, result: SplintResult) -> None:
+        """Add a result, it is written to the arrays when the batch is full."""
+        self._pending_rows.append(_row(result))
+        codes = [self._code(column, getattr(result, column)) for column in CATEGORICAL_COLUMNS]
+        codes.append(self._code("function", (result.pkg_name, result.module_name, result.func_name)))
+        self._pending_codes.append(codes)
+        if len(self._pending_rows) >= self.batch_size:
+            self.flush()
+
+    def extend(self, results: Iterable[SplintResult]) -> None:
+        """Add many results."""
+        for result in results:
+            self.append(result)
+
+    def _grow(self, needed: int) -> None:
+        """Make room for needed rows, doubling so appends are amortized O(1)."""
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, 2 * self._capacity, self.batch_size)
+        for store in (self._columns, self._codes):
+            for name, array in store.items():
+                grown = np.empty(capacity, dtype=array.dtype)
+                grown[:self._size] = array[:self._size]
+                store[name] = grown
+        self._capacity = capacity
+
+    def flush(self) -> None:
+        """Write the pending batch to the arrays."""
+        if not self._pending_rows:
+            return
+        start, end = self._size, self._size + len(self._pending_rows)
+        self._grow(end)
+        for name, values in zip(NUMERIC_COLUMNS, zip(*self._pending_rows)):
+            self._columns[name][start:end] = values
+        for name, values in zip(_CODED_COLUMNS, zip(*self._pending_codes)):
+            self._codes[name][start:end] = values
+        self._size = end
+        self._pending_rows = []
+        self._pending_codes = []
+
+    def column(self, name: str) -> np.ndarray:
+        """A (read only) view of a numeric column or of the codes of a categorical column."""
+        self.flush()
+        if name in self._columns:
+            view = self._columns[name][:self._size]
+        elif name in self._codes:
+            view = self._codes[name][:self._size]
+        else:
+            raise SplintException(f"Unknown result table column '{name}'")
+        view.flags.writeable = False
+        return view
+
+    def categories(self, name: str) -> list:
+        """The category values for a categorical column, codes index into this list."""
+        if name not in self._categories:
+            raise SplintException(f"Unknown categorical column '{name}'")
+        return list(self._categories[name])
+
+    @property
+    def passed(self) -> np.ndarray:
+        """Mask of results that passed and weren't skipped."""
+        return (self.column("status") == STATUS_PASS) & ~self.column("skipped")
+
+    @property
+    def failed(self) -> np.ndarray:
+        """Mask of results that didn't pass and weren't skipped."""
+        return (self.column("status") != STATUS_PASS) & ~self.column("skipped")
+
+    @property
+    def pass_count(self) -> int:
+        """Number of passes"""
+        return int(np.count_nonzero(self.passed))
+
+    @property
+    def fail_count(self) -> int:
+        """Number of fails"""
+        return int(np.count_nonzero(self.failed))
+
+    @property
+    def skip_count(self) -> int:
+        """Number of skips"""
+        return int(np.count_nonzero(self.column("skipped")))
+
+    @property
+    def warn_count(self) -> int:
+        """Number of warns"""
+        return int(np.count_nonzero(self.column("warn")))
+
+    @property
+    def error_count(self) -> int:
+        """Number of results with exceptions"""
+        return int(np.count_nonzero(self.column("error")))
+
+    def group_counts(self, name: str, mask: np.ndarray | None = None) -> dict:
+        """
+        Count the results for each category of a categorical column, optionally only the
+        results selected by a boolean mask (e.g. table.failed).
+        """
+        codes = self.column(name)
+        if mask is not None:
+            codes = codes[mask]
+        counts = np.bincount(codes, minlength=len(self._categories[name]))
+        return {category: int(count) for category, count in zip(self._categories[name], counts)}
+
+    def function_ids(self) -> tuple[np.ndarray, int]:
+        """
+        Integer id of the function (package, module and function name) of each result along with
+        the number of functions, ids are numbered in order of first appearance.
+        """
+        return self.column("function"), len(self._categories["function"])
+
+    def to_pandas(self):
+        """DataFrame of all the columns, categorical columns use pandas categoricals."""
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        data = {name: self.column(name) for name in NUMERIC_COLUMNS}
+        for name in CATEGORICAL_COLUMNS:
+            data[name] = pd.Categorical.from_codes(self.column(name), categories=self._categories[name])
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self):
+        """Arrow table of all the columns, categorical columns use dictionary arrays."""
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+        arrays = {name: pa.array(self.column(name)) for name in NUMERIC_COLUMNS}
+        for name in CATEGORICAL_COLUMNS:
+            arrays[name] = pa.DictionaryArray.from_arrays(pa.array(self.column(name)),
+                                                          pa.array(self._categories[name]))
+        return pa.table(arrays)
@@ -17,6 +17,9 @@ class ScoreStrategy(abc.ABC):
 
     strategy_name: str | None = None
 
+    def __init__(self):
+        self.reset()
+
     @abc.abstractmethod
     def score(self, results: list[SplintResult]) -> float:  # pragma: no cover
         """Abstract score method"""
@@ -24,6 +27,22 @@ class ScoreStrategy(abc.ABC):
     def __call__(self, results: list[SplintResult]):
         return self.score(results)
 
+    # Incremental scoring.  The checker calls reset() at the start of a run and update() for
+    # every result so value() is the score of the results so far.  The default keeps the
+    # results and rescores them, the built-in strategies keep running totals so value() is O(1).
+
+    def reset(self) -> None:
+        """Start a new incremental score."""
+        self._results: list[SplintResult] = []
+
+    def update(self, result: SplintResult) -> None:
+        """Add a result to the incremental score."""
+        self._results.append(result)
+
+    def value(self) -> float:
+        """The score of the results given to update since the last reset."""
+        return self.score(self._results)
+
     @classmethod
     def strategy_factory(cls, strategy_name_or_class) -> "ScoreStrategy":
         """Make a strategy object from a name or class.
@@ -67,6 +86,23 @@ class ScoreByResult(ScoreStrategy):
 
         return (100.0 * passed_sum) / (weight_sum * 1.0)
 
+    def reset(self) -> None:
+        self._passed_sum = 0.0
+        self._weight_sum = 0.0
+        self._scored = 0
+
+    def update(self, result: SplintResult) -> None:
+        if result.skipped:
+            return
+        self._passed_sum += result.weight if result.status else 0.0
+        self._weight_sum += result.weight
+        self._scored += 1
+
+    def value(self) -> float:
+        if not self._scored:
+            return 0.0
+        return (100.0 * self._passed_sum) / (self._weight_sum * 1.0)
+
 
 class ScoreByFunctionBinary(ScoreStrategy):
     """Calculate the score by requiring ALL results from a function
@@ -101,6 +137,30 @@ class ScoreByFunctionBinary(ScoreStrategy):
         # The score should be the average of the scores for each function
         return sum(score_functions.values()) / (len(score_functions) * 1.0)
 
+    def reset(self) -> None:
+        self._function_passed: dict[str, bool] = {}
+        self._passed_functions = 0
+        self._scored = 0
+
+    def update(self, result: SplintResult) -> None:
+        # Like score, skipped results count towards their function but can't score on their own.
+        key = f"{result.pkg_name}.{result.module_name}.{result.func_name}".lstrip(".")
+        passed = bool(result.status)
+        previous = self._function_passed.get(key)
+        if previous is None:
+            self._function_passed[key] = passed
+            self._passed_functions += passed
+        elif previous and not passed:
+            self._function_passed[key] = False
+            self._passed_functions -= 1
+        if not result.skipped:
+            self._scored += 1
+
+    def value(self) -> float:
+        if not self._scored:
+            return 0.0
+        return 100.0 * self._passed_functions / (len(self._function_passed) * 1.0)
+
 
 class ScoreByFunctionMean(ScoreStrategy):
     """Calculate score by averaging the results from a function.
@@ -143,6 +203,25 @@ class ScoreByFunctionMean(ScoreStrategy):
         # The score should be the average of the scores for each function
         return (100.0 * sum_passed) / (sum_weights * 1.0)
 
+    def reset(self) -> None:
+        self._passed_sum = 0.0
+        self._weight_sum = 0.0
+        self._scored = 0
+
+    def update(self, result: SplintResult) -> None:
+        if result.skipped:
+            return
+        self._passed_sum += result.weight if result.status else 0.0
+        self._weight_sum += result.weight
+        self._scored += 1
+
+    def value(self) -> float:
+        if not self._scored:
+            return 0.0
+        if self._weight_sum == 0.0:
+            raise SplintException("The sum of weights is 0.  This is not allowed.")
+        return (100.0 * self._passed_sum) / (self._weight_sum * 1.0)
+
 
 class ScoreBinaryFail(ScoreStrategy):
     """Anything fails then the test is a fail.  Empty results fail."""
@@ -160,6 +239,20 @@ class ScoreBinaryFail(ScoreStrategy):
             return 0.0
         return 100.0
 
+    def reset(self) -> None:
+        self._seen = 0
+        self._failed = False
+
+    def update(self, result: SplintResult) -> None:
+        self._seen += 1
+        if not result.skipped and not result.status:
+            self._failed = True
+
+    def value(self) -> float:
+        if not self._seen or self._failed:
+            return 0.0
+        return 100.0
+
 
 class ScoreBinaryPass(ScoreStrategy):
     """Anything passes then the test is a pass. Empty results fail. """
@@ -172,3 +265,13 @@ class ScoreBinaryPass(ScoreStrategy):
         if any(result.status for result in results if not result.skipped):
             return 100.0
         return 0.0
+
+    def reset(self) -> None:
+        self._passed = False
+
+    def update(self, result: SplintResult) -> None:
+        if not result.skipped and result.status:
+            self._passed = True
+
+    def value(self) -> float:
+        return 100.0 if self._passed else 0.0
@@ -0,0 +1,214 @@
+"""
+Streaming result sinks.
+
+run_all keeps every result in memory and the usual way to save them (results_as_dict plus one
+big json.dump) builds a second copy before anything is written.  Sinks instead consume the
+results as yield_all produces them and write them out in small pieces:
+
+- SplintJsonlSink: One JSON object per line (JSONL/NDJSON).
+- SplintGzipJsonlSink: The same, gzip compressed.
+- SplintParquetSink: Parquet file written in row groups of batch_size results (requires pyarrow).
+
+Sinks write SplintResult.as_dict() for each result.  Given a renderer they also write the
+rendered message, rendering in bulk with the shared render cache.
+
+Memory use is bounded by the sink's buffer no matter how many results there are, and the
+JSONL sinks flush every flush_every results so a run that crashes still leaves the results
+written up to that point.
+
+    with splint.make_sink("results.jsonl.gz") as sink:
+        sink.write_all(checker.yield_all())
+"""
+
+import gzip
+import json
+import pathlib
+import types
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, get_args
+
+from .splint_exception import SplintException
+from .splint_format import SplintAbstractRender, render_cached
+from .splint_result import SplintResult
+
+DEFAULT_FLUSH_EVERY = 100
+DEFAULT_BATCH_SIZE = 1000
+
+
+class SplintResultSink(ABC):
+    """
+    Base class for result sinks.
+
+    Subclasses implement write and close.  Sinks are context managers so the output is
+    finished even when the run raises.
+    """
+
+    def __init__(self, renderer: SplintAbstractRender | None = None):
+        self.count = 0
+        self.renderer = renderer
+
+    def _as_dict(self, result: SplintResult) -> dict:
+        """The values written for a result."""
+        d = result.as_dict()
+        if self.renderer is not None:
+            d["msg_rendered"] = render_cached(self.renderer, result.msg)
+        return d
+
+    @abstractmethod
+    def write(self, result: SplintResult) -> None:  # pragma: no cover
+        """Write a single result."""
+
+    @abstractmethod
+    def close(self) -> None:  # pragma: no cover
+        """Write anything that is buffered and close the output."""
+
+    def tee(self, results: Iterable[SplintResult]) -> Iterator[SplintResult]:
+        """Write each result and pass it on, for when the caller also needs the results."""
+        for result in results:
+            self.write(result)
+            yield result
+
+    def write_all(self, results: Iterable[SplintResult]) -> int:
+        """Write all the results, returning how many were written."""
+        for result in results:
+            self.write(result)
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SplintJsonlSink(SplintResultSink):
+    """Write results as JSON lines, values that aren't JSON types are written as strings."""
+
+    def __init__(self,
+                 path: str | pathlib.Path,
+                 flush_every: int = DEFAULT_FLUSH_EVERY,
+                 renderer: SplintAbstractRender | None = None):
+        super().__init__(renderer)
+        if flush_every < 1:
+            raise SplintException("flush_every must be at least 1.")
+        self.path = pathlib.Path(path)
+        self.flush_every = flush_every
+        self._file = self._open()
+
+    def _open(self):
+        return open(self.path, "w", encoding="utf-8")
+
+    def write(self, result: SplintResult) -> None:
+        self._file.write(json.dumps(self._as_dict(result), default=str))
+        self._file.write("\n")
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class SplintGzipJsonlSink(SplintJsonlSink):
+    """
+    Write results as gzip compressed JSON lines.
+
+    Each flush ends a compressed block, so a crashed run leaves a file that can be read up to
+    the last flush (gzip tools will complain about the missing trailer).
+    """
+
+    def _open(self):
+        return gzip.open(self.path, "wt", encoding="utf-8")
+
+
+def _parquet_schema(rendered: bool = False):
+    """Arrow schema for SplintResult.as_dict() rows, plus msg_rendered if rendered."""
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+    arrow_types = {bool: pa.bool_(), int: pa.int64(), float: pa.float64(), str: pa.string()}
+    fields = []
+    for name, field_ in SplintResult.__dataclass_fields__.items():
+        field_type = field_.type
+        # "X | None" is stored as a nullable X, so status is a nullable bool.
+        if isinstance(field_type, types.UnionType):
+            args = [arg for arg in get_args(field_type) if arg is not type(None)]
+            field_type = args[0] if len(args) == 1 else field_type
+        if name == "owner_list":
+            fields.append(pa.field(name, pa.list_(pa.string())))
+        else:
+            # Anything else, like except_, is stored as a string like as_dict does.
+            fields.append(pa.field(name, arrow_types.get(field_type, pa.string())))
+    if rendered:
+        fields.append(pa.field("msg_rendered", pa.string()))
+    return pa.schema(fields)
+
+
+class SplintParquetSink(SplintResultSink):
+    """
+    Write results to a Parquet file, batch_size results per row group.
+
+    Parquet files are only readable once the footer is written by close, so use the sink as a
+    context manager.
+    """
+
+    def __init__(self,
+                 path: str | pathlib.Path,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 renderer: SplintAbstractRender | None = None):
+        super().__init__(renderer)
+        if batch_size < 1:
+            raise SplintException("batch_size must be at least 1.")
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+        self.path = pathlib.Path(path)
+        self.batch_size = batch_size
+        self.schema = _parquet_schema(rendered=renderer is not None)
+        self._str_fields = [field_.name for field_ in self.schema if field_.type == pa.string()]
+        self._bool_fields = [field_.name for field_ in self.schema if field_.type == pa.bool_()]
+        self._rows: list[dict] = []
+        self._writer = pq.ParquetWriter(str(self.path), self.schema)
+
+    def _row(self, result: SplintResult) -> dict:
+        row = self._as_dict(result)
+        for name in self._str_fields:
+            value = row.get(name)
+            if value is not None and not isinstance(value, str):
+                row[name] = str(value)
+        for name in self._bool_fields:
+            value = row.get(name)
+            if value is not None and not isinstance(value, bool):
+                row[name] = bool(value)
+        return row
+
+    def write(self, result: SplintResult) -> None:
+        self._rows.append(self._row(result))
+        self.count += 1
+        if len(self._rows) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._rows:
+            import pyarrow as pa  # pylint: disable=import-outside-toplevel
+            self._writer.write_table(pa.Table.from_pylist(self._rows, schema=self.schema))
+            self._rows = []
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._flush()
+            self._writer.close()
+            self._writer = None
+
+
+def make_sink(path: str | pathlib.Path, renderer: SplintAbstractRender | None = None) -> SplintResultSink:
+    """
+    Make a sink based on the file name, ".parquet" files use SplintParquetSink, ".gz" files
+    use SplintGzipJsonlSink and everything else (.jsonl, .ndjson, .json...) uses SplintJsonlSink.
+    """
+    suffix = pathlib.Path(path).suffix.lower()
+    if suffix == ".parquet":
+        return SplintParquetSink(path, renderer=renderer)
+    if suffix == ".gz":
+        return SplintGzipJsonlSink(path, renderer=renderer)
+    return SplintJsonlSink(path, renderer=renderer)
@@ -0,0 +1,135 @@
+"""
+NumPy versions of the built-in scoring strategies.
+
+The strategies in splint_score walk a list of results and build per-function dictionaries
+keyed by "pkg.module.func" strings.  The versions here work on the columns of a
+SplintResultTable (pass/skip flags, weights and integer function ids) and score every group of
+a categorical column (tag, phase, module...) in one pass with np.bincount, the overall score
+being the single group case.
+
+    table = splint.SplintResultTable(results)
+    splint.score_table(table, "by_function_binary")
+    splint.score_table_by(table, "tag", "by_result")   # {"db": 100.0, "files": 75.0}
+
+The scores match the ScoreStrategy classes of the same name.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+from .splint_exception import SplintException
+from .splint_result_table import STATUS_PASS, SplintResultTable
+from .splint_score import ScoreStrategy
+
+
+def _sums(groups: np.ndarray, n_groups: int, weights: np.ndarray | None = None) -> np.ndarray:
+    """Per group sum of weights (or count when weights is None)."""
+    return np.bincount(groups, weights=weights, minlength=n_groups).astype(np.float64)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray, scored: np.ndarray) -> np.ndarray:
+    """100 * numerator / denominator for groups that have results to score, else 0."""
+    out = np.zeros(len(numerator), dtype=np.float64)
+    np.divide(100.0 * numerator, denominator, out=out, where=scored > 0)
+    return out
+
+
+def _by_result(passed, skipped, weight, function_ids, n_functions, groups, n_groups):
+    # pylint: disable=unused-argument
+    kept = ~skipped
+    scored = _sums(groups, n_groups, kept)
+    weight_sum = _sums(groups, n_groups, np.where(kept, weight, 0.0))
+    passed_sum = _sums(groups, n_groups, np.where(kept & passed, weight, 0.0))
+    return _ratio(passed_sum, weight_sum, scored)
+
+
+def _by_function_mean(passed, skipped, weight, function_ids, n_functions, groups, n_groups):
+    # Averaging each function's weighted results works out to the weighted mean of all results.
+    kept = ~skipped
+    if np.any((_sums(groups, n_groups, kept) > 0) & (_sums(groups, n_groups, np.where(kept, weight, 0.0)) == 0.0)):
+        raise SplintException("The sum of weights is 0.  This is not allowed.")
+    return _by_result(passed, skipped, weight, function_ids, n_functions, groups, n_groups)
+
+
+# Above this many (group, function) cells by_function_binary sorts the pairs instead of counting
+# them in a dense group x function grid.
+MAX_DENSE_CELLS = 1 << 22
+
+
+def _by_function_binary(passed, skipped, weight, function_ids, n_functions, groups, n_groups):
+    # pylint: disable=unused-argument
+    # Like ScoreByFunctionBinary, skipped results still count towards their function.
+    keys = groups.astype(np.int64) * n_functions + function_ids
+    failed = ~passed
+    if n_groups * n_functions <= MAX_DENSE_CELLS:
+        cells = n_groups * n_functions
+        present = np.bincount(keys, minlength=cells).reshape(n_groups, n_functions) > 0
+        any_failed = np.bincount(keys, weights=failed, minlength=cells).reshape(n_groups, n_functions) > 0
+        functions = present.sum(axis=1).astype(np.float64)
+        passed_functions = (present & ~any_failed).sum(axis=1).astype(np.float64)
+    else:
+        pairs, pair_ids = np.unique(keys, return_inverse=True)
+        pair_groups = pairs // n_functions
+        pair_failed = np.bincount(pair_ids, weights=failed, minlength=len(pairs)) > 0
+        functions = _sums(pair_groups, n_groups)
+        passed_functions = _sums(pair_groups, n_groups, ~pair_failed)
+    return _ratio(passed_functions, functions, _sums(groups, n_groups, ~skipped))
+
+
+def _by_binary_fail(passed, skipped, weight, function_ids, n_functions, groups, n_groups):
+    # pylint: disable=unused-argument
+    results = _sums(groups, n_groups)
+    fails = _sums(groups, n_groups, ~skipped & ~passed)
+    return np.where((results > 0) & (fails == 0), 100.0, 0.0)
+
+
+def _by_binary_pass(passed, skipped, weight, function_ids, n_functions, groups, n_groups):
+    # pylint: disable=unused-argument
+    passes = _sums(groups, n_groups, ~skipped & passed)
+    return np.where(passes > 0, 100.0, 0.0)
+
+
+VECTOR_STRATEGIES: dict[str, Callable[..., np.ndarray]] = {
+    "by_result": _by_result,
+    "by_function_binary": _by_function_binary,
+    "by_function_mean": _by_function_mean,
+    "by_binary_fail": _by_binary_fail,
+    "by_binary_pass": _by_binary_pass,
+}
+
+
+def _strategy(strategy: str | ScoreStrategy | type[ScoreStrategy]) -> Callable[..., np.ndarray]:
+    """Find the vector version of a strategy given its name, class or an instance."""
+    name = strategy if isinstance(strategy, str) else strategy.strategy_name
+    if name not in VECTOR_STRATEGIES:
+        raise SplintException(f"No vectorized scoring strategy with name '{name}' found.")
+    return VECTOR_STRATEGIES[name]
+
+
+def _score_groups(table: SplintResultTable, strategy, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    function_ids, n_functions = table.function_ids()
+    return _strategy(strategy)(table.column("status") == STATUS_PASS,
+                               table.column("skipped"),
+                               table.column("weight"),
+                               function_ids,
+                               n_functions,
+                               groups,
+                               n_groups)
+
+
+def score_table(table: SplintResultTable, strategy: str | ScoreStrategy | type[ScoreStrategy] = "by_result") -> float:
+    """Score all the results in the table."""
+    if len(table) == 0:
+        return 0.0
+    groups = np.zeros(len(table), dtype=np.int64)
+    return float(_score_groups(table, strategy, groups, 1)[0])
+
+
+def score_table_by(table: SplintResultTable,
+                   column: str,
+                   strategy: str | ScoreStrategy | type[ScoreStrategy] = "by_result") -> dict:
+    """Score the results for each category of a categorical column (tag, phase, module_name...)."""
+    categories = table.categories(column)
+    scores = _score_groups(table, strategy, table.column(column), len(categories))
+    return {category: float(score) for category, score in zip(categories, scores)}
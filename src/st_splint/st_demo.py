@@ -159,25 +159,28 @@ def display_json_results(checker: splint.SplintChecker):
         st.json(checker.as_dict())
 
 
-class SplintStreamlitProgressBar(splint.SplintProgress):
-    """ Implementation of a progress bar for streamlit. """
+class SplintStreamlitProgressBar:
+    """
+    Implementation of a progress bar for streamlit.
+
+    Redrawing the bar on every progress call slows the rule checking down, so this is
+    handed batched progress events by splint.SplintBatchedProgress.
+    """
 
     def __init__(self, progress_bar: st.progress):
         """ Store streamlit progress bar in global state"""
         self.progress_bar = progress_bar
 
-    def __call__(self, current_count: int, max_count: int, msg: str, result=None):
+    def __call__(self, event: splint.SplintProgressEvent):
         """
         Display a status message/progress update.  The progress bar goes from 0 to full
-        scale as a percentage of the number of function that have run, that is whey
-        we get current/max.  We also have a message which can be anything as well
-        as a result which is the detailed results.  Presumably some progress systems
-        would watch the result metadata while others would be content with the message.
+        scale as a percentage of the number of function that have run.  The event also
+        has the counts of the results so far, which are shown with the message.
         """
-        max_count = max(max_count, 1)
-        current_count = min(current_count, max_count)
-        percent = min(max(0, current_count / float(max_count)), 1.0)
-        self.progress_bar.progress(percent, msg)
+        counts = event.counts
+        text = f"{event.msg}  Pass: {counts['pass']} Fail: {counts['fail']} " \
+               f"Warn: {counts['warn']} Skip: {counts['skip']}"
+        self.progress_bar.progress(event.fraction, text)
 
 
 def main():
@@ -234,8 +237,9 @@ def main():
         else:
             prog_bar = st.progress(0, text=f"Rule checking status 0 of {checker.function_count}")
 
-            # IInstall progress bar that is nice for splint.
-            checker.progress_callback = SplintStreamlitProgressBar(prog_bar)
+            # Install progress bar that is nice for splint, updating it at most 5 times a second.
+            checker.progress_callback = splint.SplintBatchedProgress(SplintStreamlitProgressBar(prog_bar),
+                                                                     interval_sec=0.2)
 
             # Magic happens here
             results: list[splint.SplintResult] = checker.run_all()
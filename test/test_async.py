@@ -0,0 +1,126 @@
+"""
+Tests for async check functions and the async checker API.
+"""
+import asyncio
+import time
+
+import pytest
+
+from src import splint
+
+
+@splint.attributes(ruid="coro")
+async def check_coro():
+    await asyncio.sleep(0.2)
+    return splint.SR(status=True, msg="Coroutine")
+
+
+@splint.attributes(ruid="coro_bool")
+async def check_coro_bool():
+    await asyncio.sleep(0.2)
+    return True
+
+
+@splint.attributes(ruid="agen")
+async def check_agen():
+    for i in range(3):
+        await asyncio.sleep(0.05)
+        yield splint.SR(status=True, msg=f"Async gen {i}")
+
+
+@splint.attributes(ruid="sync")
+def check_sync():
+    time.sleep(0.2)
+    yield splint.SR(status=True, msg="Sync")
+
+
+@splint.attributes(ruid="agen_fail", finish_on_fail=True)
+async def check_agen_fail():
+    yield splint.SR(status=True, msg="Pass")
+    yield splint.SR(status=False, msg="Fail")
+    yield splint.SR(status=True, msg="Never")
+
+
+@splint.attributes(ruid="agen_exc")
+async def check_agen_exc():
+    yield splint.SR(status=True, msg="Pass")
+    raise splint.SplintException("Boom")
+
+
+def _checker(funcs, **kwargs):
+    return splint.SplintChecker(check_functions=[splint.SplintFunction(f) for f in funcs],
+                                auto_setup=True, **kwargs)
+
+
+def test_async_detection():
+    assert splint.SplintFunction(check_coro).is_coroutine
+    assert splint.SplintFunction(check_agen).is_async_generator
+    assert splint.SplintFunction(check_agen).is_async
+    assert not splint.SplintFunction(check_sync).is_async
+
+
+def test_sync_call_of_async_functions():
+    """The regular checker can still run async functions, one event loop per function."""
+    ch = _checker([check_coro, check_coro_bool, check_agen])
+    results = ch.run_all()
+    assert len(results) == 5
+    assert all(r.status for r in results)
+    assert results[0].func_name == "check_coro"
+    assert results[0].ruid == "coro"
+
+
+def test_arun_all():
+    ch = _checker([check_coro, check_coro_bool, check_agen, check_sync])
+    start = time.time()
+    results = asyncio.run(ch.arun_all())
+    elapsed = time.time() - start
+
+    assert len(results) == 6
+    assert all(r.status for r in results)
+    assert ch.score == 100.0
+
+    # Everything ran at the same time
+    assert elapsed < 0.5
+
+
+def test_arun_all_concurrency_limit():
+    ch = _checker([check_coro, check_coro_bool])
+    start = time.time()
+    results = asyncio.run(ch.arun_all(max_concurrency=1))
+    assert len(results) == 2
+    assert time.time() - start >= 0.4
+
+    with pytest.raises(splint.SplintException):
+        asyncio.run(ch.arun_all(max_concurrency=0))
+
+
+def test_ayield_all_finish_on_fail():
+    ch = _checker([check_agen_fail])
+    results = asyncio.run(ch.arun_all())
+    assert [r.msg for r in results] == ["Pass", "Fail"]
+
+
+def test_ayield_all_exception():
+    ch = _checker([check_agen_exc])
+    results = asyncio.run(ch.arun_all())
+    assert len(results) == 2
+    assert results[0].status
+    assert not results[1].status
+    assert results[1].except_
+
+
+def test_ayield_all_abort_on_fail():
+    ch = _checker([check_agen_fail, check_coro], abort_on_fail=True)
+    results = asyncio.run(ch.arun_all())
+    assert [r.msg for r in results] == ["Pass", "Fail"]
+
+
+def test_ayield_all_streams():
+    async def first_result():
+        ch = _checker([check_agen, check_sync])
+        async for result in ch.ayield_all():
+            return result
+        return None  # pragma: no cover
+
+    result = asyncio.run(first_result())
+    assert result.status
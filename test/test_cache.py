@@ -0,0 +1,153 @@
+"""
+Tests for the pluggable TTL cache backends.
+"""
+import pathlib
+import time
+
+import pytest
+
+from src import splint
+
+
+@pytest.fixture(params=["memory", "sqlite", "file"])
+def cache_factory(request, tmp_path):
+    """Make caches of each type, calling it twice gives two objects sharing the same storage."""
+    memory = {}
+
+    def make(max_entries=100):
+        if request.param == "memory":
+            return memory.setdefault(max_entries, splint.SplintMemoryCache(max_entries=max_entries))
+        if request.param == "sqlite":
+            return splint.SplintSqliteCache(tmp_path / "cache.db", max_entries=max_entries)
+        return splint.SplintFileCache(tmp_path / "cache", max_entries=max_entries)
+
+    return make
+
+
+def test_cache_get_set(cache_factory):
+    cache = cache_factory()
+    assert cache.get("key") is None
+
+    cache.set("key", [splint.SR(status=True, msg="Cached")], ttl_sec=10)
+    results = cache.get("key")
+    assert len(results) == 1
+    assert results[0].msg == "Cached"
+    assert len(cache) == 1
+
+    # Storage is shared
+    other = cache_factory()
+    assert other.get("key")[0].msg == "Cached"
+
+    cache.delete("key")
+    assert cache.get("key") is None
+
+    cache.set("key", [], ttl_sec=10)
+    assert cache.get("key") == []
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_ttl_eviction(cache_factory):
+    cache = cache_factory()
+    cache.set("key", [splint.SR(status=True)], ttl_sec=0.1)
+    assert cache.get("key") is not None
+    time.sleep(0.15)
+    assert cache.get("key") is None
+
+
+def test_cache_size_eviction(cache_factory):
+    cache = cache_factory(max_entries=2)
+    for i in range(3):
+        cache.set(f"key{i}", [splint.SR(status=True, msg=str(i))], ttl_sec=10)
+        time.sleep(0.01)
+    assert len(cache) == 2
+    assert cache.get("key0") is None
+    assert cache.get("key2")[0].msg == "2"
+
+
+def test_cache_bad_size():
+    with pytest.raises(splint.SplintException):
+        splint.SplintMemoryCache(max_entries=0)
+
+
+def test_function_cache_keys_env(cache_factory):
+    """Results are cached per environment."""
+    calls = []
+
+    @splint.attributes(ttl_minutes="10s")
+    def func(value):
+        calls.append(value)
+        yield splint.SR(status=value > 0, msg=f"Value {value}")
+
+    cache = cache_factory()
+    sfunc = splint.SplintFunction(func, env={"value": 1}, cache=cache)
+
+    assert list(sfunc())[0].msg == "Value 1"
+    assert list(sfunc())[0].msg == "Value 1"
+    assert calls == [1]
+
+    sfunc.env = {"value": -1}
+    assert list(sfunc())[0].msg == "Value -1"
+    assert calls == [1, -1]
+
+
+def test_checker_cache_shared(cache_factory, tmp_path):
+    """Two checkers (think two uvicorn workers) share results through the cache."""
+    f = pathlib.Path(tmp_path) / "file.txt"
+    f.touch()
+
+    @splint.attributes(ttl_minutes="10s", ruid="exists")
+    def check_file():
+        yield splint.SR(status=f.exists(), msg="Exists")
+
+    ch1 = splint.SplintChecker(check_functions=[splint.SplintFunction(check_file)], cache=cache_factory(),
+                               auto_setup=True)
+    assert ch1.run_all()[0].status
+
+    f.unlink()
+
+    ch2 = splint.SplintChecker(check_functions=[splint.SplintFunction(check_file)], cache=cache_factory(),
+                               auto_setup=True)
+    assert ch2.run_all()[0].status
+
+
+def test_exception_results_not_cached(cache_factory):
+    calls = []
+
+    @splint.attributes(ttl_minutes="10s")
+    def func():
+        calls.append(1)
+        raise splint.SplintException("Boom")
+
+    sfunc = splint.SplintFunction(func, cache=cache_factory())
+    assert list(sfunc())[0].except_
+    assert list(sfunc())[0].except_
+    assert len(calls) == 2
+
+
+def test_cached_results_without_renderer(tmp_path):
+    """Deferred renderers aren't pickled into cache entries, replayed results still render."""
+    cache = splint.SplintFileCache(tmp_path / "cache")
+
+    @splint.attributes(ttl_minutes="10s", ruid="bold")
+    def check_bold():
+        yield splint.SR(status=True, msg=f"Hello {splint.SM.bold('world')}")
+
+    def run():
+        ch = splint.SplintChecker(check_functions=[splint.SplintFunction(check_bold)], cache=cache,
+                                  renderer=splint.SplintBasicMarkdown(), auto_setup=True)
+        return ch.run_all()
+
+    first = run()
+    assert first[0].msg_rendered == "Hello **world**"
+    for file in (tmp_path / "cache").glob("*.splint"):
+        assert b"SplintBasicMarkdown" not in file.read_bytes()
+    assert run()[0].msg_rendered == "Hello **world**"
+
+
+def test_file_cache_evicts_in_batches(tmp_path):
+    cache = splint.SplintFileCache(tmp_path / "cache", max_entries=20)
+    for i in range(45):
+        cache.set(f"key{i}", [splint.SR(status=True)], 60)
+    # Checked every 2 writes, so at most 21 files.
+    assert 20 <= len(cache) <= 21
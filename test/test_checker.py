@@ -694,4 +694,37 @@ def test_check_render_color(renderer, expected):
     assert len(results) == 1
     assert results[0].status == True
     assert results[0].msg == "It works1 <<red>>hello<</red>>"
-    assert results[0].msg_rendered == expected
\ No newline at end of file
+    assert results[0].msg_rendered == expected
+
+class CountingRenderer(splint.SplintRenderText):
+    """Text renderer that counts how often it renders."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def render(self, msg):
+        self.calls += 1
+        return super().render(msg)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_check_render_is_lazy_and_cached(compact):
+    def render_func():
+        for i in range(10):
+            yield splint.SplintResult(status=True, msg=f"Same {SM.red('message')}")
+
+    renderer = CountingRenderer()
+    ch = splint.SplintChecker(check_functions=[splint.SplintFunction(render_func)], auto_setup=True,
+                              renderer=renderer, compact_results=compact)
+    results = ch.run_all()
+
+    # Scoring doesn't need the messages so nothing was rendered
+    assert ch.score == 100.0
+    assert renderer.calls == 0
+
+    assert all(r.msg_rendered == "Same message" for r in results)
+    # Identical messages are rendered once
+    assert renderer.calls == 1
+
+    results[0].msg_rendered = "custom"
+    assert results[0].msg_rendered == "custom"
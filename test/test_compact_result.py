@@ -0,0 +1,96 @@
+"""
+Tests for the memory efficient compact results.
+"""
+import pickle
+import tracemalloc
+
+from src import splint
+
+
+def row_checks(rows=1000):
+    """A function with a long docstring
+
+    that yields a result for every row.
+    """
+    for i in range(rows):
+        yield splint.SR(status=i % 10 != 0, msg=f"Row {i}")
+
+
+def _results(compact: bool, rows=1000):
+    func = splint.attributes(ruid="rows", tag="data", phase="prod", level=2)(row_checks)
+    sfunc = splint.SplintFunction(func, env={"rows": rows}, compact_results=compact)
+    return list(sfunc())
+
+
+def test_compact_matches_regular():
+    regular = _results(compact=False, rows=20)
+    compact = _results(compact=True, rows=20)
+
+    assert all(isinstance(r, splint.SplintCompactResult) for r in compact)
+    assert all(isinstance(r, splint.SplintResult) for r in compact)
+    for r, c in zip(regular, compact):
+        c_dict, r_dict = c.as_dict(), r.as_dict()
+        # Runtimes differ between runs
+        c_dict.pop("runtime_sec")
+        r_dict.pop("runtime_sec")
+        assert c_dict == r_dict
+        assert list(c.as_dict()) == list(r.as_dict())
+        assert c.ruid == "rows" and c.tag == "data" and c.level == 2
+
+
+def test_compact_results_share_info():
+    compact = _results(compact=True, rows=10)
+    assert len({id(r.info) for r in compact}) == 1
+    assert compact[0].doc.startswith("A function with a long docstring")
+
+
+def test_compact_result_is_independent():
+    first, second = _results(compact=True, rows=2)
+    first.tag = "changed"
+    first.msg = "New message"
+    assert first.tag == "changed"
+    assert second.tag == "data"
+    assert second.msg == "Row 1"
+
+
+def test_compact_result_pickle():
+    result = _results(compact=True, rows=1)[0]
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_compact_result_memory():
+    def measure(compact):
+        tracemalloc.start()
+        results = _results(compact=compact, rows=5000)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(results) == 5000
+        return size
+
+    # Each result still has its own message string, so this is well short of the ratio for
+    # the result objects themselves.
+    assert measure(compact=True) < measure(compact=False) * 0.75
+
+
+def test_checker_compact_results():
+    func = splint.attributes(ruid="rows")(row_checks)
+    ch = splint.SplintChecker(check_functions=[splint.SplintFunction(func)], env={"rows": 50},
+                              compact_results=True, auto_setup=True)
+    results = ch.run_all()
+    assert len(results) == 50
+    assert all(isinstance(r, splint.SplintCompactResult) for r in results)
+    assert ch.score == 90.0
+    assert results[0].msg_rendered == "Row 0"
+
+
+def test_function_info_is_reused():
+    func = splint.attributes(ruid="rows", tag="data")(row_checks)
+    sfunc = splint.SplintFunction(func, env={"rows": 3}, compact_results=True)
+    info = sfunc.info
+    assert sfunc.info is info
+
+    # Changing an attribute the record is built from makes a new record.
+    sfunc.ruid = "rows2"
+    assert sfunc.info is not info
+    assert sfunc.info.ruid == "rows2"
+    assert all(r.ruid == "rows2" for r in sfunc())
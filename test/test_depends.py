@@ -0,0 +1,176 @@
+"""
+Tests for dependencies between check functions.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src import splint
+from src.splint import splint_checker, splint_dag
+
+
+def _functions(db_ok=True, calls=None):
+    calls = calls if calls is not None else []
+
+    @splint.attributes(ruid="schema", depends_on="db")
+    def check_schema():
+        calls.append("schema")
+        yield splint.SR(status=True, msg="Schema")
+
+    @splint.attributes(ruid="rows", depends_on=["schema"])
+    def check_rows():
+        calls.append("rows")
+        yield splint.SR(status=True, msg="Rows")
+
+    @splint.attributes(ruid="db")
+    def check_db():
+        calls.append("db")
+        yield splint.SR(status=db_ok, msg="DB reachable")
+
+    @splint.attributes(ruid="disk")
+    def check_disk():
+        calls.append("disk")
+        yield splint.SR(status=True, msg="Disk")
+
+    return [splint.SplintFunction(f) for f in (check_schema, check_rows, check_db, check_disk)]
+
+
+def test_depends_on_attribute():
+    @splint.attributes(depends_on="a")
+    def func():
+        pass  # pragma: no cover
+
+    assert splint.SplintFunction(func).depends_on == ["a"]
+    assert splint.SplintFunction(lambda: True).depends_on == []
+
+    with pytest.raises(splint.SplintException):
+        splint.attributes(depends_on=[1])
+
+
+def test_prepare_orders_by_dependencies():
+    ch = splint.SplintChecker(check_functions=_functions(), auto_setup=True)
+    assert [f.ruid for f in ch.collected] == ["db", "schema", "rows", "disk"]
+
+
+def test_dag_built_once_per_prepare(monkeypatch):
+    built = []
+
+    class CountingDag(splint_dag.SplintDag):
+        def __init__(self, functions, *args, **kwargs):
+            if functions:
+                built.append(self)
+            super().__init__(functions, *args, **kwargs)
+
+    monkeypatch.setattr(splint_checker, "SplintDag", CountingDag)
+    ch = splint.SplintChecker(check_functions=_functions(), auto_setup=True)
+    ch.run_all()
+    ch.run_all()
+    assert len(built) == 1
+
+    # Changing the collected functions after prepare rebuilds the graph for the next run.
+    ch.collected = ch.collected[:2]
+    ch.run_all()
+    assert len(built) == 2
+
+
+def test_large_dag_order():
+    """Every other function depends on the one before it, the rest keep the list order."""
+    count = 20_000
+    functions = [splint.SplintFunction(lambda: True) for _ in range(count)]
+    for pos, function_ in enumerate(functions):
+        function_.ruid = f"f{pos}"
+        function_.depends_on = [f"f{pos - 1}"] if pos % 2 else []
+    dag = splint_dag.SplintDag(functions[::-1])
+    order = [dag.functions[pos].ruid for pos in dag.order]
+    assert len(order) == count
+    assert order[:3] == [f"f{count - 2}", f"f{count - 1}", f"f{count - 4}"]
+
+    assert splint_dag.SplintDag(functions[::2]).order == list(range(count // 2))
+
+
+def test_cycle_rejected():
+    @splint.attributes(ruid="a", depends_on="b")
+    def func_a():
+        yield True  # pragma: no cover
+
+    @splint.attributes(ruid="b", depends_on="a")
+    def func_b():
+        yield True  # pragma: no cover
+
+    with pytest.raises(splint.SplintException, match="cycle"):
+        splint.SplintChecker(check_functions=[splint.SplintFunction(func_a), splint.SplintFunction(func_b)],
+                             auto_setup=True)
+
+
+def test_unknown_dependency_rejected():
+    @splint.attributes(ruid="a", depends_on="typo")
+    def func_a():
+        yield True  # pragma: no cover
+
+    with pytest.raises(splint.SplintException, match="typo"):
+        splint.SplintChecker(check_functions=[splint.SplintFunction(func_a)], auto_setup=True)
+
+
+def test_filtered_dependency_ignored():
+    calls = []
+    ch = splint.SplintChecker(check_functions=_functions(db_ok=False, calls=calls), auto_setup=True)
+    ch.prepare(filter_functions=[splint.exclude_ruids(["db"])])
+    results = ch.run_all()
+    assert all(r.status for r in results)
+    assert calls == ["schema", "rows", "disk"]
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_failed_dependency_skips_dependents(executor):
+    calls = []
+    ch = splint.SplintChecker(check_functions=_functions(db_ok=False, calls=calls), executor=executor,
+                              ordered=True, auto_setup=True)
+    results = ch.run_all()
+
+    assert sorted(calls) == ["db", "disk"]
+    assert [r.ruid for r in results] == ["db", "schema", "rows", "disk"]
+    assert results[0].status is False
+    for result in results[1:3]:
+        assert result.skipped
+        assert result.status is None
+        assert "dependencies did not pass" in result.msg
+    assert "'db'" in results[1].msg
+    assert "'schema'" in results[2].msg
+    assert results[3].status
+
+
+def test_async_failed_dependency_skips_dependents():
+    calls = []
+    ch = splint.SplintChecker(check_functions=_functions(db_ok=False, calls=calls), auto_setup=True)
+    results = asyncio.run(ch.arun_all())
+    assert sorted(calls) == ["db", "disk"]
+    assert sum(r.skipped for r in results) == 2
+
+
+def test_independent_branches_run_concurrently():
+    """A slow branch doesn't hold up the other one, and dependents wait for their dependency."""
+    events = []
+    lock = threading.Lock()
+
+    def make(ruid, depends_on=None, delay=0.2):
+        @splint.attributes(ruid=ruid, depends_on=depends_on)
+        def func():
+            with lock:
+                events.append(f"start {ruid}")
+            time.sleep(delay)
+            with lock:
+                events.append(f"end {ruid}")
+            return True
+
+        return splint.SplintFunction(func)
+
+    funcs = [make("a"), make("a_child", "a"), make("b"), make("b_child", "b")]
+    ch = splint.SplintChecker(check_functions=funcs, executor="thread", auto_setup=True)
+    start = time.time()
+    results = ch.run_all()
+    assert time.time() - start < 0.7
+    assert len(results) == 4
+    assert events.index("start a_child") > events.index("end a")
+    assert events.index("start b_child") > events.index("end b")
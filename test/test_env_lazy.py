@@ -0,0 +1,80 @@
+"""
+Tests for only building the environment values the collected functions need.
+"""
+import pytest
+
+from src import splint
+
+
+def _module(calls):
+    @splint.env(provides=["engine"])
+    def env_engine(_):
+        calls.append("engine")
+        return {"engine": "sqlite://"}
+
+    @splint.env(provides="table", requires="engine")
+    def env_table(env):
+        calls.append("table")
+        return {"table": f"{env['engine']}/table"}
+
+    @splint.env(provides=["big_csv"])
+    def env_csv(_):
+        calls.append("csv")
+        return {"big_csv": [1, 2, 3]}
+
+    def env_undeclared(_):
+        calls.append("undeclared")
+        return {"other": 1}
+
+    @splint.attributes(ruid="table", tag="db")
+    def check_table(table):
+        yield splint.SR(status=table == "sqlite:///table", msg=f"Table {table}")
+
+    @splint.attributes(ruid="csv", tag="csv")
+    def check_csv(big_csv):
+        yield splint.SR(status=len(big_csv) == 3, msg="CSV")
+
+    module = splint.SplintModule("lazy", "lazy.py", auto_load=False,
+                                 env_functions=[env_engine, env_table, env_csv, env_undeclared])
+    module.add_check_function(None, check_table)
+    module.add_check_function(None, check_csv)
+    return module
+
+
+def test_env_attribute():
+    @splint.env(provides="a", requires=["b", "c"])
+    def env_func(_):
+        return {"a": 1}  # pragma: no cover
+
+    assert env_func.provides == ["a"]
+    assert env_func.requires == ["b", "c"]
+    assert splint.get_attribute(lambda _: {}, "provides") is None
+    assert splint.get_attribute(lambda _: {}, "requires") == []
+
+    with pytest.raises(splint.SplintException):
+        splint.env(provides=["a", ""])
+
+
+def test_all_env_functions_when_all_needed():
+    calls = []
+    ch = splint.SplintChecker(modules=[_module(calls)], auto_setup=True)
+    results = ch.run_all()
+    assert all(r.status for r in results)
+    assert calls == ["engine", "table", "csv", "undeclared"]
+
+
+def test_only_needed_env_functions():
+    calls = []
+    ch = splint.SplintChecker(modules=[_module(calls)], auto_setup=True)
+    ch.prepare(filter_functions=[splint.keep_tags(["db"])])
+    assert ch.required_env_keys() == {"table"}
+
+    results = ch.run_all()
+    assert len(results) == 1 and results[0].status
+    # engine is built because env_table requires it, csv is skipped, undeclared always runs
+    assert calls == ["engine", "table", "undeclared"]
+
+    calls.clear()
+    ch.collected = [f for f in ch.pre_collected if f.ruid == "csv"]
+    assert ch.run_all()[0].status
+    assert calls == ["csv", "undeclared"]
@@ -0,0 +1,98 @@
+"""
+Tests for scoped env functions.
+"""
+import time
+
+import pytest
+
+from src import splint
+
+
+def _module(calls, torn_down, scope, ttl_minutes=0):
+    @splint.env(provides="conn", scope=scope, ttl_minutes=ttl_minutes,
+                teardown=lambda values: torn_down.append(values["conn"]))
+    def env_conn(_):
+        calls.append("conn")
+        return {"conn": f"conn{len(calls)}"}
+
+    @splint.attributes(ruid="conn")
+    def check_conn(conn):
+        yield splint.SR(status=conn.startswith("conn"), msg=f"Connected {conn}")
+
+    module = splint.SplintModule("scoped", "scoped.py", auto_load=False, env_functions=[env_conn])
+    module.add_check_function(None, check_conn)
+    return module
+
+
+def test_bad_scope():
+    with pytest.raises(splint.SplintException):
+        splint.env(scope="function")
+    with pytest.raises(splint.SplintException):
+        splint.env(teardown="not callable")
+
+
+def test_run_scope():
+    calls, torn_down = [], []
+    ch = splint.SplintChecker(modules=[_module(calls, torn_down, "run")], auto_setup=True)
+    ch.run_all()
+    ch.run_all()
+    assert calls == ["conn", "conn"]
+    assert torn_down == ["conn1", "conn2"]
+
+
+def test_session_scope():
+    calls, torn_down = [], []
+    with splint.SplintChecker(modules=[_module(calls, torn_down, "session")], auto_setup=True) as ch:
+        for _ in range(3):
+            assert ch.run_all()[0].status
+        assert calls == ["conn"]
+        assert torn_down == []
+    assert torn_down == ["conn1"]
+    assert len(ch.session_env) == 0
+
+
+def test_session_scope_ttl():
+    calls, torn_down = [], []
+    ch = splint.SplintChecker(modules=[_module(calls, torn_down, "session", ttl_minutes="0.1s")],
+                              auto_setup=True)
+    ch.run_all()
+    ch.run_all()
+    assert calls == ["conn"]
+    time.sleep(0.15)
+    assert ch.run_all()[0].msg == "Connected conn2"
+    assert torn_down == ["conn1"]
+
+
+def test_module_scope_shared_between_checkers():
+    calls, torn_down = [], []
+    module = _module(calls, torn_down, "module")
+    splint.SplintChecker(modules=[module], auto_setup=True).run_all()
+    splint.SplintChecker(modules=[module], auto_setup=True).run_all()
+    assert calls == ["conn"]
+
+    module.close()
+    assert torn_down == ["conn1"]
+
+
+def test_teardown_errors_reported():
+    def bad_teardown(_):
+        raise ValueError("Boom")
+
+    store = splint.SplintEnvStore()
+    torn_down = []
+
+    @splint.env(teardown=bad_teardown)
+    def env_bad(_):
+        return {}  # pragma: no cover
+
+    @splint.env(teardown=lambda values: torn_down.append(values))
+    def env_good(_):
+        return {}  # pragma: no cover
+
+    store.set(env_bad, {"a": 1})
+    store.set(env_good, {"b": 2})
+    with pytest.raises(splint.SplintException):
+        store.clear()
+    # The good teardown still ran
+    assert torn_down == [{"b": 2}]
+    assert len(store) == 0
@@ -0,0 +1,152 @@
+"""
+Tests for running the collected functions with thread and process pools.
+
+Functions used with the process executor live at module level so they can be pickled.
+"""
+import pathlib
+import time
+
+import pytest
+
+from src import splint
+
+
+@splint.attributes(ruid="slow_1")
+def check_slow_1():
+    time.sleep(0.2)
+    yield splint.SR(status=True, msg="Slow 1")
+
+
+@splint.attributes(ruid="slow_2")
+def check_slow_2():
+    time.sleep(0.2)
+    yield splint.SR(status=True, msg="Slow 2")
+    yield splint.SR(status=True, msg="Slow 2 again")
+
+
+@splint.attributes(ruid="fast")
+def check_fast():
+    yield splint.SR(status=True, msg="Fast")
+
+
+@splint.attributes(ruid="fail_early", finish_on_fail=True)
+def check_fail_early():
+    yield splint.SR(status=True, msg="Pass")
+    yield splint.SR(status=False, msg="Fail")
+    yield splint.SR(status=True, msg="Never")
+
+
+@splint.attributes(ruid="env_func")
+def check_env(value):
+    yield splint.SR(status=value == [1, 2, 3], msg="Env")
+
+
+def _checker(funcs, **kwargs):
+    return splint.SplintChecker(check_functions=[splint.SplintFunction(f) for f in funcs],
+                                auto_setup=True, **kwargs)
+
+
+def test_bad_executor():
+    with pytest.raises(splint.SplintException):
+        _checker([check_fast], executor="fibers")
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_executor_results(executor):
+    ch = _checker([check_slow_1, check_slow_2, check_fast], executor=executor, max_workers=3)
+    results = ch.run_all()
+
+    assert len(results) == 4
+    assert all(r.status for r in results)
+    assert {r.msg for r in results} == {"Slow 1", "Slow 2", "Slow 2 again", "Fast"}
+    assert ch.score == 100.0
+
+
+def test_thread_executor_is_concurrent():
+    ch = _checker([check_slow_1, check_slow_2], executor="thread", max_workers=2)
+    start = time.time()
+    ch.run_all()
+    assert time.time() - start < 0.39
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_executor_ordered(executor):
+    ch = _checker([check_slow_1, check_slow_2, check_fast], executor=executor, max_workers=3, ordered=True)
+    results = ch.run_all()
+    assert [r.msg for r in results] == ["Slow 1", "Slow 2", "Slow 2 again", "Fast"]
+
+
+def test_executor_completion_order():
+    """The fast function should finish first when results stream in completion order."""
+    ch = _checker([check_slow_1, check_slow_2, check_fast], executor="thread", max_workers=3)
+    results = ch.run_all()
+    assert results[0].msg == "Fast"
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_executor_finish_on_fail(executor):
+    ch = _checker([check_fail_early], executor=executor)
+    results = ch.run_all()
+    assert [r.msg for r in results] == ["Pass", "Fail"]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_executor_abort_on_fail(executor):
+    ch = _checker([check_fail_early, check_slow_1, check_slow_2], executor=executor, max_workers=1,
+                  ordered=True, abort_on_fail=True)
+    results = ch.run_all()
+    assert [r.msg for r in results] == ["Pass", "Fail"]
+
+
+def test_executor_abort_on_exception():
+    @splint.attributes(ruid="exc")
+    def check_exc():
+        raise splint.SplintException("Boom")
+
+    ch = _checker([check_exc, check_fast], executor="thread", max_workers=1, ordered=True,
+                  abort_on_exception=True)
+    results = ch.run_all()
+    assert len(results) == 1
+    assert results[0].except_
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_executor_env(executor):
+    ch = _checker([check_env], executor=executor, env={"value": [1, 2, 3]})
+    results = ch.run_all()
+    assert len(results) == 1
+    assert results[0].status
+
+
+def test_executor_progress():
+    class Recorder(splint.SplintProgress):
+        def __init__(self):
+            super().__init__()
+            self.msgs = []
+            self.results = []
+
+        def __call__(self, current_iteration, max_iterations, text, result=None):
+            if text:
+                self.msgs.append(text)
+            if result:
+                self.results.append(result)
+
+    progress = Recorder()
+    ch = _checker([check_slow_1, check_fast], executor="thread", progress_object=progress)
+    ch.run_all()
+
+    assert progress.msgs[0] == "Start Rule Check"
+    assert progress.msgs.count("Func done.") == 2
+    assert "Rule Check Complete." in progress.msgs
+    assert len(progress.results) == 2
+
+
+def test_process_executor_module():
+    """Functions loaded from a module need to survive the trip to another process."""
+    module_file = pathlib.Path(__file__).parent / "simple1" / "check_simple1.py"
+    mod = splint.SplintModule(module_name="check_simple1", module_file=str(module_file))
+    ch = splint.SplintChecker(modules=[mod], auto_setup=True, executor="process")
+    results = ch.run_all()
+    assert len(results) == 1
+    assert results[0].status
+    assert results[0].module_name == "check_simple1"
@@ -0,0 +1,132 @@
+"""
+Tests for fingerprinting environment values used as TTL cache keys.
+"""
+import os
+import pathlib
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import splint
+
+
+@pytest.mark.parametrize("a,b", [
+    (1, "1"),
+    (1, 1.0),
+    ([1, 2], [2, 1]),
+    ([1, 2], (1, 2)),
+    ({"a": 1}, {"a": 2}),
+    ({1, 2}, {1, 3}),
+    (None, "None"),
+])
+def test_different_values(a, b):
+    assert splint.fingerprint(a) != splint.fingerprint(b)
+
+
+@pytest.mark.parametrize("value", [
+    1, "abc", b"abc", None, [1, [2, 3]], {"b": 1, "a": [1, 2]}, {3, 2, 1}, (1, "a"),
+])
+def test_stable_values(value):
+    assert splint.fingerprint(value) == splint.fingerprint(value)
+
+
+def test_dict_order_does_not_matter():
+    assert splint.fingerprint({"a": 1, "b": 2}) == splint.fingerprint({"b": 2, "a": 1})
+
+
+def test_env_containers():
+    assert splint.fingerprint(splint.SplintEnvDict({"a": 1})) == splint.fingerprint(splint.SplintEnvDict({"a": 1}))
+    assert splint.fingerprint(splint.SplintEnvList([1])) != splint.fingerprint(splint.SplintEnvList([2]))
+
+
+def test_dataframe_content():
+    df1 = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df2 = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df3 = pd.DataFrame({"a": [1, 2, 4], "b": ["x", "y", "z"]})
+    df4 = pd.DataFrame({"c": [1, 2, 3], "b": ["x", "y", "z"]})
+    assert splint.fingerprint(df1) == splint.fingerprint(df2)
+    assert splint.fingerprint(df1) != splint.fingerprint(df3)
+    assert splint.fingerprint(df1) != splint.fingerprint(df4)
+    assert splint.fingerprint(df1["a"]) != splint.fingerprint(df3["a"])
+
+    # Unhashable cells still work
+    df5 = pd.DataFrame({"a": [[1], [2]]})
+    assert splint.fingerprint(df5) == splint.fingerprint(pd.DataFrame({"a": [[1], [2]]}))
+
+
+def test_numpy_content():
+    assert splint.fingerprint(np.arange(5)) == splint.fingerprint(np.arange(5))
+    assert splint.fingerprint(np.arange(5)) != splint.fingerprint(np.arange(6))
+    assert splint.fingerprint(np.zeros((2, 3))) != splint.fingerprint(np.zeros((3, 2)))
+
+
+def test_path_mtime(tmp_path):
+    f = pathlib.Path(tmp_path) / "file.txt"
+    missing = splint.fingerprint(f)
+    f.write_text("hello")
+    first = splint.fingerprint(f)
+    assert first != missing
+    assert splint.fingerprint(f) == first
+
+    # Change the modification time
+    stat = f.stat()
+    os.utime(f, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert splint.fingerprint(f) != first
+
+
+def test_custom_fingerprints():
+    class Thing:
+        def __init__(self, key):
+            self.key = key
+            self.noise = time.time()
+
+        def __splint_fingerprint__(self):
+            return self.key
+
+    assert splint.fingerprint(Thing("a")) == splint.fingerprint(Thing("a"))
+    assert splint.fingerprint(Thing("a")) != splint.fingerprint(Thing("b"))
+
+    class Other:
+        def __init__(self, key):
+            self.key = key
+
+    splint.register_fingerprint(Other, lambda o: "always the same")
+    try:
+        assert splint.fingerprint(Other(1)) == splint.fingerprint(Other(2))
+    finally:
+        splint.unregister_fingerprint(Other)
+    assert splint.fingerprint(Other(1)) != splint.fingerprint(Other(2))
+
+
+def test_default_ttl_cache_uses_environment():
+    """One long-lived checker serving different DataFrames doesn't replay the wrong results."""
+    calls = []
+
+    @splint.attributes(ttl_minutes="10s", ruid="df_len")
+    def check_df(df):
+        calls.append(len(df))
+        yield splint.SR(status=len(df) == 3, msg=f"Length {len(df)}")
+
+    sfunc = splint.SplintFunction(check_df)
+    ch = splint.SplintChecker(check_functions=[sfunc], auto_setup=True,
+                              env={"df": pd.DataFrame({"a": [1, 2, 3]})})
+    assert ch.run_all()[0].status
+    assert ch.run_all()[0].status
+    assert calls == [3]
+
+    ch.env = {"df": pd.DataFrame({"a": [1, 2]})}
+    assert not ch.run_all()[0].status
+    assert calls == [3, 2]
+
+    ch.env = {"df": pd.DataFrame({"a": [1, 2, 3]})}
+    assert ch.run_all()[0].status
+    assert calls == [3, 2]
+
+
+def test_env_wrappers_match_plain_values():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    assert splint.fingerprint(splint.SplintEnvDataFrame(df)) == splint.fingerprint(df)
+    assert splint.fingerprint(splint.SplintEnvList([1, 2])) == splint.fingerprint([1, 2])
+    assert splint.fingerprint(splint.SplintEnvSet({1, 2})) == splint.fingerprint({1, 2})
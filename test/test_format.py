@@ -6,7 +6,7 @@ be interchangeable.
 
 import pytest
 
-from splint import SplintMarkup
+from splint import SM, SplintMarkup
 from splint import splint_format
 
 def test_format_exc():
@@ -208,3 +208,48 @@ def test_splint_render_text_with_empty_string(markup_func):
     formatted_input = markup_func(input)
     output = render_text.render(formatted_input)
     assert output == expected_output
+
+
+def test_render_single_pass():
+    """All tags are replaced in one pass and plain messages are returned as is"""
+    html = splint_format.SplintBasicHTMLRenderer()
+    msg = f"{SM.bold('x')} and {SM.red(SM.code('y'))} {SM.data('z')}"
+    assert html.render(msg) == '<b>x</b> and <span style="color:red"><code>y</code></span> z'
+
+    plain = "No markup here"
+    assert html.render(plain) is plain
+    assert splint_format.SplintRenderText().render("") == ""
+
+
+def test_render_custom_replacements():
+    """Subclasses can just list their replacements"""
+
+    class Shout(splint_format.SplintRenderText):
+        replacements = {splint_format.TAG_BOLD: ("!!", "!!")}
+
+    assert Shout().render(f"{SM.bold('hi')} {SM.red('there')}") == "!!hi!! there"
+    # Instances can have their own replacements too
+    shout = Shout()
+    shout.replacements = {splint_format.TAG_RED: ("#", "#")}
+    assert shout.render(f"{SM.bold('hi')} {SM.red('there')}") == "hi #there#"
+
+
+def test_render_cached_errors_propagate():
+    """A renderer bug is raised once, not hidden by a second uncached render."""
+
+    class Broken(splint_format.SplintRenderText):
+        calls = 0
+
+        def render(self, msg):
+            Broken.calls += 1
+            raise TypeError("renderer bug")
+
+    with pytest.raises(TypeError):
+        splint_format.render_cached(Broken(), "hello")
+    assert Broken.calls == 1
+
+    # Unhashable renderers are rendered without the cache.
+    class Unhashable(splint_format.SplintRenderText):
+        __hash__ = None
+
+    assert splint_format.render_cached(Unhashable(), SM.bold("hi")) == "hi"
@@ -0,0 +1,69 @@
+"""
+Tests for the streaming result grouper.
+"""
+import pytest
+
+from src import splint
+
+
+def _results():
+    return [
+        splint.SR(status=True, module_name="m1", func_name="f1", weight=100.0),
+        splint.SR(status=False, module_name="m1", func_name="f1", weight=100.0),
+        splint.SR(status=True, module_name="m2", func_name="f2", weight=200.0),
+        splint.SR(status=True, module_name="m1", func_name="f3", skipped=True),
+        splint.SR(status=True, module_name="m2", func_name="f2", warn_msg="careful"),
+    ]
+
+
+def test_grouper_counts_and_scores():
+    results = _results()
+    grouper = splint.SplintResultGrouper(["module_name", "func_name"]).update(results)
+
+    assert grouper.root.overview() == splint.overview(results)
+    assert list(grouper.root.groups) == ["m1", "m2"]
+    assert list(grouper.node("m1").groups) == ["f1", "f3"]
+
+    m1 = grouper.node("m1")
+    assert m1.counts == {"total": 3, "pass": 1, "fail": 1, "error": 0, "skip": 1, "warn": 0}
+    assert m1.score == splint.ScoreByResult().score(results[:2] + results[3:4])
+    assert grouper.node("m2", "f2").score == 100.0
+    assert grouper.node("m1", "f1").results is None
+
+    summary = grouper.summary()
+    assert summary["total"] == 5
+    assert summary["groups"]["m1"]["groups"]["f1"] == {"total": 2, "pass": 1, "fail": 1, "error": 0,
+                                                        "skip": 0, "warn": 0, "score": 50.0}
+
+    with pytest.raises(splint.SplintException):
+        grouper.node("m3")
+
+
+def test_grouper_strategy_and_results():
+    results = _results()
+    grouper = splint.SplintResultGrouper(["module_name"], score_strategy="by_binary_fail", keep_results=True)
+    grouper.update(results)
+    assert grouper.node("m1").score == 0.0
+    assert grouper.node("m2").score == 100.0
+    assert grouper.node("m2").results == [results[2], results[4]]
+
+    with pytest.raises(splint.SplintException):
+        splint.SplintResultGrouper([])
+
+
+def check_rows():
+    """Yield some results"""
+    for i in range(10):
+        yield splint.SR(status=i % 4 != 0, msg=f"Row {i}")
+
+
+def test_grouper_streams_yield_all():
+    ch = splint.SplintChecker(check_functions=[splint.SplintFunction(check_rows)], auto_setup=True)
+    grouper = splint.SplintResultGrouper(["func_name", "status"])
+    seen = 0
+    for _ in grouper.tee(ch.yield_all()):
+        seen += 1
+        assert grouper.root.counts["total"] == seen
+    assert grouper.node("check_rows", False).counts["fail"] == 3
+    assert grouper.node("check_rows", True).counts["pass"] == 7
+    assert grouper.node("check_rows").score == 70.0
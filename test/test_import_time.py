@@ -0,0 +1,50 @@
+"""
+Startup budget for `import splint`.
+
+Cron driven checks start a new interpreter for every run, so import time matters.  Optional
+rule integrations (pandas, requests, camelot...) must only be imported when they are used.
+"""
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from src import splint
+
+# Generous so slow CI machines pass, importing the optional dependencies takes well over this.
+IMPORT_BUDGET_SEC = 0.75
+
+HEAVY_MODULES = ["pandas", "numpy", "requests", "ping3", "openpyxl", "camelot", "sqlalchemy", "cv2"]
+
+SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+import splint
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def _import_splint() -> dict:
+    src = pathlib.Path(__file__).parent.parent / "src"
+    out = subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True,
+                         env={**os.environ, "PYTHONPATH": str(src)})
+    return json.loads(out.stdout)
+
+
+def test_import_is_lazy_and_fast():
+    # Best of a few runs so a busy machine doesn't cause a failure
+    runs = [_import_splint() for _ in range(3)]
+    assert runs[0]["loaded"] == []
+    assert min(run["elapsed"] for run in runs) < IMPORT_BUDGET_SEC
+
+
+def test_lazy_names():
+    assert "rule_web_api" in dir(splint)
+    assert callable(splint.rule_web_api)
+    assert callable(splint.rule_validate_df_schema)
+    with pytest.raises(AttributeError):
+        _ = splint.not_a_real_name
@@ -0,0 +1,61 @@
+"""
+Tests for the attribute index over collected functions.
+"""
+import pytest
+
+from src import splint
+
+
+@pytest.fixture
+def checker():
+    def make(i, tag, phase, level):
+        @splint.attributes(ruid=f"r{i}", tag=tag, phase=phase, level=level)
+        def func():
+            yield splint.SR(status=True, msg=f"Func {i}")
+
+        return splint.SplintFunction(func)
+
+    funcs = [make(1, "db", "dev", 1), make(2, "file", "dev", 3), make(3, "db", "prod", 2),
+             make(4, "web", "prod", 5), make(5, "file", "test", 3)]
+    return splint.SplintChecker(check_functions=funcs, auto_setup=True)
+
+
+def test_index_select(checker):
+    index = checker.index
+    assert [f.ruid for f in index.select(tags=["db"])] == ["r1", "r3"]
+    # Matches are a union, in collected order, without duplicates
+    assert [f.ruid for f in index.select(tags=["file"], ruids=["r1", "r2"])] == ["r1", "r2", "r5"]
+    assert [f.ruid for f in index.select(phases=["prod"], levels=[1])] == ["r1", "r3", "r4"]
+    assert index.select(tags=["nope"]) == []
+
+
+def test_index_level_range(checker):
+    index = checker.index
+    assert [f.ruid for f in index.level_range(2, 3)] == ["r2", "r3", "r5"]
+    assert [f.ruid for f in index.level_range(low=4)] == ["r4"]
+    assert [f.ruid for f in index.level_range(high=1)] == ["r1"]
+    assert len(index.level_range()) == 5
+
+
+def test_header_properties(checker):
+    assert checker.ruids == ["r1", "r2", "r3", "r4", "r5"]
+    assert checker.tags == ["db", "file", "web"]
+    assert checker.phases == ["dev", "prod", "test"]
+    assert checker.levels == [1, 2, 3, 5]
+
+
+def test_index_invalidated(checker):
+    prepared = checker.collected
+    index = checker.index
+    assert checker.index is index
+
+    checker.include_by_attribute(tags=["db"])
+    assert checker.tags == ["db"]
+    assert checker.index is not index
+
+    # Putting back the prepared list reuses the prepared index
+    checker.collected = prepared
+    assert checker.index is index
+
+    checker.exclude_by_attribute(tags=["db"], levels=[5])
+    assert [f.ruid for f in checker.collected] == ["r2", "r5"]
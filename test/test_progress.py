@@ -0,0 +1,64 @@
+"""
+Tests for the batched progress adapter.
+"""
+import pytest
+
+from src import splint
+
+
+def check_many():
+    """Lots of cheap results"""
+    for i in range(50):
+        yield splint.SR(status=i % 5 != 0, msg=f"Row {i}")
+
+
+def check_one():
+    """A single result"""
+    return splint.SR(status=True, warn_msg="careful")
+
+
+def _run(progress):
+    funcs = [splint.SplintFunction(check_many), splint.SplintFunction(check_one)]
+    ch = splint.SplintChecker(check_functions=funcs, progress_object=progress, auto_setup=True)
+    return ch.run_all()
+
+
+def test_batched_by_count():
+    events = []
+    progress = splint.SplintBatchedProgress(events.append, interval_sec=60, max_batch=20)
+    results = _run(progress)
+
+    # Start, 2 full batches of 20, completion and the score
+    assert len(events) < 10
+    assert events[0].kind == "start"
+    assert sum(len(e.results) for e in events) == len(results) == 51
+    assert all(len(e.results) <= 20 for e in events)
+
+    last = events[-1]
+    assert last.counts == {"total": 51, "pass": 40, "fail": 10, "error": 0, "skip": 0, "warn": 1}
+    assert last.functions_started == last.functions_done == 2
+    assert last.fraction == 1.0
+    assert last.msg.startswith("Score")
+
+
+def test_no_batching_sends_every_call():
+    events = []
+    progress = splint.SplintBatchedProgress(events.append, interval_sec=0, max_batch=1)
+    _run(progress)
+    assert sum(1 for e in events if e.kind == "result") == 51
+    assert any(e.kind == "function_start" for e in events)
+    assert any(e.kind == "complete" for e in events)
+
+
+def test_flush_and_bad_settings():
+    events = []
+    progress = splint.SplintBatchedProgress(events.append, interval_sec=60)
+    progress(1, 2, "", splint.SR(status=True))
+    assert not events
+    progress.flush()
+    assert len(events) == 1 and len(events[0].results) == 1
+    progress.flush()
+    assert len(events) == 1
+
+    with pytest.raises(splint.SplintException):
+        splint.SplintBatchedProgress(events.append, max_batch=0)
@@ -183,3 +183,45 @@ def test_neg():
 
     assert rc.does_match(phase='p1', ruid='r1', tag='t2') is False
     assert rc.does_match(phase='p1', ruid='r1', tag='t1') is True
+
+
+def test_literal_and_regex_patterns():
+    rc = splint_rc.SplintRC(rc_d={'ruids': ['r1', r'x\d+', '-x13'], 'tags': 'a.b'})
+
+    assert rc.does_match(ruid='r1')
+    assert rc.does_match(ruid='x12')
+    assert rc.does_match(ruid='x13') is False
+    assert rc.does_match(ruid='r12') is False
+    assert rc.does_match(tag='axb')
+
+
+def test_backreference_and_inline_flag_patterns():
+    """Patterns that can't be merged into one alternation still match like re.fullmatch."""
+    rc = splint_rc.SplintRC(rc_d={'ruids': [r'y\d', r'(a)-\1', r'(?i)db\d']})
+
+    assert rc.does_match(ruid='a-a')
+    assert rc.does_match(ruid='a-b') is False
+    assert rc.does_match(ruid='DB1')
+    assert rc.does_match(ruid='y2')
+    assert rc.does_match(ruid='Y2') is False
+
+
+def test_match_memoized():
+    rc = splint_rc.SplintRC(rc_d={'tags': ['t1']})
+    assert rc.does_match(tag='t1', level=1)
+    assert rc.does_match(tag='t2', level=1) is False
+    assert len(rc._match_cache) == 2
+    assert rc.does_match(tag='t1', level='1')
+    assert len(rc._match_cache) == 2
+
+
+def test_bad_pattern():
+    with pytest.raises(splint.SplintException):
+        splint_rc.SplintRC(rc_d={'ruids': ['r(']})
+
+
+def test_file_rc_does_match():
+    """File based RCs don't call SplintRC.__init__, they still need compiled patterns."""
+    rc = splint.splint_rc_factory(param='./rc_files/good.toml', section='package1')
+    assert rc.does_match(tag='t1')
+    assert rc.does_match(tag='t2') is False
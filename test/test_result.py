@@ -90,3 +90,30 @@ def test_group_by_ruids(results):
     """ Test the group_by function with the 'ruids' as the group key """
     r_grouped_results = splint_result.group_by(results, ['ruid'])
     assert len(r_grouped_results) == 7
+
+
+def test_group_by_insertion_order():
+    """ Groups and the results in them keep the order they first appear in """
+    results = [splint.SR(status=True, tag=tag, ruid=f"r{i}") for i, tag in enumerate("bab")]
+    grouped = splint_result.group_by(iter(results), ['tag'])
+    assert list(grouped) == ['b', 'a']
+    assert [r.ruid for r in grouped['b']] == ['r0', 'r2']
+
+
+def test_overview_on_iterator():
+    results = [splint.SR(status=True),
+               splint.SR(status=False),
+               splint.SR(status=True, skipped=True),
+               splint.SR(status=True, warn_msg="careful"),
+               splint.SR(status=False, except_=ValueError())]
+    assert splint.overview(iter(results)) == 'Total: 5, Passed: 1, Failed: 1, Errors: 1, Skipped: 1, Warned: 1'
+
+
+def test_deferred_render_not_a_field():
+    result = splint.SR(status=True, msg="Hello")
+    result.defer_render(splint.SplintBasicMarkdown())
+    d = result.as_dict()
+    assert "_renderer" not in d
+    assert "msg_rendered" not in d
+    assert "_renderer" not in repr(result)
+    assert result.msg_rendered == "Hello"
@@ -0,0 +1,102 @@
+"""
+Tests for the columnar result table.
+"""
+import pytest
+
+from src import splint
+from src.splint.splint_result_table import SplintResultTable
+
+
+def _result(i: int) -> splint.SR:
+    return splint.SR(status=i % 3 != 0,
+                     skipped=i % 7 == 0,
+                     warn_msg="warn" if i % 5 == 0 else "",
+                     ruid=f"r{i % 4}",
+                     tag=f"t{i % 2}",
+                     phase="prod",
+                     module_name="m",
+                     func_name=f"f{i % 4}",
+                     weight=100.0,
+                     level=i % 3,
+                     msg=f"Result {i}")
+
+
+def test_counts_match_results():
+    results = [_result(i) for i in range(100)]
+    # Small batches so the arrays have to grow
+    table = SplintResultTable(results, batch_size=8)
+
+    assert len(table) == 100
+    assert table.pass_count == len([r for r in results if r.status and not r.skipped])
+    assert table.fail_count == len([r for r in results if not r.status and not r.skipped])
+    assert table.skip_count == len([r for r in results if r.skipped])
+    assert table.warn_count == len([r for r in results if r.warn_msg])
+    assert table.error_count == 0
+
+    assert table.categories("ruid") == ["r0", "r1", "r2", "r3"]
+    assert list(table.column("level")) == [r.level for r in results]
+    assert table.group_counts("tag") == {"t0": 50, "t1": 50}
+    failed_by_ruid = table.group_counts("ruid", table.failed)
+    assert sum(failed_by_ruid.values()) == table.fail_count
+
+
+def test_none_status_and_exception():
+    table = SplintResultTable([splint.SR(status=None), splint.SR(status=False, except_=ValueError())])
+    assert list(table.column("status")) == [-1, 0]
+    assert table.fail_count == 2
+    assert table.error_count == 1
+
+
+def test_columns_are_read_only_views():
+    table = SplintResultTable([_result(i) for i in range(10)])
+    status = table.column("status")
+    with pytest.raises(ValueError):
+        status[0] = 1
+
+    with pytest.raises(splint.SplintException):
+        table.column("not_a_column")
+
+    with pytest.raises(splint.SplintException):
+        SplintResultTable(batch_size=0)
+
+
+def test_exports():
+    results = [_result(i) for i in range(20)]
+    table = SplintResultTable(results)
+
+    df = table.to_pandas()
+    assert len(df) == 20
+    assert str(df["ruid"].dtype) == "category"
+    assert list(df["ruid"]) == [r.ruid for r in results]
+
+    arrow = table.to_arrow()
+    assert arrow.num_rows == 20
+    assert arrow.column("tag").to_pylist() == [r.tag for r in results]
+
+
+def check_rows():
+    """Yield a mix of results"""
+    for i in range(30):
+        yield _result(i)
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_checker_result_table(executor):
+    ch = splint.SplintChecker(check_functions=[splint.SplintFunction(check_rows)],
+                              result_table=True, executor=executor, auto_setup=True)
+    results = ch.run_all()
+
+    assert len(ch.result_table) == len(results) == 30
+    assert ch.pass_count == len([r for r in results if r.status and not r.skipped])
+    assert ch.fail_count == len([r for r in results if not r.status and not r.skipped])
+    assert ch.skip_count == len([r for r in results if r.skipped])
+    assert ch.warn_count == len([r for r in results if r.warn_msg])
+    assert ch.clean_run
+    assert not ch.perfect_run
+
+
+def test_checker_without_result_table():
+    ch = splint.SplintChecker(check_functions=[splint.SplintFunction(check_rows)], auto_setup=True)
+    ch.run_all()
+    assert ch.result_table is None
+    assert ch.skip_count == 5
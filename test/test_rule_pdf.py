@@ -1,5 +1,11 @@
 import logging
+import multiprocessing
+import os
+import shutil
+import time
 
+import camelot
+import pandas as pd
 import pytest
 
 import splint.rule_pdf as rule_pdf
@@ -105,3 +111,111 @@ def test_pdf_with_repeated_rules_2():
                                                  max_results=10):
             pass
     assert 'Maximum number of results' in str(e_info.value)
+
+
+def _copy_pdf(tmp_path, name="RuleId.pdf"):
+    path = tmp_path / name
+    shutil.copy(f"./rule_pdf/{name}", path)
+    return str(path)
+
+
+def test_pdf_cache_hits_and_invalidation(tmp_path):
+    file = _copy_pdf(tmp_path)
+    cache = rule_pdf.SplintPdfTableCache(max_entries=2)
+
+    first = rule_pdf.extract_tables_from_pdf(file, cache=cache)
+    second = rule_pdf.extract_tables_from_pdf(file, cache=cache)
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert [df.to_dict() for df in first] == [df.to_dict() for df in second]
+
+    # Changing the file (mtime) means it is parsed again.
+    stat = os.stat(file)
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    rule_pdf.extract_tables_from_pdf(file, cache=cache)
+    assert cache.misses == 2
+
+    # Other pages are another entry and the LRU bound drops the oldest.
+    rule_pdf.extract_tables_from_pdf(file, pages='1', cache=cache)
+    assert len(cache) == 2
+
+
+def test_pdf_cache_spill(tmp_path, monkeypatch):
+    file = _copy_pdf(tmp_path, "RepeatedRule.pdf")
+    spill_dir = tmp_path / "spill"
+    required = ["RuleId", "Description", "Status"]
+    expected = rule_pdf.extract_tables_from_pdf(file, required_columns=required,
+                                                cache=rule_pdf.SplintPdfTableCache(spill_dir=spill_dir))
+
+    def no_parsing(*args):
+        raise AssertionError("PDF was parsed again")
+
+    # A new cache (another process) reads the Parquet files rather than the PDF.
+    monkeypatch.setattr(rule_pdf, "_read_tables", no_parsing)
+    tables = rule_pdf.extract_tables_from_pdf(file, required_columns=required,
+                                              cache=rule_pdf.SplintPdfTableCache(spill_dir=spill_dir))
+    assert len(tables) == len(expected) == 2
+    for df, expected_df in zip(tables, expected):
+        pd.testing.assert_frame_equal(df, expected_df)
+
+
+def test_pdf_rule_index():
+    file = "./rule_pdf/RepeatedRule.pdf"
+    index = rule_pdf.pdf_rule_index(file, col_names={'note_col': "Description"})
+    assert index is rule_pdf.pdf_rule_index(file, col_names={'note_col': "Description"})
+    assert "Rule001" in index
+    assert "Rule999" not in index
+
+    results = list(index.results("Rule001", max_results=100))
+    assert [r.msg for r in results] == [f"Case {i}" for i in range(1, 37)]
+
+    missing = list(index.results("Rule999"))
+    assert len(missing) == 1
+    assert missing[0].skipped
+
+
+def test_pdf_rule_index_bad_file():
+    with pytest.raises(SplintException):
+        rule_pdf.pdf_rule_index("bad_file.pdf")
+
+
+@pytest.mark.parametrize("file", ["./rule_pdf/TwoPage.pdf", "./rule_pdf/RepeatedRule.pdf"])
+def test_parallel_extraction_matches_serial(file):
+    required = ["RuleId", "Status"]
+    serial = rule_pdf.extract_tables_from_pdf(file, required_columns=required, cache=False)
+    parallel = rule_pdf.extract_tables_from_pdf(file, required_columns=required, cache=False, workers=2)
+    assert len(parallel) == len(serial) == 2
+    for df, expected_df in zip(parallel, serial):
+        pd.testing.assert_frame_equal(df, expected_df)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="Workers only see the patched camelot when forked")
+def test_parallel_extraction_page_timeout(monkeypatch):
+    read_pdf = camelot.read_pdf
+
+    def slow_first_page(file_path, flavor, pages):
+        if pages == "1":
+            time.sleep(30)
+        return read_pdf(file_path, flavor=flavor, pages=pages)
+
+    monkeypatch.setattr(camelot, "read_pdf", slow_first_page)
+    start = time.monotonic()
+    # With one worker the second page is only read by the worker that replaces the killed one.
+    tables = rule_pdf.extract_tables_from_pdf("./rule_pdf/TwoPage.pdf", cache=False, workers=1, page_timeout=1.0)
+    assert time.monotonic() - start < 10
+    assert tables.skipped_pages == [1]
+    assert len(tables) == 1
+    assert "Rule030" in tables[0]["RuleId"].values
+
+    cache = rule_pdf.SplintPdfTableCache()
+    index = cache.rule_index("./rule_pdf/TwoPage.pdf", workers=1, page_timeout=1.0)
+    assert index.skipped_pages == [1]
+    assert [r.status for r in index.results("Rule030")] == [True]
+    missing = list(index.results("Rule001"))
+    assert missing[0].status is False
+    assert "[1]" in missing[0].msg
+
+
+def test_bad_parallel_settings():
+    with pytest.raises(SplintException):
+        rule_pdf.extract_tables_from_pdf("./rule_pdf/TwoPage.pdf", cache=False, workers=0)
@@ -1,6 +1,9 @@
+import threading
+
 import pytest
 
 import splint
+import splint.rule_ping as rule_ping
 
 
 # urls fixture that returns list of urls to check
@@ -92,3 +95,66 @@ def test_nonexistent_host(bad_urls):
 
     for result in check_nonexistent_url():
         assert not result.status
+
+
+class _StandInPing:
+    """
+    Stand in for _ping_host that records how many pings run at once.  Loopback answers right
+    away, other hosts wait until answer is set.  With a barrier every ping waits until all of
+    them have started, which only happens if they run concurrently.
+    """
+
+    def __init__(self, barrier: threading.Barrier | None = None):
+        self.barrier = barrier
+        self.answer = threading.Event()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self, host, timeout_ms):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            if self.barrier:
+                self.barrier.wait()
+            if host != "127.0.0.1":
+                self.answer.wait(5)
+            return splint.SR(status=host == "127.0.0.1", msg=host)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+HOSTS = ["127.0.0.1", "192.0.2.1", "127.0.0.1", "192.0.2.2", "127.0.0.1", "192.0.2.3"]
+
+
+def test_concurrent_ping(monkeypatch):
+    stand_in = _StandInPing(threading.Barrier(len(HOSTS), timeout=5))
+    stand_in.answer.set()
+    monkeypatch.setattr(rule_ping, "_ping_host", stand_in)
+    results = list(splint.rule_ping_check(HOSTS, max_workers=len(HOSTS)))
+    assert stand_in.peak == len(HOSTS)
+    assert [r.msg for r in results] == HOSTS
+
+    serial = _StandInPing()
+    serial.answer.set()
+    monkeypatch.setattr(rule_ping, "_ping_host", serial)
+    assert [r.msg for r in splint.rule_ping_check(HOSTS)] == HOSTS
+    assert serial.peak == 1
+
+
+def test_concurrent_ping_order(monkeypatch):
+    stand_in = _StandInPing()
+    monkeypatch.setattr(rule_ping, "_ping_host", stand_in)
+    completed = splint.rule_ping_check(HOSTS, max_workers=len(HOSTS), ordered=False)
+
+    # The loopback results come back while the other hosts are still waiting.
+    assert [next(completed).status for _ in range(3)] == [True] * 3
+    stand_in.answer.set()
+    assert sorted(r.msg for r in completed) == ["192.0.2.1", "192.0.2.2", "192.0.2.3"]
+
+
+def test_bad_ping_workers():
+    with pytest.raises(splint.SplintException):
+        list(splint.rule_ping_check("127.0.0.1", max_workers=0))
@@ -1,7 +1,7 @@
 import itertools
 
 import pytest
-from sqlalchemy import Column, MetaData, Table, create_engine
+from sqlalchemy import Column, MetaData, Table, create_engine, event, text
 from sqlalchemy.types import BOOLEAN, DATE, DATETIME, DECIMAL, DOUBLE, INTEGER, VARCHAR
 
 from src import splint
@@ -245,3 +245,115 @@ def test_permutations_rule_sql_all(engine_alltypes):
                                                     extra_columns_ok=True))
         assert len(results) == len(combination)
         assert all(r.status for r in results)
+
+
+@pytest.fixture
+def warehouse():
+    """SQLite engine with a few tables and a count of the queries run against it."""
+    engine = create_engine('sqlite:///:memory:')
+    metadata = MetaData()
+    for name in ('orders', 'customers', 'products'):
+        Table(name, metadata,
+              Column('id', INTEGER, primary_key=True),
+              Column('name', VARCHAR),
+              Column('updated', DATETIME))
+    metadata.create_all(engine)
+
+    queries = []
+    event.listen(engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+    engine.queries = queries
+    yield engine
+
+
+def test_reflection_cache(warehouse):
+    cache = splint.SplintReflectionCache(ttl_sec=60)
+    for _ in range(50):
+        results = list(splint.rule_sql_table_col_name_schema(warehouse, 'orders', ['id', 'name'], cache=cache))
+        assert all(r.status for r in results)
+    assert cache.reflections == 1
+    reflect_queries = len(warehouse.queries)
+
+    # Once per engine, other tables are reflected separately.
+    list(splint.rule_sql_table_schema(warehouse, 'customers', [('id', INTEGER())], cache=cache))
+    assert cache.reflections == 2
+    assert len(cache) == 2
+
+    # Schema changes are only seen after the cache is invalidated.
+    with warehouse.begin() as conn:
+        conn.execute(text("ALTER TABLE orders ADD COLUMN total DECIMAL"))
+    results = list(splint.rule_sql_table_col_name_schema(warehouse, 'orders', ['total'], cache=cache))
+    assert results[0].status is False
+    cache.invalidate(warehouse)
+    results = list(splint.rule_sql_table_col_name_schema(warehouse, 'orders', ['total'], cache=cache))
+    assert results[0].status is True
+    assert len(warehouse.queries) > reflect_queries
+
+
+def test_reflection_cache_ttl(warehouse, monkeypatch):
+    cache = splint.SplintReflectionCache(ttl_sec=10)
+    now = [1000.0]
+    monkeypatch.setattr("src.splint.rule_sqlachemy.time.monotonic", lambda: now[0])
+    list(splint.rule_sql_table_col_name_schema(warehouse, 'orders', ['id'], cache=cache))
+    now[0] += 5
+    list(splint.rule_sql_table_col_name_schema(warehouse, 'orders', ['id'], cache=cache))
+    assert cache.reflections == 1
+    now[0] += 10
+    list(splint.rule_sql_table_col_name_schema(warehouse, 'orders', ['id'], cache=cache))
+    assert cache.reflections == 2
+
+
+def test_rule_sql_schema(warehouse):
+    cache = splint.SplintReflectionCache()
+    expected_schema = {
+        'orders': ['id', 'name', 'updated'],
+        'customers': [('id', INTEGER()), ('name', VARCHAR()), ('updated', DATE())],
+        'invoices': ['id'],
+    }
+    results = list(splint.rule_sql_schema(warehouse, expected_schema, extra_tables_ok=False, cache=cache))
+    assert [r.status for r in results] == [True, True, True, True, True, False, False, False]
+    assert "incorrect type" in results[5].msg
+    assert "invoices" in results[6].msg
+    assert "products" in results[7].msg
+
+    # Everything came from one reflection, which the single table rules then reuse.
+    assert cache.reflections == 1
+    list(splint.rule_sql_table_col_name_schema(warehouse, 'products', ['id'], cache=cache))
+    assert cache.reflections == 1
+
+    results = list(splint.rule_sql_schema(warehouse, {'orders': ['id']}, extra_columns_ok=False))
+    assert [r.status for r in results] == [True, False, False]
+
+
+def test_reflection_not_cached_by_default(warehouse):
+    list(splint.rule_sql_table_col_name_schema(warehouse, 'orders', ['id']))
+    with warehouse.begin() as conn:
+        conn.execute(text("ALTER TABLE orders ADD COLUMN total DECIMAL"))
+    results = list(splint.rule_sql_table_col_name_schema(warehouse, 'orders', ['total']))
+    assert results[0].status is True
+
+
+def test_rule_sql_schema_other_schema(warehouse):
+    with warehouse.begin() as conn:
+        conn.execute(text("ATTACH DATABASE ':memory:' AS archive"))
+        conn.execute(text("CREATE TABLE archive.orders (id INTEGER, archived DATETIME)"))
+    cache = splint.SplintReflectionCache()
+
+    results = list(splint.rule_sql_schema(warehouse, {'orders': ['archived']}, schema='archive', cache=cache))
+    assert results[0].status is True
+    results = list(splint.rule_sql_schema(warehouse, {'orders': ['archived']}, cache=cache))
+    assert results[0].status is False
+    assert cache.reflections == 2
+
+    # The single table rules share the per-schema entries.
+    results = list(splint.rule_sql_table_col_name_schema(warehouse, 'orders', ['archived'], schema='archive',
+                                                         cache=cache))
+    assert results[0].status is True
+    assert cache.reflections == 2
+
+
+def test_rule_sql_schema_bad_input(warehouse):
+    assert list(splint.rule_sql_schema(warehouse, {}))[0].status is False
+    results = list(splint.rule_sql_schema(warehouse, {'orders': []}))
+    assert results[0].msg == "Column list cannot be empty."
+    with pytest.raises(splint.SplintException):
+        splint.SplintReflectionCache(ttl_sec=-1)
@@ -1,5 +1,10 @@
 
+import http.server
+import json
+import threading
+
 from src import splint
+from src.splint import rule_webapi
 from src.splint.rule_webapi import is_mismatch
 
 import pytest
@@ -145,3 +150,155 @@ def test_get_difference():
         expected_result = convert_integers_to_strings(expected_result)
         result = is_mismatch(sub_set, main_set)
         assert result == expected_result
+
+
+class _LocalHandler(http.server.BaseHTTPRequestHandler):
+    """
+    /status/<code>, /json (the httpbin sample) and /wait on a local server.
+
+    /wait requests wait at barrier, so they only succeed if they all arrive at once, and then
+    until gate is set.  A broken barrier or closed gate returns 500.
+    """
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    barrier: threading.Barrier | None = None
+    gate = threading.Event()
+
+    def setup(self):
+        super().setup()
+        # Called once per connection, not per request, so keep-alive shows up here.
+        type(self).connections += 1
+
+    def do_GET(self):
+        parts = self.path.split("?")[0].strip("/").split("/")
+        status, body = 200, b""
+        if parts[0] == "status":
+            status = int(parts[1])
+        elif parts[0] == "json":
+            body = json.dumps(_SAMPLE_JSON).encode()
+        elif parts[0] == "wait":
+            try:
+                if self.barrier:
+                    self.barrier.wait()
+                status = 200 if self.gate.wait(5) else 500
+            except threading.BrokenBarrierError:
+                status = 500
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_SAMPLE_JSON = {"slideshow": {"author": "Yours Truly", "title": "Sample Slide Show"}}
+
+
+@pytest.fixture
+def local_server():
+    """Base URL of an HTTP server running in a thread."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _LocalHandler)
+    _LocalHandler.connections = 0
+    _LocalHandler.barrier = None
+    _LocalHandler.gate = threading.Event()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_local_url_200(local_server):
+    urls = [f"{local_server}/status/200", f"{local_server}/status/404", f"{local_server}/status/200"]
+    with splint.SplintHttpClient(pool_size=2) as client:
+        results = list(splint.rule_url_200(urls, client=client))
+    assert [r.status for r in results] == [True, False, True]
+
+    # Unreachable ports are failures with the exception attached.
+    results = list(splint.rule_url_200("http://127.0.0.1:1/nothing", timeout_sec=1))
+    assert results[0].status is False
+    assert results[0].except_ is not None
+
+
+def test_pooled_connections(local_server):
+    with splint.SplintHttpClient() as client:
+        results = list(splint.rule_url_200([f"{local_server}/status/200"] * 20, client=client))
+    assert all(r.status for r in results)
+    # Keep alive means one connection for all 20 requests.
+    assert _LocalHandler.connections == 1
+
+
+def test_concurrent_url_200(local_server):
+    urls = [f"{local_server}/wait"] * 8 + [f"{local_server}/status/200"]
+    # The 8 /wait requests all have to be in flight at the same time to get past the barrier.
+    _LocalHandler.barrier = threading.Barrier(8, timeout=5)
+    _LocalHandler.gate.set()
+    with splint.SplintHttpClient(pool_size=len(urls)) as client:
+        results = list(splint.rule_url_200(urls, client=client, max_workers=len(urls)))
+        assert all(r.status for r in results)
+        assert [r.msg for r in results] == [f"URL {splint.SM.code(url)} returned {splint.SM.code(200)}"
+                                            for url in urls]
+
+        # Unordered, the quick URL comes back while the others are still waiting at the gate.
+        _LocalHandler.barrier = None
+        _LocalHandler.gate.clear()
+        completed = splint.rule_url_200(urls, client=client, max_workers=len(urls), ordered=False)
+        assert "status" in next(completed).msg
+        _LocalHandler.gate.set()
+        assert all(r.status for r in completed)
+
+
+def test_batched_web_apis(local_server):
+    checks = [
+        (f"{local_server}/json", _SAMPLE_JSON),
+        (f"{local_server}/json?copy=2", {"slideshow": {"author": "Chuck"}}),
+        (f"{local_server}/status/500", {}),
+        ("http://127.0.0.1:1/json", {}),
+    ]
+    results = list(splint.rule_web_apis(checks, timeout_sec=2, max_workers=4))
+    assert [r.status for r in results] == [True, False, False, False]
+    assert results[3].except_ is not None
+
+    results = list(splint.rule_web_apis(dict(checks[:2])))
+    assert [r.status for r in results] == [True, False]
+
+    for result in splint.rule_web_api(f"{local_server}/json", json_d=_SAMPLE_JSON):
+        assert result.status
+
+
+def test_http2_client(local_server):
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    with splint.SplintHttpClient(http2=True) as client:
+        results = list(splint.rule_url_200([f"{local_server}/status/200", "http://127.0.0.1:1/"], client=client))
+    assert [r.status for r in results] == [True, False]
+
+
+def test_bad_http_settings():
+    with pytest.raises(splint.SplintException):
+        splint.SplintHttpClient(pool_size=0)
+    with pytest.raises(splint.SplintException):
+        list(splint.rule_url_200(["http://127.0.0.1:1/"] * 2, max_workers=0))
+    with splint.SplintHttpClient(pool_size=2) as client:
+        with pytest.raises(splint.SplintException):
+            list(splint.rule_url_200(["http://127.0.0.1:1/"] * 4, max_workers=4, client=client))
+
+
+def test_default_client_pool_size(local_server):
+    splint.close_default_http_client()
+    small = rule_webapi.default_http_client()
+    assert small.pool_size == rule_webapi.DEFAULT_POOL_SIZE
+
+    workers = rule_webapi.DEFAULT_POOL_SIZE * 2
+    results = list(splint.rule_url_200([f"{local_server}/status/200"] * workers, max_workers=workers))
+    assert all(r.status for r in results)
+    big = rule_webapi.default_http_client()
+    assert big is not small
+    assert big.pool_size == workers
+    assert rule_webapi.default_http_client(2) is big
+
+    splint.close_default_http_client()
+    assert rule_webapi.default_http_client() is not big
+    splint.close_default_http_client()
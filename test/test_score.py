@@ -146,3 +146,45 @@ def test_bad_strategy_class():
 def test_null_results(scoring_function):
     score = scoring_function()
     assert score([]) == 0.0
+
+
+@pytest.mark.parametrize("strategy", [splint.ScoreByResult,
+                                      splint.ScoreByFunctionBinary,
+                                      splint.ScoreByFunctionMean,
+                                      splint.ScoreBinaryFail,
+                                      splint.ScoreBinaryPass])
+@pytest.mark.parametrize("results", ["by_func_weights_with_skip", "half_pass", "all_pass"])
+def test_incremental_score_matches(strategy, results, request):
+    results = request.getfixturevalue(results)
+    scorer = strategy()
+    assert scorer.value() == scorer.score([])
+    for i, result in enumerate(results, start=1):
+        scorer.update(result)
+        assert scorer.value() == pytest.approx(scorer.score(results[:i]))
+
+    scorer.reset()
+    assert scorer.value() == scorer.score([])
+
+
+def test_checker_running_score():
+    def check_results():
+        yield splint.SR(status=True)
+        yield splint.SR(status=False, warn_msg="careful")
+        yield splint.SR(status=True, skipped=True)
+
+    ch = splint.SplintChecker(check_functions=[splint.SplintFunction(check_results)], auto_setup=True)
+    scores = []
+    for _ in ch.yield_all():
+        scores.append(ch.running_score)
+    assert scores == [100.0, 50.0, 50.0]
+    assert ch.counts == {"result": 3, "pass": 1, "fail": 1, "skip": 1, "warn": 1}
+
+    results = ch.run_all()
+    assert ch.score == ch.score_strategy(results) == 50.0
+    assert (ch.pass_count, ch.fail_count, ch.skip_count, ch.warn_count) == (1, 1, 1, 1)
+    assert ch.clean_run and not ch.perfect_run
+
+    # Changing the results falls back to counting them
+    ch.results = results[:1]
+    assert (ch.pass_count, ch.fail_count, ch.skip_count) == (1, 0, 0)
+    assert ch.perfect_run
@@ -0,0 +1,118 @@
+"""
+Tests for the streaming result sinks.
+"""
+import gzip
+import json
+
+import pytest
+
+from src import splint
+
+
+def check_rows():
+    """Yield a result per row"""
+    for i in range(25):
+        yield splint.SR(status=i % 2 == 0, msg=f"Row {i}", owner_list=["ops"] if i == 3 else [])
+
+
+def check_crash():
+    """Yield a few results then blow up the run"""
+    for i in range(5):
+        yield splint.SR(status=True, msg=f"Row {i}")
+    raise KeyboardInterrupt
+
+
+def _checker(func=check_rows):
+    return splint.SplintChecker(check_functions=[splint.SplintFunction(func)], auto_setup=True)
+
+
+def _read_jsonl(lines):
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def test_jsonl_sink(tmp_path):
+    path = tmp_path / "results.jsonl"
+    with splint.make_sink(path) as sink:
+        assert isinstance(sink, splint.SplintJsonlSink)
+        count = sink.write_all(_checker().yield_all())
+
+    rows = _read_jsonl(path.read_text(encoding="utf-8").splitlines())
+    assert count == len(rows) == 25
+    assert rows[0]["msg"] == "Row 0"
+    assert rows[3]["owner_list"] == ["ops"]
+    assert rows[1]["status"] is False
+
+
+def test_gzip_sink_and_tee(tmp_path):
+    path = tmp_path / "results.jsonl.gz"
+    with splint.make_sink(path) as sink:
+        assert isinstance(sink, splint.SplintGzipJsonlSink)
+        results = list(sink.tee(_checker().yield_all()))
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        rows = _read_jsonl(f)
+    assert [row["msg"] for row in rows] == [r.msg for r in results]
+
+
+def test_partial_output_on_crash(tmp_path):
+    path = tmp_path / "crash.jsonl"
+    with pytest.raises(KeyboardInterrupt):
+        with splint.SplintJsonlSink(path, flush_every=1) as sink:
+            sink.write_all(_checker(check_crash).yield_all())
+
+    rows = _read_jsonl(path.read_text(encoding="utf-8").splitlines())
+    assert len(rows) == 5
+
+
+def test_parquet_sink(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "results.parquet"
+    with splint.make_sink(path) as sink:
+        assert isinstance(sink, splint.SplintParquetSink)
+        sink.batch_size = 10
+        sink.write_all(_checker().yield_all())
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_rows == 25
+    # 10 + 10 + 5
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("msg").to_pylist()[:2] == ["Row 0", "Row 1"]
+    assert table.column("owner_list").to_pylist()[3] == ["ops"]
+
+
+def test_parquet_column_types(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    def check_statuses():
+        yield splint.SR(status=True, msg="Pass")
+        yield splint.SR(status=False, msg="Fail")
+        yield splint.SR(status=None, msg="Unknown")
+
+    path = tmp_path / "types.parquet"
+    with splint.SplintParquetSink(path) as sink:
+        sink.write_all(_checker(check_statuses).yield_all())
+
+    table = pq.read_table(path)
+    assert table.schema.field("status").type == pa.bool_()
+    assert table.schema.field("status").nullable
+    assert table.column("status").to_pylist() == [True, False, None]
+    assert table.schema.field("runtime_sec").type == pa.float64()
+    assert table.schema.field("except_").type == pa.string()
+
+
+def test_bad_sink_settings(tmp_path):
+    with pytest.raises(splint.SplintException):
+        splint.SplintJsonlSink(tmp_path / "bad.jsonl", flush_every=0)
+
+
+def test_sink_renders_messages(tmp_path):
+    def check_markup():
+        yield splint.SR(status=True, msg=f"Hello {splint.SM.bold('world')}")
+
+    path = tmp_path / "rendered.jsonl"
+    with splint.make_sink(path, renderer=splint.SplintBasicMarkdown()) as sink:
+        sink.write_all(_checker(check_markup).yield_all())
+    rows = _read_jsonl(path.read_text(encoding="utf-8").splitlines())
+    assert rows[0]["msg_rendered"] == "Hello **world**"
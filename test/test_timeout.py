@@ -0,0 +1,203 @@
+"""
+Tests for per-function and checker wide timeouts.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src import splint
+from src.splint.splint_attribute import _parse_timeout_string
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("30s", 30.0),
+    ("30", 30.0),
+    (30, 30.0),
+    ("2min", 120.0),
+    (".5hr", 1800.0),
+    (0, 0.0),
+])
+def test_parse_timeout(value, expected):
+    assert _parse_timeout_string(str(value)) == pytest.approx(expected)
+
+
+def test_timeout_attribute():
+    @splint.attributes(timeout="2s")
+    def func():
+        return True
+
+    assert splint.SplintFunction(func).timeout == 2.0
+    assert splint.get_attribute(lambda: True, "timeout") == 0
+
+
+def test_generator_timeout():
+    @splint.attributes(timeout=0.2)
+    def func():
+        yield splint.SR(status=True, msg="Fast")
+        time.sleep(2)
+        yield splint.SR(status=True, msg="Never")  # pragma: no cover
+
+    start = time.time()
+    results = list(splint.SplintFunction(func)())
+    assert time.time() - start < 1.0
+
+    assert len(results) == 2
+    assert results[0].status
+    assert not results[0].timed_out
+    assert results[1].status is False
+    assert results[1].timed_out
+    assert results[1].count == 2
+    assert "Timeout" in results[1].msg
+
+
+def test_return_list_timeout():
+    @splint.attributes(timeout="0.2s")
+    def func():
+        time.sleep(2)
+        return [splint.SR(status=True), splint.SR(status=True)]  # pragma: no cover
+
+    results = list(splint.SplintFunction(func)())
+    assert len(results) == 1
+    assert results[0].timed_out
+    assert results[0].func_name == "func"
+
+
+def test_bool_timeout_busy_loop():
+    """A function that never gives control back is still bounded."""
+    stop = threading.Event()
+
+    @splint.attributes(timeout=0.2)
+    def func():
+        while not stop.is_set():
+            pass
+        return True  # pragma: no cover
+
+    try:
+        results = list(splint.SplintFunction(func)())
+    finally:
+        stop.set()
+    assert len(results) == 1
+    assert results[0].timed_out
+    assert results[0].status is False
+
+
+def test_no_timeout_when_fast():
+    @splint.attributes(timeout=5)
+    def func():
+        yield True
+        yield splint.SR(status=False, msg="Fail")
+
+    results = list(splint.SplintFunction(func)())
+    assert [r.status for r in results] == [True, False]
+    assert not any(r.timed_out for r in results)
+
+
+def test_timeout_with_exception():
+    @splint.attributes(timeout=5)
+    def func():
+        raise splint.SplintException("Boom")
+
+    results = list(splint.SplintFunction(func)())
+    assert len(results) == 1
+    assert results[0].except_
+
+
+def test_checker_default_timeout():
+    def slow():
+        time.sleep(2)
+        return True  # pragma: no cover
+
+    @splint.attributes(timeout=5)
+    def has_own_timeout():
+        time.sleep(0.3)
+        return True
+
+    ch = splint.SplintChecker(check_functions=[splint.SplintFunction(slow),
+                                               splint.SplintFunction(has_own_timeout)],
+                              timeout="0.2s", auto_setup=True)
+    start = time.time()
+    results = ch.run_all()
+    assert time.time() - start < 1.5
+    assert len(results) == 2
+    assert results[0].timed_out
+    assert results[1].status
+    assert ch.score == 50.0
+
+
+def test_timeout_is_not_cached():
+    calls = []
+
+    @splint.attributes(timeout=0.2, ttl_minutes="10s")
+    def func():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(1)
+        return True
+
+    sfunc = splint.SplintFunction(func)
+    assert list(sfunc())[0].timed_out
+    assert list(sfunc())[0].status
+
+
+def test_async_timeout():
+    @splint.attributes(timeout=0.2)
+    async def coro():
+        await asyncio.sleep(2)
+        return True  # pragma: no cover
+
+    @splint.attributes(timeout=0.2)
+    async def agen():
+        yield True
+        await asyncio.sleep(2)
+        yield True  # pragma: no cover
+
+    ch = splint.SplintChecker(check_functions=[splint.SplintFunction(coro), splint.SplintFunction(agen)],
+                              auto_setup=True)
+    start = time.time()
+    results = asyncio.run(ch.arun_all())
+    assert time.time() - start < 1.0
+    assert len(results) == 3
+    assert sum(r.timed_out for r in results) == 2
+
+    # Also when called from sync code
+    results = ch.run_all()
+    assert len(results) == 3
+    assert sum(r.timed_out for r in results) == 2
+
+
+def test_orphaned_results_not_cached():
+    finished = threading.Event()
+
+    @splint.attributes(timeout=0.1, ttl_minutes="10s")
+    def func():
+        yield True
+        time.sleep(0.3)
+        finished.set()
+
+    sfunc = splint.SplintFunction(func)
+    assert list(sfunc())[-1].timed_out
+    assert finished.wait(2)
+    time.sleep(0.1)
+    # The abandoned thread finishing doesn't save the partial run for replay.
+    assert len(sfunc._ttl_cache()) == 0
+
+
+def test_closing_early_stops_worker():
+    produced = []
+
+    @splint.attributes(timeout=5)
+    def func():
+        for i in range(100):
+            produced.append(i)
+            time.sleep(0.01)
+            yield True
+
+    results = splint.SplintFunction(func)()
+    next(results)
+    results.close()
+    time.sleep(0.2)
+    count = len(produced)
+    time.sleep(0.2)
+    assert len(produced) == count < 100
@@ -2,6 +2,7 @@ import pathlib
 import time
 
 from src import splint
+from src.splint import splint_function
 
 
 def test_ttl_func(tmp_path):
@@ -112,3 +113,19 @@ def test_ttl_func_boolean_return(tmp_path):
     results = ch.run_all()
     assert len(results) == 1
     assert all(not result.status for i, result in enumerate(results, start=1))
+
+
+def test_cache_key_fingerprinted_once(monkeypatch):
+    calls = []
+    real_fingerprint = splint_function.fingerprint
+    monkeypatch.setattr(splint_function, "fingerprint", lambda args: calls.append(1) or real_fingerprint(args))
+
+    @splint.attributes(ttl_minutes="10s")
+    def func(data):
+        yield splint.SR(status=True, msg=f"{len(data)} rows")
+
+    sfunc = splint.SplintFunction(func, env={"data": list(range(1000))})
+    assert list(sfunc())[0].status
+    assert len(calls) == 1
+    assert list(sfunc())[0].status
+    assert len(calls) == 2
@@ -0,0 +1,114 @@
+"""
+Tests for the vectorized scoring strategies, including a benchmark against the list based ones.
+
+The benchmarks take a while so they only run when SPLINT_BENCHMARK is set, use -s to see the
+timings.
+"""
+import os
+import random
+import time
+
+import pytest
+
+from src import splint
+from src.splint.splint_result_table import SplintResultTable
+from src.splint.splint_vector_score import score_table, score_table_by
+
+STRATEGIES = [splint.ScoreByResult,
+              splint.ScoreByFunctionBinary,
+              splint.ScoreByFunctionMean,
+              splint.ScoreBinaryFail,
+              splint.ScoreBinaryPass]
+
+
+def _results(count: int, seed: int = 1, pass_rate: float = 0.9) -> list[splint.SR]:
+    rnd = random.Random(seed)
+    results = []
+    for i in range(count):
+        func = rnd.randrange(max(count // 10, 1))
+        results.append(splint.SR(status=rnd.random() < pass_rate,
+                                 skipped=rnd.random() < 0.05,
+                                 weight=rnd.choice([50.0, 100.0, 200.0]),
+                                 pkg_name="pkg",
+                                 module_name=f"mod{func % 5}",
+                                 func_name=f"func{func}",
+                                 tag=f"tag{func % 3}",
+                                 msg=f"Result {i}"))
+    return results
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+@pytest.mark.parametrize("pass_rate", [0.0, 0.9, 1.0])
+def test_vector_scores_match(strategy, pass_rate):
+    results = _results(200, pass_rate=pass_rate)
+    table = SplintResultTable(results)
+
+    assert score_table(table, strategy()) == pytest.approx(strategy().score(results))
+    assert score_table(table, strategy.strategy_name) == pytest.approx(strategy().score(results))
+
+    by_tag = score_table_by(table, "tag", strategy)
+    assert list(by_tag) == table.categories("tag")
+    for tag, score in by_tag.items():
+        assert score == pytest.approx(strategy().score([r for r in results if r.tag == tag]))
+
+
+def test_sparse_function_binary(monkeypatch):
+    """Many groups x functions use sorting rather than a dense grid."""
+    monkeypatch.setattr("src.splint.splint_vector_score.MAX_DENSE_CELLS", 0)
+    results = _results(300)
+    table = SplintResultTable(results)
+    for module, score in score_table_by(table, "module_name", "by_function_binary").items():
+        expected = splint.ScoreByFunctionBinary().score([r for r in results if r.module_name == module])
+        assert score == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_vector_score_edge_cases(strategy):
+    assert score_table(SplintResultTable(), strategy) == strategy().score([])
+
+    skipped = [splint.SR(status=True, skipped=True, func_name="f")]
+    assert score_table(SplintResultTable(skipped), strategy) == strategy().score(skipped)
+
+
+def test_unknown_vector_strategy():
+    class ScoreCustom(splint.ScoreStrategy):
+        strategy_name = "custom"
+
+        def score(self, results):
+            return 42.0
+
+    with pytest.raises(splint.SplintException):
+        score_table(SplintResultTable(_results(10)), ScoreCustom())
+
+
+@pytest.mark.parametrize("count", [1, 10_000])
+def test_large_table_scores(count):
+    """Vector scores match the list strategies on tables written over several batches."""
+    results = _results(count)
+    table = SplintResultTable(results)
+    table.flush()
+    assert len(table) == count
+
+    for strategy in STRATEGIES:
+        assert score_table(table, strategy) == pytest.approx(strategy().score(results))
+
+
+@pytest.mark.skipif(not os.environ.get("SPLINT_BENCHMARK"), reason="Set SPLINT_BENCHMARK to run benchmarks")
+@pytest.mark.parametrize("count", [10_000, 100_000, 1_000_000])
+def test_benchmark_vector_scores(count):
+    """Report list vs vector scoring times, the timings are only printed, never asserted."""
+    results = _results(count)
+    table = SplintResultTable(results)
+    table.flush()
+
+    for strategy in STRATEGIES:
+        start = time.perf_counter()
+        expected = strategy().score(results)
+        list_sec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        score = score_table(table, strategy)
+        vector_sec = time.perf_counter() - start
+
+        print(f"{count:>9} {strategy.strategy_name:<20} list={list_sec:.4f}s vector={vector_sec:.4f}s")
+        assert score == pytest.approx(expected)